@@ -0,0 +1,244 @@
+"""
+Benchmark runner for the schemes listed in benchmarks/config.py.
+
+Times key generation and every configured homomorphic operation, and optionally
+reports the memory used by key material and by the ciphertext working set next
+to the latency figures.
+
+Usage:
+    python -m benchmarks.benchmark_runner --schemes paillier elgamal --repeats 20 --memory
+    python -m benchmarks.benchmark_runner --schemes paillier bfv ckks --require multiplicative
+"""
+import argparse
+import csv
+import importlib
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from benchmarks.config import DEFAULT_REPEATS, RESULTS_DIR, SCHEMES
+from benchmarks.utils.memory import CIPHERTEXT, KEY_MATERIAL, MemoryProfiler
+from benchmarks.utils.timer import Timer, time_function
+from he_toolkit.schemes.registry import Capabilities, capabilities, get_scheme_class
+
+
+def load_class(path: str) -> type:
+    """
+    Imports a class from a "package.module:ClassName" string.
+    """
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def scheme_class(config: Dict[str, Any]) -> type:
+    """
+    Returns the class of a config entry: the registered "scheme", or an explicit
+    "module:Class" under "class". Only that scheme's backend is imported.
+    """
+    if "class" in config:
+        return load_class(config["class"])
+    return get_scheme_class(config["scheme"])
+
+
+def create_scheme(config: Dict[str, Any], **kwargs: Any) -> Any:
+    """
+    Instantiates the scheme described by a config entry, passing its "params"
+    (and any extra keyword arguments) to the constructor.
+    """
+    return scheme_class(config)(**config.get("params", {}), **kwargs)
+
+
+def select_schemes(names: List[str], required: List[str]) -> List[str]:
+    """
+    Keeps the config entries whose registered scheme has all `required` capabilities.
+    """
+    for flag in required:
+        if flag not in Capabilities._fields:
+            raise ValueError(f"Unknown capability '{flag}'")
+    return [name for name in names
+            if "scheme" in SCHEMES[name] and all(getattr(capabilities(SCHEMES[name]["scheme"]), flag)
+                                                 for flag in required)]
+
+
+def _operation(scheme: Any, name: str, config: Dict[str, Any], keys: tuple, ciphertexts: tuple) -> Callable[[], Any]:
+    public_key, private_key = keys
+    ct1, ct2 = ciphertexts
+    if name == "encrypt":
+        return lambda: scheme.encrypt(config["plaintext"], public_key)
+    if name == "decrypt":
+        return lambda: scheme.decrypt(ct1, private_key)
+    if name == "add":
+        return lambda: scheme.add(ct1, ct2)
+    if name == "multiply":
+        return lambda: scheme.multiply(ct1, ct2)
+    if name == "multiply_scalar":
+        return lambda: scheme.multiply_scalar(ct1, config["scalar"])
+    if name == "multiply_batch":
+        batch = config["batch_size"]
+        return lambda: scheme.multiply_batch([ct1] * batch, [ct2] * batch)
+    if name == "decrypt_batch":
+        batch = config["batch_size"]
+        return lambda: scheme.decrypt_batch([ct1] * batch, private_key)
+    raise ValueError(f"Unknown operation '{name}'")
+
+
+class BenchmarkRunner:
+    """
+    Runs the latency (and optionally memory) benchmark for a set of schemes.
+
+    Memory is measured in a separate pass on a fresh scheme instance so that the
+    tracemalloc overhead does not distort the latency numbers.
+    """
+
+    def __init__(self, repeats: int = DEFAULT_REPEATS, profile_memory: bool = False, top_n: int = 0):
+        """
+        Args:
+            repeats (int): Number of timed calls per operation.
+            profile_memory (bool): Whether to run the memory pass.
+            top_n (int): Number of tracemalloc allocation sites kept per operation.
+        """
+        self.repeats = repeats
+        self.profile_memory = profile_memory
+        self.top_n = top_n
+
+    def _encrypt_inputs(self, scheme: Any, config: Dict[str, Any], public_key: Any) -> tuple:
+        return (scheme.encrypt(config["plaintext"], public_key),
+                scheme.encrypt(config["plaintext"], public_key))
+
+    def time_scheme(self, name: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Times key generation and each configured operation.
+
+        Returns:
+            List[Dict[str, Any]]: One row per operation.
+        """
+        scheme = create_scheme(config)
+        with Timer() as keygen_timer:
+            keys = scheme.generate_keys(**config["keygen"])
+
+        rows = [{"scheme": name, "operation": "generate_keys", "repeats": 1,
+                 "mean_ms": keygen_timer.elapsed * 1e3, "std_ms": 0.0, "min_ms": keygen_timer.elapsed * 1e3}]
+
+        ciphertexts = self._encrypt_inputs(scheme, config, keys[0])
+        for op_name in config["operations"]:
+            durations, _ = time_function(_operation(scheme, op_name, config, keys, ciphertexts), self.repeats)
+            durations_ms = np.array(durations) * 1e3
+            rows.append({"scheme": name, "operation": op_name, "repeats": self.repeats,
+                         "mean_ms": float(durations_ms.mean()), "std_ms": float(durations_ms.std()),
+                         "min_ms": float(durations_ms.min())})
+        return rows
+
+    def profile_scheme(self, name: str, config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Measures memory for key generation and each configured operation.
+
+        Key generation is attributed to key material. For each operation all
+        `repeats` results are kept alive until the block exits, so the retained
+        memory is the working set of that many ciphertexts (or plaintexts for decrypt).
+
+        Returns:
+            Dict[str, Dict[str, Any]]: operation -> memory columns.
+        """
+        profiler = MemoryProfiler(top_n=self.top_n)
+        scheme = create_scheme(config)
+        with profiler.track("generate_keys", KEY_MATERIAL):
+            keys = scheme.generate_keys(**config["keygen"])
+
+        ciphertexts = self._encrypt_inputs(scheme, config, keys[0])
+        for op_name in config["operations"]:
+            operation = _operation(scheme, op_name, config, keys, ciphertexts)
+            with profiler.track(op_name, CIPHERTEXT):
+                working_set = [operation() for _ in range(self.repeats)]
+            del working_set
+
+        columns = {}
+        for record in profiler.records:
+            columns[record.label] = {
+                "memory_category": record.category,
+                "peak_rss_kb": record.peak_rss_kb,
+                "retained_rss_kb": record.retained_rss_kb,
+                "transient_rss_kb": record.transient_rss_kb,
+                "traced_retained_kb": round(record.traced_retained_kb, 1),
+                "traced_peak_kb": round(record.traced_peak_kb, 1),
+            }
+            for allocation in record.top_allocations:
+                print(f"  [{name}:{record.label}] {allocation}")
+        return columns
+
+    def run(self, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Runs the benchmark for the given scheme names.
+
+        Returns:
+            List[Dict[str, Any]]: Result rows for all schemes.
+        """
+        results = []
+        for name in names:
+            config = SCHEMES[name]
+            print(f"Benchmarking {name} (Repeats: {self.repeats})...")
+            rows = self.time_scheme(name, config)
+            if self.profile_memory:
+                memory = self.profile_scheme(name, config)
+                for row in rows:
+                    row.update(memory.get(row["operation"], {}))
+            results.extend(rows)
+        return results
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    header = f"{'scheme':<15}{'operation':<18}{'mean_ms':>12}{'std_ms':>10}"
+    with_memory = any("transient_rss_kb" in row for row in results)
+    if with_memory:
+        # peak_rss_kb is process-wide unless the kernel peak could be reset, so print
+        # the per-operation deltas (the CSV keeps every column).
+        header += f"{'transient_kb':>14}{'retained_kb':>14}{'traced_kb':>12}"
+    print(header)
+    for row in results:
+        line = f"{row['scheme']:<15}{row['operation']:<18}{row['mean_ms']:>12.3f}{row['std_ms']:>10.3f}"
+        if with_memory:
+            line += (f"{row.get('transient_rss_kb', ''):>14}{row.get('retained_rss_kb', ''):>14}"
+                     f"{row.get('traced_retained_kb', ''):>12}")
+        print(line)
+
+
+def write_csv(results: List[Dict[str, Any]], path: str) -> None:
+    """
+    Writes result rows to a CSV file, creating the parent directory if needed.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fieldnames: List[str] = []
+    for row in results:
+        fieldnames.extend(key for key in row if key not in fieldnames)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark homomorphic encryption schemes.")
+    parser.add_argument("--schemes", nargs="+", default=["paillier", "elgamal"], choices=sorted(SCHEMES))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--memory", action="store_true", help="Also report peak RSS and tracemalloc figures.")
+    parser.add_argument("--top-allocations", type=int, default=0,
+                        help="Print the N largest tracemalloc allocation sites per operation.")
+    parser.add_argument("--require", nargs="+", default=[], choices=Capabilities._fields,
+                        help="Only run the selected schemes that have all these capabilities.")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "benchmark_results.csv"))
+    args = parser.parse_args(argv)
+
+    names = select_schemes(args.schemes, args.require) if args.require else args.schemes
+    runner = BenchmarkRunner(repeats=args.repeats, profile_memory=args.memory, top_n=args.top_allocations)
+    results = runner.run(names)
+    print_results(results)
+    write_csv(results, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import os
+
+# Number of timed calls per operation.
+DEFAULT_REPEATS = 10
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "results")
+
+# Benchmark grid. Each entry names the scheme in he_toolkit.schemes.registry (or a
+# "class": "module:Class" that is not registered), optional constructor "params",
+# the keyword arguments for generate_keys, sample inputs and the operations to
+# time. Batched operations ("*_batch") time one call on "batch_size" ciphertexts.
+SCHEMES = {
+    "paillier": {
+        "scheme": "paillier",
+        "keygen": {"key_size": 2048},
+        "plaintext": 3.5,
+        "scalar": 2.0,
+        "operations": ["encrypt", "decrypt", "add", "multiply_scalar"],
+        "controller": {"packed": False, "scale": 1.0},
+    },
+    "elgamal": {
+        "scheme": "elgamal",
+        "keygen": {"key_size": 2048},
+        "plaintext": 7,
+        "scalar": 2,
+        "operations": ["encrypt", "decrypt", "multiply"],
+    },
+    "rsa": {
+        "scheme": "rsa",
+        "keygen": {"key_size": 2048},
+        "plaintext": 7,
+        "scalar": 2,
+        "batch_size": 64,
+        "operations": ["encrypt", "decrypt", "multiply", "multiply_scalar", "multiply_batch", "decrypt_batch"],
+    },
+    "exp_elgamal": {
+        "scheme": "exp_elgamal",
+        "params": {"max_message": 2 ** 20},
+        "keygen": {"key_size": 2048},
+        "plaintext": 7,
+        "scalar": 3,
+        "operations": ["encrypt", "decrypt", "add", "multiply_scalar"],
+        "controller": {"packed": False, "scale": 100.0},
+    },
+    "ec_elgamal": {
+        "scheme": "ec_elgamal",
+        "params": {"max_message": 2 ** 20},
+        "keygen": {"key_size": 256},
+        "plaintext": 7,
+        "scalar": 3,
+        "operations": ["encrypt", "decrypt", "add", "multiply_scalar"],
+        "controller": {"packed": False, "scale": 100.0},
+    },
+    "damgard_jurik": {
+        "scheme": "damgard_jurik",
+        "params": {"s": 2},
+        "keygen": {"key_size": 2048},
+        "plaintext": 7,
+        "scalar": 3,
+        "operations": ["encrypt", "decrypt", "add", "multiply_scalar"],
+        "controller": {"packed": False, "scale": 100.0},
+    },
+    "bfv": {
+        "scheme": "bfv",
+        "keygen": {"plain_modulus": 65537, "mult_depth": 2, "scale_mod_size": 50, "batch_size": 8},
+        "plaintext": [1, 2, 3, 4, 5, 6, 7, 8],
+        "scalar": 2,
+        "operations": ["encrypt", "decrypt", "add", "multiply", "multiply_scalar"],
+        "controller": {"packed": True, "scale": 10.0},
+    },
+    "bgv": {
+        "scheme": "bgv",
+        "keygen": {"plain_modulus": 65537, "mult_depth": 2, "scale_mod_size": 50, "batch_size": 8},
+        "plaintext": [1, 2, 3, 4, 5, 6, 7, 8],
+        "scalar": 2,
+        "operations": ["encrypt", "decrypt", "add", "multiply", "multiply_scalar"],
+        "controller": {"packed": True, "scale": 10.0},
+    },
+    "ckks": {
+        "scheme": "ckks",
+        "keygen": {"mult_depth": 3, "scale_mod_size": 50, "batch_size": 8},
+        "plaintext": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0],
+        "scalar": 0.5,
+        "operations": ["encrypt", "decrypt", "add", "multiply", "multiply_scalar"],
+        "controller": {"packed": True, "scale": 1.0},
+    },
+}
+
+# Closed-loop benchmark plant: discretized double integrator (Ts = 0.1 s) with a
+# stabilizing state-feedback gain. Schemes with a "controller" entry above can
+# run it.
+PLANT = {
+    "A": [[1.0, 0.1], [0.0, 1.0]],
+    "B": [[0.005], [0.1]],
+    "K": [[-1.0, -1.5]],
+    "x0": [1.0, 0.0],
+    # Output y = C x and observer gain for the dynamic (output-feedback) controller.
+    "C": [[1.0, 0.0]],
+    "L": [[0.5], [1.0]],
+}
+
+# Input-constrained MPC on PLANT solved with projected-gradient iterations
+# (benchmarks/scenarios/mpc.py). The control period is PLANT's sampling time.
+MPC = {
+    "Q": [[1.0, 0.0], [0.0, 1.0]],
+    "R": [[0.1]],
+    "u_min": -1.0,
+    "u_max": 1.0,
+    "horizon": 10,
+    "iterations": 10,
+    "period_ms": 100.0,
+}
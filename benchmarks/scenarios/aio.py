@@ -0,0 +1,101 @@
+"""
+Event-loop responsiveness and throughput of the asyncio scheme facade.
+
+Encrypts --count values from inside an asyncio service while a heartbeat task
+ticks every millisecond, and compares:
+
+- blocking:  calling the scheme directly from a coroutine;
+- thread:    AsyncScheme on a thread pool;
+- process:   AsyncScheme on a process pool (the default for gmpy2/phe schemes).
+
+Reports the throughput and the worst heartbeat lag, i.e. how long the event loop
+was stalled.
+
+Usage:
+    python -m benchmarks.scenarios.aio --schemes paillier elgamal --count 500 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import create_scheme, write_csv
+from benchmarks.config import RESULTS_DIR, SCHEMES
+from he_toolkit.aio import AsyncScheme
+
+HEARTBEAT = 0.001
+
+
+async def heartbeat(stop: asyncio.Event, lags: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(time.perf_counter() - start - HEARTBEAT)
+
+
+async def encrypt_all(scheme: Any, facade: Optional[AsyncScheme], public_key: Any, values: list) -> None:
+    if facade is None:
+        for value in values:
+            scheme.encrypt(value, public_key)
+        return
+    await asyncio.gather(*(facade.encrypt(value, public_key) for value in values))
+
+
+async def measure(mode: str, scheme: Any, public_key: Any, values: list, workers: int,
+                  max_batch: int) -> Dict[str, float]:
+    facade = None if mode == "blocking" else AsyncScheme(scheme, kind=mode, workers=workers, max_batch=max_batch)
+    try:
+        if facade is not None:
+            # Warm up the pool so worker start-up is not counted.
+            await facade.encrypt(values[0], public_key)
+        stop, lags = asyncio.Event(), []
+        beat = asyncio.ensure_future(heartbeat(stop, lags))
+        await asyncio.sleep(0)
+        # Only the encryptions are timed: pool start-up and shutdown are excluded.
+        start = time.perf_counter()
+        await encrypt_all(scheme, facade, public_key, values)
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await beat
+    finally:
+        if facade is not None:
+            await facade.aclose()
+    return {"ops_per_s": len(values) / elapsed, "max_lag_ms": max(lags, default=0.0) * 1e3}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Asyncio facade benchmark.")
+    parser.add_argument("--schemes", nargs="+", default=["paillier", "elgamal"], choices=list(SCHEMES))
+    parser.add_argument("--modes", nargs="+", default=["blocking", "thread", "process"],
+                        choices=["blocking", "thread", "process"])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "aio.csv"))
+    args = parser.parse_args(argv)
+
+    rows = []
+    for name in args.schemes:
+        config = SCHEMES[name]
+        scheme = create_scheme(config)
+        public_key, _ = scheme.generate_keys(**config["keygen"])
+        values = [config["plaintext"]] * args.count
+        for mode in args.modes:
+            print(f"Benchmarking {name} encryption via asyncio ({mode}, Workers: {args.workers})...")
+            result = asyncio.run(measure(mode, scheme, public_key, values, args.workers, args.max_batch))
+            rows.append({"scheme": name, "mode": mode, "workers": args.workers, "count": args.count, **result})
+
+    print(f"{'scheme':<12}{'mode':<10}{'ops/s':>10}{'max_lag_ms':>12}")
+    for row in rows:
+        print(f"{row['scheme']:<12}{row['mode']:<10}{row['ops_per_s']:>10.1f}{row['max_lag_ms']:>12.2f}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Ciphertext expansion versus latency for Damgard-Jurik.
+
+For each degree s, encrypts and decrypts random full-size plaintexts and reports the
+expansion ratio (ciphertext bits / plaintext bits) next to the encryption and
+decryption latency, both per ciphertext and per kilobit of plaintext carried.
+python-paillier is included as the s=1 reference.
+
+Usage:
+    python -m benchmarks.scenarios.ciphertext_expansion --s 1 2 3 4 --key-size 2048
+"""
+import argparse
+import os
+import random
+import sys
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import write_csv
+from benchmarks.config import DEFAULT_REPEATS, RESULTS_DIR
+from benchmarks.utils.timer import time_function
+from he_toolkit.schemes.partial.damgard_jurik import DamgardJurikScheme
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+
+
+def _row(name: str, s: int, plaintext_bits: int, ciphertext_bits: int,
+         enc_durations: List[float], dec_durations: List[float]) -> Dict[str, Any]:
+    enc_ms = float(np.mean(enc_durations)) * 1e3
+    dec_ms = float(np.mean(dec_durations)) * 1e3
+    kbits = plaintext_bits / 1024
+    return {
+        "scheme": name,
+        "s": s,
+        "plaintext_bits": plaintext_bits,
+        "ciphertext_bits": ciphertext_bits,
+        "expansion": ciphertext_bits / plaintext_bits,
+        "encrypt_ms": enc_ms,
+        "decrypt_ms": dec_ms,
+        "encrypt_ms_per_kbit": enc_ms / kbits,
+        "decrypt_ms_per_kbit": dec_ms / kbits,
+    }
+
+
+def benchmark_damgard_jurik(s: int, key_size: int, repeats: int) -> Dict[str, Any]:
+    print(f"Benchmarking Damgard-Jurik (s: {s}, Key Size: {key_size}, Iterations: {repeats})...")
+    scheme = DamgardJurikScheme(s=s)
+    public_key, private_key = scheme.generate_keys(key_size)
+    n, _ = public_key
+    plaintext_bits = (n ** s).bit_length()
+    # Integers that use (almost) the whole plaintext space.
+    plaintexts = iter([random.getrandbits(plaintext_bits - 2) for _ in range(repeats)])
+    enc_durations, ciphertexts = time_function(lambda: scheme.encrypt(next(plaintexts), public_key), repeats)
+    remaining = iter(ciphertexts)
+    dec_durations, _ = time_function(lambda: scheme.decrypt_int(next(remaining), private_key), repeats)
+    ciphertext_bits = ciphertexts[0]['modulus'].bit_length()
+    return _row("damgard_jurik", s, plaintext_bits, ciphertext_bits, enc_durations, dec_durations)
+
+
+def benchmark_paillier(key_size: int, repeats: int) -> Dict[str, Any]:
+    print(f"Benchmarking Paillier (Key Size: {key_size}, Iterations: {repeats})...")
+    scheme = PaillierScheme()
+    public_key, private_key = scheme.generate_keys(key_size)
+    enc_durations, ciphertexts = time_function(lambda: scheme.encrypt(12345, public_key), repeats)
+    remaining = iter(ciphertexts)
+    dec_durations, _ = time_function(lambda: scheme.decrypt(next(remaining), private_key), repeats)
+    return _row("paillier", 1, public_key.n.bit_length(), public_key.nsquare.bit_length(),
+                enc_durations, dec_durations)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Damgard-Jurik expansion/latency trade-off.")
+    parser.add_argument("--s", nargs="+", type=int, default=[1, 2, 3, 4])
+    parser.add_argument("--key-size", type=int, default=2048)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "ciphertext_expansion.csv"))
+    args = parser.parse_args(argv)
+
+    rows = [benchmark_paillier(args.key_size, args.repeats)]
+    rows.extend(benchmark_damgard_jurik(s, args.key_size, args.repeats) for s in args.s)
+
+    print(f"{'scheme':<15}{'s':>3}{'expansion':>11}{'enc_ms':>10}{'dec_ms':>10}{'enc_ms/kbit':>13}{'dec_ms/kbit':>13}")
+    for row in rows:
+        print(f"{row['scheme']:<15}{row['s']:>3}{row['expansion']:>11.3f}{row['encrypt_ms']:>10.2f}"
+              f"{row['decrypt_ms']:>10.2f}{row['encrypt_ms_per_kbit']:>13.2f}{row['decrypt_ms_per_kbit']:>13.2f}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+CKKS bootstrapping versus client-side re-encryption for a recursive controller.
+
+Runs an observer-based output-feedback controller (benchmarks/config.py:PLANT) whose
+state stays encrypted on the server. Each step multiplies the state by plaintext
+gains and uses up one CKKS level, so the state has to be refreshed regularly:
+
+- bootstrap:  the server refreshes the state itself (CKKSScheme with bootstrap=True
+              refreshes automatically when too few levels are left);
+- reencrypt:  the client decrypts and re-encrypts the state once its levels run out,
+              paying a network round trip (--rtt-ms) each time.
+
+Reports per-step latency (mean, p95, max), the number of refreshes and the largest
+deviation of the control input from the plaintext controller.
+
+Usage:
+    python -m benchmarks.scenarios.ckks_bootstrap --steps 50 --mult-depth 4 --rtt-ms 0 5 20
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import write_csv
+from benchmarks.config import PLANT, RESULTS_DIR
+from benchmarks.utils.timer import Timer
+from he_toolkit.schemes.openfhe_wrappers.ckks_wrapper import CKKSScheme
+from he_toolkit.simulators.dynamic_system import DynamicSystem
+from he_toolkit.simulators.encrypted_controller import EncryptedDynamicController
+
+
+def controller_matrices() -> tuple:
+    A, B, C = (np.asarray(PLANT[key]) for key in ("A", "B", "C"))
+    K, L = np.asarray(PLANT["K"]), np.asarray(PLANT["L"])
+    return A + B @ K - L @ C, L, K, np.zeros((K.shape[0], C.shape[0]))
+
+
+def run_controller(mode: str, scheme: CKKSScheme, keys: tuple, steps: int, rtt_ms: float) -> Dict[str, Any]:
+    public_key, private_key = keys
+    F, G, H, J = controller_matrices()
+    controller = EncryptedDynamicController(scheme, F, G, H, J, public_key, private_key, packed=True)
+    plant = DynamicSystem(PLANT["A"], PLANT["B"], PLANT["C"], x0=PLANT["x0"])
+    xc = np.zeros(len(F))
+    scheme.bootstrap_count = 0
+
+    durations, errors = [], []
+    refreshes = 0
+    for _ in range(steps):
+        y = plant.output()
+        with Timer() as timer:
+            u = controller.step(y)
+            if mode == "reencrypt" and scheme.levels_remaining(controller.state[0]) < 1:
+                time.sleep(rtt_ms / 1e3)
+                controller.reencrypt_state()
+                refreshes += 1
+        durations.append(timer.elapsed)
+        errors.append(float(np.max(np.abs(u - H @ xc))))
+        xc = F @ xc + G @ y
+        plant.step(u)
+
+    durations_ms = np.array(durations) * 1e3
+    return {
+        "mode": mode,
+        "rtt_ms": rtt_ms if mode == "reencrypt" else 0.0,
+        "steps": steps,
+        "refreshes": refreshes if mode == "reencrypt" else scheme.bootstrap_count,
+        "step_mean_ms": float(durations_ms.mean()),
+        "step_p95_ms": float(np.percentile(durations_ms, 95)),
+        "step_max_ms": float(durations_ms.max()),
+        "max_input_error": max(errors),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="CKKS bootstrapping vs client re-encryption.")
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--mult-depth", type=int, default=4, help="Levels available between refreshes.")
+    parser.add_argument("--level-budget", nargs=2, type=int, default=[3, 3])
+    parser.add_argument("--scale-mod-size", type=int, default=59)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--rtt-ms", nargs="+", type=float, default=[0.0, 5.0, 20.0],
+                        help="Simulated client round trip per re-encryption.")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "ckks_bootstrap.csv"))
+    args = parser.parse_args(argv)
+
+    rows = []
+    print(f"Benchmarking CKKS bootstrapping (Depth: {args.mult_depth}, Level budget: {args.level_budget})...")
+    scheme = CKKSScheme()
+    keys = scheme.generate_keys(mult_depth=args.mult_depth, scale_mod_size=args.scale_mod_size,
+                                batch_size=args.batch_size, bootstrap=True, level_budget=args.level_budget)
+    rows.append(run_controller("bootstrap", scheme, keys, args.steps, 0.0))
+
+    print(f"Benchmarking CKKS client re-encryption (Depth: {args.mult_depth})...")
+    scheme = CKKSScheme()
+    keys = scheme.generate_keys(mult_depth=args.mult_depth, scale_mod_size=args.scale_mod_size,
+                                batch_size=args.batch_size)
+    rows.extend(run_controller("reencrypt", scheme, keys, args.steps, rtt) for rtt in args.rtt_ms)
+
+    print(f"{'mode':<11}{'rtt_ms':>8}{'refreshes':>11}{'mean_ms':>10}{'p95_ms':>10}{'max_ms':>10}{'max_err':>11}")
+    for row in rows:
+        print(f"{row['mode']:<11}{row['rtt_ms']:>8.1f}{row['refreshes']:>11}{row['step_mean_ms']:>10.2f}"
+              f"{row['step_p95_ms']:>10.2f}{row['step_max_ms']:>10.2f}{row['max_input_error']:>11.2e}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Exponential ElGamal decryption latency versus baby-step table size.
+
+For a fixed message range, sweeps the number of baby steps and reports the time to
+build and save the table, its size on disk, the time for a fresh instance to
+memory-map it, and the decryption latency (mean over random messages and the
+worst case, which needs the most giant steps).
+
+Usage:
+    python -m benchmarks.scenarios.dlog_table --max-message 1048576 --table-sizes 256 1024 4096 16384
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import write_csv
+from benchmarks.config import DEFAULT_REPEATS, RESULTS_DIR
+from benchmarks.utils.timer import Timer, time_function
+from he_toolkit.schemes.partial.exp_elgamal import ExponentialElGamalScheme
+
+
+def benchmark_table_size(keys: tuple, max_message: int, table_size: int, table_dir: str,
+                         repeats: int) -> Dict[str, Any]:
+    print(f"Benchmarking Exponential ElGamal (Max message: {max_message}, Table size: {table_size})...")
+    public_key, private_key = keys
+    p, _, g = private_key
+
+    writer = ExponentialElGamalScheme(max_message, table_size, table_dir)
+    with Timer() as build_timer:
+        writer.load_table(p, g)
+
+    reader = ExponentialElGamalScheme(max_message, table_size, table_dir)
+    with Timer() as load_timer:
+        reader.load_table(p, g)
+
+    messages = iter([random.randint(-max_message, max_message) for _ in range(repeats)])
+    ciphertexts = iter([reader.encrypt(next(messages), public_key) for _ in range(repeats)])
+    durations, _ = time_function(lambda: reader.decrypt(next(ciphertexts), private_key), repeats)
+
+    worst = reader.encrypt(max_message, public_key)
+    with Timer() as worst_timer:
+        reader.decrypt(worst, private_key)
+
+    return {
+        "max_message": max_message,
+        "table_size": table_size,
+        "giant_steps": 2 * max_message // table_size + 1,
+        "table_kb": os.path.getsize(writer.table_path(p, g)) / 1024,
+        "build_ms": build_timer.elapsed * 1e3,
+        "load_ms": load_timer.elapsed * 1e3,
+        "decrypt_mean_ms": float(np.mean(durations)) * 1e3,
+        "decrypt_worst_ms": worst_timer.elapsed * 1e3,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Exponential ElGamal BSGS table size sweep.")
+    parser.add_argument("--max-message", type=int, default=2 ** 20)
+    parser.add_argument("--table-sizes", nargs="+", type=int, default=[2 ** k for k in range(8, 17, 2)])
+    parser.add_argument("--key-size", type=int, default=2048)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--table-dir", default=None, help="Where to keep the tables (default: a temporary directory).")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "dlog_table.csv"))
+    args = parser.parse_args(argv)
+
+    keys = ExponentialElGamalScheme().generate_keys(args.key_size)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        table_dir = args.table_dir or tmp_dir
+        rows = [benchmark_table_size(keys, args.max_message, size, table_dir, args.repeats)
+                for size in args.table_sizes]
+
+    print(f"{'table_size':>11}{'giant_steps':>13}{'table_kb':>10}{'build_ms':>10}{'load_ms':>9}"
+          f"{'dec_mean_ms':>13}{'dec_worst_ms':>14}")
+    for row in rows:
+        print(f"{row['table_size']:>11}{row['giant_steps']:>13}{row['table_kb']:>10.1f}{row['build_ms']:>10.1f}"
+              f"{row['load_ms']:>9.2f}{row['decrypt_mean_ms']:>13.2f}{row['decrypt_worst_ms']:>14.2f}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+EC-ElGamal versus finite-field ElGamal and Paillier at matched security.
+
+P-256 offers roughly the security of a 3072-bit modulus, so by default the
+finite-field schemes use 3072-bit keys. For every scheme the benchmark reports
+key generation, encryption, decryption and homomorphic-operation latency, plus the
+serialized ciphertext size. The homomorphic operation is the one each scheme
+supports: ciphertext multiplication for ElGamal and addition for the others.
+
+Usage:
+    python -m benchmarks.scenarios.ec_elgamal --key-size 3072 --repeats 20
+"""
+import argparse
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import write_csv
+from benchmarks.config import DEFAULT_REPEATS, RESULTS_DIR
+from benchmarks.utils.timer import Timer, time_function
+from he_toolkit.schemes.partial.ec_elgamal import ECElGamalScheme
+from he_toolkit.schemes.partial.elgamal import ElGamalScheme
+from he_toolkit.schemes.partial.exp_elgamal import ExponentialElGamalScheme
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+
+
+def _bytes(bits: int) -> int:
+    return (bits + 7) // 8
+
+
+def benchmark_scheme(name: str, scheme: Any, key_size: int, homomorphic_op: str,
+                     ciphertext_size: Callable[[Any, Any], int], repeats: int) -> Dict[str, Any]:
+    print(f"Benchmarking {name} (Key Size: {key_size}, Iterations: {repeats})...")
+    with Timer() as keygen_timer:
+        public_key, private_key = scheme.generate_keys(key_size)
+    # Warm-up: builds the per-key fixed-base and baby-step tables outside the timed loops.
+    scheme.decrypt(scheme.encrypt(7, public_key), private_key)
+
+    enc_durations, ciphertexts = time_function(lambda: scheme.encrypt(7, public_key), repeats)
+    remaining = iter(ciphertexts)
+    dec_durations, _ = time_function(lambda: scheme.decrypt(next(remaining), private_key), repeats)
+    operation = getattr(scheme, homomorphic_op)
+    op_durations, _ = time_function(lambda: operation(ciphertexts[0], ciphertexts[1 % repeats]), repeats)
+
+    return {
+        "scheme": name,
+        "key_size": key_size,
+        "ciphertext_bytes": ciphertext_size(ciphertexts[0], public_key),
+        "keygen_ms": keygen_timer.elapsed * 1e3,
+        "encrypt_ms": float(np.mean(enc_durations)) * 1e3,
+        "decrypt_ms": float(np.mean(dec_durations)) * 1e3,
+        "homomorphic_op": homomorphic_op,
+        "homomorphic_op_ms": float(np.mean(op_durations)) * 1e3,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="EC-ElGamal against ElGamal and Paillier.")
+    parser.add_argument("--key-size", type=int, default=3072, help="Modulus size of the finite-field schemes.")
+    parser.add_argument("--max-message", type=int, default=2 ** 20)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "ec_elgamal.csv"))
+    args = parser.parse_args(argv)
+
+    rows = [
+        benchmark_scheme("ec_elgamal", ECElGamalScheme(max_message=args.max_message), 256, "add",
+                         lambda c, _: len(ECElGamalScheme.ciphertext_bytes(c)), args.repeats),
+        benchmark_scheme("elgamal", ElGamalScheme(), args.key_size, "multiply",
+                         lambda c, pk: 2 * _bytes(pk[0].bit_length()), args.repeats),
+        benchmark_scheme("exp_elgamal", ExponentialElGamalScheme(max_message=args.max_message), args.key_size, "add",
+                         lambda c, pk: 2 * _bytes(pk[0].bit_length()), args.repeats),
+        benchmark_scheme("paillier", PaillierScheme(), args.key_size, "add",
+                         lambda c, pk: _bytes(pk.nsquare.bit_length()), args.repeats),
+    ]
+
+    print(f"{'scheme':<15}{'key':>6}{'ct_bytes':>10}{'keygen_ms':>11}{'enc_ms':>9}{'dec_ms':>9}{'op_ms':>9}")
+    for row in rows:
+        print(f"{row['scheme']:<15}{row['key_size']:>6}{row['ciphertext_bytes']:>10}{row['keygen_ms']:>11.1f}"
+              f"{row['encrypt_ms']:>9.3f}{row['decrypt_ms']:>9.3f}{row['homomorphic_op_ms']:>9.4f}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Encrypted model predictive control with projected-gradient iterations.
+
+Closes the loop around benchmarks/config.py:PLANT with an input-constrained MPC
+(benchmarks/config.py:MPC) solved by a fixed number of projected-gradient
+iterations per step. The affine part of each iteration runs on encrypted data:
+
+- paillier:        one ciphertext per variable, the client projects every iteration;
+- ckks:            x and U packed in one ciphertext each (diagonal method), the
+                   client projects every iteration;
+- ckks-chebyshev:  packed, the server projects with a Chebyshev approximation of
+                   the clip (bootstrapping keeps the levels up), no round trips.
+
+Sweeps the prediction horizon and the number of iterations and reports the mean
+per-step latency split into sensor / server / client / actuator time, whether the
+p95 step latency fits the control period, and the largest deviation of the input
+from the plaintext MPC with the same iterations.
+
+Usage:
+    python -m benchmarks.scenarios.mpc --schemes paillier ckks --horizons 5 10 20 --iterations 5 10 20
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import create_scheme, write_csv
+from benchmarks.config import MPC, PLANT, RESULTS_DIR, SCHEMES
+from benchmarks.utils.timer import Timer
+from he_toolkit.simulators.dynamic_system import DynamicSystem
+from he_toolkit.simulators.mpc import ClientAssistedMPC, PackedMPC, ProjectedGradientMPC
+
+PHASES = ["sensor", "server", "client", "actuator"]
+
+
+def build_controller(mode: str, mpc: ProjectedGradientMPC, args: argparse.Namespace) -> Any:
+    if mode == "paillier":
+        scheme = create_scheme(SCHEMES["paillier"])
+        public_key, private_key = scheme.generate_keys(key_size=args.key_size)
+        return ClientAssistedMPC(scheme, mpc, public_key, private_key)
+
+    scheme = create_scheme(SCHEMES["ckks"])
+    slots = PackedMPC.required_slots(mpc, len(PLANT["A"]))
+    if mode == "ckks":
+        public_key, private_key = scheme.generate_keys(mult_depth=2, scale_mod_size=50, batch_size=slots)
+        return PackedMPC(scheme, mpc, public_key, private_key, projection="client")
+    public_key, private_key = scheme.generate_keys(mult_depth=args.mult_depth, scale_mod_size=59,
+                                                   batch_size=slots, bootstrap=True)
+    return PackedMPC(scheme, mpc, public_key, private_key, projection="chebyshev", degree=args.degree)
+
+
+def run_mpc(mode: str, horizon: int, iterations: int, args: argparse.Namespace) -> Dict[str, Any]:
+    mpc = ProjectedGradientMPC(PLANT["A"], PLANT["B"], MPC["Q"], MPC["R"], horizon,
+                               MPC["u_min"], MPC["u_max"], iterations=iterations)
+    controller = build_controller(mode, mpc, args)
+    plant = DynamicSystem(PLANT["A"], PLANT["B"], x0=PLANT["x0"])
+
+    durations, errors = [], []
+    phases = {phase: 0.0 for phase in PHASES}
+    for _ in range(args.steps):
+        x = plant.x.copy()
+        with Timer() as timer:
+            u, timings = controller.step(x)
+        durations.append(timer.elapsed)
+        for phase, seconds in timings.items():
+            phases[phase] += seconds
+        errors.append(float(np.max(np.abs(u - mpc.control(x)))))
+        plant.step(u)
+
+    durations_ms = np.array(durations) * 1e3
+    p95 = float(np.percentile(durations_ms, 95))
+    row = {
+        "scheme": mode,
+        "horizon": horizon,
+        "iterations": iterations,
+        "variables": mpc.n_variables,
+        "steps": args.steps,
+        "step_mean_ms": float(durations_ms.mean()),
+        "step_p95_ms": p95,
+    }
+    row.update({f"{phase}_ms": phases[phase] / args.steps * 1e3 for phase in PHASES})
+    row["real_time"] = p95 <= args.period_ms
+    row["max_input_error"] = max(errors)
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Encrypted projected-gradient MPC benchmark.")
+    parser.add_argument("--schemes", nargs="+", default=["paillier", "ckks"],
+                        choices=["paillier", "ckks", "ckks-chebyshev"])
+    parser.add_argument("--horizons", nargs="+", type=int, default=[MPC["horizon"]])
+    parser.add_argument("--iterations", nargs="+", type=int, default=[MPC["iterations"]])
+    parser.add_argument("--steps", type=int, default=20, help="Closed-loop steps per configuration.")
+    parser.add_argument("--period-ms", type=float, default=MPC["period_ms"], help="Control period.")
+    parser.add_argument("--key-size", type=int, default=SCHEMES["paillier"]["keygen"]["key_size"])
+    parser.add_argument("--mult-depth", type=int, default=12, help="CKKS depth for ckks-chebyshev.")
+    parser.add_argument("--degree", type=int, default=13, help="Chebyshev degree for ckks-chebyshev.")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "mpc.csv"))
+    args = parser.parse_args(argv)
+
+    rows = []
+    for mode in args.schemes:
+        for horizon in args.horizons:
+            for iterations in args.iterations:
+                print(f"Benchmarking MPC with {mode} (Horizon: {horizon}, Iterations: {iterations})...")
+                rows.append(run_mpc(mode, horizon, iterations, args))
+
+    print(f"{'scheme':<16}{'N':>4}{'iters':>7}{'mean_ms':>10}{'p95_ms':>10}{'server_ms':>11}"
+          f"{'client_ms':>11}{'real_time':>11}{'max_err':>11}")
+    for row in rows:
+        print(f"{row['scheme']:<16}{row['horizon']:>4}{row['iterations']:>7}{row['step_mean_ms']:>10.2f}"
+              f"{row['step_p95_ms']:>10.2f}{row['server_ms']:>11.2f}{row['client_ms']:>11.2f}"
+              f"{str(row['real_time']):>11}{row['max_input_error']:>11.2e}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Multi-controller throughput scaling benchmark.
+
+Runs N independent encrypted control loops (plant + EncryptedStateFeedback, see
+benchmarks/config.py:PLANT) concurrently, either as N processes or as N threads in
+one process, and sweeps N together with the OpenFHE (OpenMP) thread count.
+
+Reported per configuration:
+- aggregate closed-loop steps per second over all loops,
+- per-step latency percentiles across all loops (tail latency),
+- parallel efficiency: aggregate throughput / (N * single-loop throughput).
+
+Every configuration runs in freshly spawned interpreters so that OMP_NUM_THREADS is
+set before the OpenFHE library is loaded; OpenFHE-backed schemes additionally get the
+thread count (and, with --pin, a disjoint CPU set per loop) through their
+num_threads/cpu_affinity constructor arguments.
+
+With --split the benchmark instead searches the intra-op/inter-op split for a fixed
+core budget: for every divisor t of --cores it runs cores/t pinned loops with t
+OpenMP threads each, and reports the split with the highest aggregate throughput.
+
+Usage:
+    python -m benchmarks.scenarios.multi_controller --schemes paillier ckks --loops 1 2 4 8 --omp-threads 1 4
+    python -m benchmarks.scenarios.multi_controller --schemes ckks --split --cores 8
+"""
+import argparse
+import inspect
+import multiprocessing as mp
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import create_scheme, scheme_class, write_csv
+from benchmarks.config import PLANT, RESULTS_DIR, SCHEMES
+from he_toolkit.simulators.dynamic_system import DynamicSystem
+from he_toolkit.simulators.encrypted_controller import EncryptedStateFeedback
+
+# Seconds to wait for all loops to finish key generation before giving up.
+BARRIER_TIMEOUT = 600
+
+
+def scheme_kwargs(name: str, omp_threads: int, cpus: Optional[List[int]] = None) -> Dict[str, Any]:
+    """
+    Constructor arguments that apply the thread count and pinning to schemes that
+    support them (the OpenFHE wrappers). Other schemes are single-threaded.
+    """
+    parameters = inspect.signature(scheme_class(SCHEMES[name])).parameters
+    kwargs: Dict[str, Any] = {}
+    if "num_threads" in parameters:
+        kwargs["num_threads"] = omp_threads
+    if "cpu_affinity" in parameters and cpus is not None:
+        kwargs["cpu_affinity"] = cpus
+    return kwargs
+
+
+def build_loop(name: str, kwargs: Optional[Dict[str, Any]] = None):
+    """
+    Creates a plant and an encrypted controller with freshly generated keys.
+
+    Args:
+        name (str): Scheme name in benchmarks.config.SCHEMES.
+        kwargs (Optional[Dict[str, Any]]): Scheme constructor arguments.
+
+    Returns:
+        Tuple[DynamicSystem, EncryptedStateFeedback]
+    """
+    config = SCHEMES[name]
+    scheme = create_scheme(config, **(kwargs or {}))
+    public_key, private_key = scheme.generate_keys(**config["keygen"])
+    controller = EncryptedStateFeedback(scheme, PLANT["K"], public_key, private_key, **config["controller"])
+    plant = DynamicSystem(PLANT["A"], PLANT["B"], x0=PLANT["x0"])
+    return plant, controller
+
+
+def run_loop(name: str, steps: int, barrier: Any, kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Runs one control loop for a number of steps after all loops are ready.
+
+    Returns:
+        Dict[str, Any]: {'start', 'end', 'latencies'} with time.monotonic stamps
+        and per-step latencies in seconds.
+    """
+    plant, controller = build_loop(name, kwargs)
+    barrier.wait(BARRIER_TIMEOUT)
+    latencies = []
+    start = time.monotonic()
+    for _ in range(steps):
+        step_start = time.perf_counter()
+        u = controller.step(plant.x)
+        plant.step(u)
+        latencies.append(time.perf_counter() - step_start)
+    return {"start": start, "end": time.monotonic(), "latencies": latencies}
+
+
+def _report(queue: Any, func, *args) -> None:
+    try:
+        queue.put(func(*args))
+    except BaseException as exc:
+        queue.put(exc)
+
+
+def _loop_cpus(index: int, omp_threads: int, pin: bool) -> Optional[List[int]]:
+    if not pin:
+        return None
+    return list(range(index * omp_threads, (index + 1) * omp_threads))
+
+
+def _process_loop(name: str, steps: int, omp_threads: int, cpus: Optional[List[int]],
+                  barrier: Any, queue: Any) -> None:
+    os.environ["OMP_NUM_THREADS"] = str(omp_threads)
+    _report(queue, run_loop, name, steps, barrier, scheme_kwargs(name, omp_threads, cpus))
+
+
+def _thread_trial(name: str, loops: int, steps: int, omp_threads: int, pin: bool, queue: Any) -> None:
+    os.environ["OMP_NUM_THREADS"] = str(omp_threads)
+    barrier = threading.Barrier(loops)
+    threads = [threading.Thread(target=_report, args=(
+                   queue, run_loop, name, steps, barrier,
+                   scheme_kwargs(name, omp_threads, _loop_cpus(index, omp_threads, pin))))
+               for index in range(loops)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_trial(name: str, loops: int, steps: int, omp_threads: int, mode: str = "process",
+              pin: bool = False) -> List[Dict[str, Any]]:
+    """
+    Runs `loops` concurrent control loops and collects their timings.
+
+    Args:
+        name (str): Scheme name in benchmarks.config.SCHEMES.
+        loops (int): Number of concurrent loops.
+        steps (int): Control steps per loop.
+        omp_threads (int): OpenMP threads per process.
+        mode (str): "process" (one process per loop) or "thread" (one thread per loop).
+        pin (bool): Pin loop i to CPUs [i * omp_threads, (i + 1) * omp_threads).
+
+    Returns:
+        List[Dict[str, Any]]: One timing record per loop.
+    """
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    if mode == "process":
+        barrier = ctx.Barrier(loops)
+        workers = [ctx.Process(target=_process_loop, args=(
+                       name, steps, omp_threads, _loop_cpus(index, omp_threads, pin), barrier, queue))
+                   for index in range(loops)]
+    elif mode == "thread":
+        workers = [ctx.Process(target=_thread_trial, args=(name, loops, steps, omp_threads, pin, queue))]
+    else:
+        raise ValueError(f"Unknown mode '{mode}'")
+
+    for worker in workers:
+        worker.start()
+    records = [queue.get() for _ in range(loops)]
+    for worker in workers:
+        worker.join()
+
+    for record in records:
+        if isinstance(record, BaseException):
+            raise record
+    return records
+
+
+def summarize(name: str, mode: str, loops: int, omp_threads: int, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregates per-loop timing records into one result row.
+    """
+    latencies_ms = np.concatenate([record["latencies"] for record in records]) * 1e3
+    wall = max(record["end"] for record in records) - min(record["start"] for record in records)
+    return {
+        "scheme": name,
+        "mode": mode,
+        "loops": loops,
+        "omp_threads": omp_threads,
+        "steps_per_s": len(latencies_ms) / wall,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p95_ms": float(np.percentile(latencies_ms, 95)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "max_ms": float(latencies_ms.max()),
+    }
+
+
+def sweep(names: List[str], loop_counts: List[int], omp_threads: List[int], steps: int,
+          mode: str = "process", pin: bool = False) -> List[Dict[str, Any]]:
+    """
+    Runs every (scheme, N, OpenMP threads) combination and adds efficiency figures.
+
+    A single-loop run is always included per (scheme, thread count) as the baseline
+    for the efficiency curve.
+    """
+    loop_counts = sorted(set(loop_counts) | {1})
+    rows = []
+    for name in names:
+        for threads in omp_threads:
+            baseline = None
+            for loops in loop_counts:
+                print(f"Benchmarking {name} (Mode: {mode}, Loops: {loops}, OMP threads: {threads})...")
+                row = summarize(name, mode, loops, threads, run_trial(name, loops, steps, threads, mode, pin))
+                if baseline is None:
+                    baseline = row["steps_per_s"]
+                row["speedup"] = row["steps_per_s"] / baseline
+                row["efficiency"] = row["speedup"] / loops
+                rows.append(row)
+    return rows
+
+
+def best_split(name: str, cores: int, steps: int, mode: str = "process") -> List[Dict[str, Any]]:
+    """
+    Searches the intra-op/inter-op split for a core budget.
+
+    For every divisor t of `cores`, runs cores/t loops pinned to disjoint CPU sets
+    with t OpenMP threads each. Efficiency is relative to the fastest split.
+
+    Returns:
+        List[Dict[str, Any]]: One row per split; the best one has best=True.
+    """
+    rows = []
+    for threads in [t for t in range(1, cores + 1) if cores % t == 0]:
+        loops = cores // threads
+        print(f"Benchmarking {name} (Mode: {mode}, Loops: {loops}, OMP threads: {threads}, pinned)...")
+        rows.append(summarize(name, mode, loops, threads, run_trial(name, loops, steps, threads, mode, pin=True)))
+    best = max(row["steps_per_s"] for row in rows)
+    for row in rows:
+        row["speedup"] = row["steps_per_s"] / best
+        row["efficiency"] = row["speedup"]
+        row["best"] = row["steps_per_s"] == best
+    return rows
+
+
+def print_rows(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'scheme':<10}{'mode':<9}{'loops':>6}{'omp':>5}{'steps/s':>11}{'p50_ms':>10}"
+          f"{'p99_ms':>10}{'speedup':>9}{'eff':>7}")
+    for row in rows:
+        print(f"{row['scheme']:<10}{row['mode']:<9}{row['loops']:>6}{row['omp_threads']:>5}"
+              f"{row['steps_per_s']:>11.1f}{row['p50_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+              f"{row['speedup']:>9.2f}{row['efficiency']:>7.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    controller_schemes = sorted(name for name, config in SCHEMES.items() if "controller" in config)
+    parser = argparse.ArgumentParser(description="Multi-controller throughput scaling benchmark.")
+    parser.add_argument("--schemes", nargs="+", default=["paillier"], choices=controller_schemes)
+    parser.add_argument("--loops", nargs="+", type=int, default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--omp-threads", nargs="+", type=int, default=[1])
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--mode", choices=["process", "thread"], default="process")
+    parser.add_argument("--pin", action="store_true", help="Pin every loop to its own CPU set.")
+    parser.add_argument("--split", action="store_true",
+                        help="Search the best loops x OpenMP-threads split for --cores instead of sweeping.")
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "multi_controller.csv"))
+    args = parser.parse_args(argv)
+
+    if args.split:
+        rows = []
+        for name in args.schemes:
+            split_rows = best_split(name, args.cores, args.steps, args.mode)
+            best = next(row for row in split_rows if row["best"])
+            print(f"Best split for {name} on {args.cores} cores: "
+                  f"{best['loops']} loops x {best['omp_threads']} OpenMP threads")
+            rows.extend(split_rows)
+    else:
+        rows = sweep(args.schemes, args.loops, args.omp_threads, args.steps, args.mode, args.pin)
+    print_rows(rows)
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
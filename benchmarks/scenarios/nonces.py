@@ -0,0 +1,104 @@
+"""
+Nonce generation versus exponentiation in ElGamal encryption.
+
+Separates the two costs of an encryption:
+
+- nonce:  drawing r below p - 1, either with a fresh gmpy2.random_state() per call,
+          one buffered urandom draw per call, or all nonces of a batch at once
+          (he_toolkit.schemes.partial.randomness). The random_state row is the
+          baseline: it reproduces the nonce generation the schemes used before the
+          shared randomness module and is no longer a code path of the toolkit;
+- exponentiation:  g^r and h^r with a fixed nonce;
+- encrypt:  a full ElGamalScheme.encrypt per value versus encrypt_batch.
+
+All figures are microseconds per ciphertext. Baseline rows are marked in the
+"baseline" column of the CSV.
+
+Usage:
+    python -m benchmarks.scenarios.nonces --key-sizes 1024 2048 --batch 256
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+import gmpy2
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import write_csv
+from benchmarks.config import DEFAULT_REPEATS, RESULTS_DIR
+from benchmarks.utils.timer import time_function
+from he_toolkit.schemes.partial import randomness
+from he_toolkit.schemes.partial.elgamal import ElGamalScheme
+
+
+def per_item_us(func, repeats: int, batch: int) -> float:
+    durations, _ = time_function(func, repeats)
+    return float(np.mean(durations)) / batch * 1e6
+
+
+def benchmark_key_size(key_size: int, batch: int, repeats: int) -> List[Dict[str, Any]]:
+    scheme = ElGamalScheme()
+    public_key, _ = scheme.generate_keys(key_size=key_size)
+    p, g, h = public_key
+    bits = p.bit_length() - 1
+    r = randomness.random_below(p - 1)
+    plaintexts = [7] * batch
+
+    def baseline_random_state():
+        # The former per-call nonce generation, kept for comparison only.
+        for _ in range(batch):
+            gmpy2.mpz_urandomb(gmpy2.random_state(), bits) % (p - 1)
+
+    def buffered():
+        for _ in range(batch):
+            randomness.random_below(p - 1)
+
+    def exponentiation():
+        for _ in range(batch):
+            gmpy2.powmod(g, r, p)
+            gmpy2.powmod(h, r, p)
+
+    def encrypt_each():
+        for m in plaintexts:
+            scheme.encrypt(m, public_key)
+
+    measurements = [
+        ("nonce", "baseline_random_state_per_call", baseline_random_state),
+        ("nonce", "buffered_urandom", buffered),
+        ("nonce", "bulk_urandom", lambda: randomness.random_below_many(p - 1, batch)),
+        ("exponentiation", "powmod_g_h", exponentiation),
+        ("encrypt", "encrypt", encrypt_each),
+        ("encrypt", "encrypt_batch", lambda: scheme.encrypt_batch(plaintexts, public_key)),
+    ]
+    return [{"key_size": key_size, "batch": batch, "stage": stage, "method": method,
+             "baseline": method.startswith("baseline_"),
+             "us_per_ciphertext": per_item_us(func, repeats, batch)}
+            for stage, method, func in measurements]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ElGamal nonce generation benchmark.")
+    parser.add_argument("--key-sizes", nargs="+", type=int, default=[1024, 2048])
+    parser.add_argument("--batch", type=int, default=256, help="Ciphertexts per timed call.")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "nonces.csv"))
+    args = parser.parse_args(argv)
+
+    rows = []
+    for key_size in args.key_sizes:
+        print(f"Benchmarking ElGamal nonces (Key size: {key_size}, Batch: {args.batch})...")
+        rows.extend(benchmark_key_size(key_size, args.batch, args.repeats))
+
+    print(f"{'key_size':<10}{'stage':<16}{'method':<32}{'us/ct':>12}")
+    for row in rows:
+        print(f"{row['key_size']:<10}{row['stage']:<16}{row['method']:<32}{row['us_per_ciphertext']:>12.2f}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
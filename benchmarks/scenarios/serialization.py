@@ -0,0 +1,100 @@
+"""
+Ciphertext serialization throughput: fixed-width codecs versus pickle.
+
+For each scheme, encrypts N ciphertexts once and then measures:
+- pickle: dumps/loads of the whole list (highest protocol),
+- codec: encode_many/decode_many of the fixed-width records,
+- store: streaming the records into a CiphertextStore and reading them back
+  through the memory map, plus random single-record reads.
+
+Reports ciphertexts per second for every path and the bytes per ciphertext.
+
+Usage:
+    python -m benchmarks.scenarios.serialization --schemes paillier elgamal rsa --count 2000
+"""
+import argparse
+import os
+import pickle
+import random
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+from benchmarks.benchmark_runner import create_scheme, write_csv
+from benchmarks.config import RESULTS_DIR, SCHEMES
+from benchmarks.utils.timer import Timer
+from he_toolkit.serialization import CiphertextStore, codec_for
+
+
+def benchmark_scheme(name: str, count: int, directory: str) -> Dict[str, Any]:
+    print(f"Benchmarking {name} serialization (Ciphertexts: {count})...")
+    config = SCHEMES[name]
+    scheme = create_scheme(config)
+    public_key, _ = scheme.generate_keys(**config["keygen"])
+    ciphertexts = [scheme.encrypt(config["plaintext"], public_key) for _ in range(count)]
+    codec = codec_for(scheme, public_key)
+
+    with Timer() as pickle_dump:
+        pickled = pickle.dumps(ciphertexts, protocol=pickle.HIGHEST_PROTOCOL)
+    with Timer() as pickle_load:
+        pickle.loads(pickled)
+
+    with Timer() as encode:
+        encoded = codec.encode_many(ciphertexts)
+    with Timer() as decode:
+        codec.decode_many(encoded)
+
+    path = os.path.join(directory, f"{name}.hec")
+    with Timer() as store_write:
+        store = CiphertextStore.write(path, codec, ciphertexts)
+    with Timer() as store_read:
+        store[:]
+    indices = [random.randrange(count) for _ in range(count)]
+    with Timer() as store_random:
+        for index in indices:
+            store[index]
+
+    def rate(timer: Timer) -> float:
+        return count / timer.elapsed
+
+    return {
+        "scheme": name,
+        "count": count,
+        "pickle_bytes": len(pickled) / count,
+        "codec_bytes": codec.record_size,
+        "pickle_dump_per_s": rate(pickle_dump),
+        "pickle_load_per_s": rate(pickle_load),
+        "codec_encode_per_s": rate(encode),
+        "codec_decode_per_s": rate(decode),
+        "store_write_per_s": rate(store_write),
+        "store_read_per_s": rate(store_read),
+        "store_random_read_per_s": rate(store_random),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Fixed-width ciphertext serialization vs pickle.")
+    parser.add_argument("--schemes", nargs="+", default=["paillier", "elgamal", "damgard_jurik", "rsa", "ec_elgamal"])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "serialization.csv"))
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        rows = [benchmark_scheme(name, args.count, directory) for name in args.schemes]
+
+    print(f"{'scheme':<15}{'pkl_B':>8}{'rec_B':>7}{'pkl_dump/s':>12}{'pkl_load/s':>12}"
+          f"{'encode/s':>11}{'decode/s':>11}{'st_write/s':>12}{'st_read/s':>11}{'st_rand/s':>11}")
+    for row in rows:
+        print(f"{row['scheme']:<15}{row['pickle_bytes']:>8.0f}{row['codec_bytes']:>7}"
+              f"{row['pickle_dump_per_s']:>12.0f}{row['pickle_load_per_s']:>12.0f}"
+              f"{row['codec_encode_per_s']:>11.0f}{row['codec_decode_per_s']:>11.0f}"
+              f"{row['store_write_per_s']:>12.0f}{row['store_read_per_s']:>11.0f}{row['store_random_read_per_s']:>11.0f}")
+    write_csv(rows, args.output)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
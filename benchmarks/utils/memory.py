@@ -0,0 +1,203 @@
+"""
+Memory instrumentation for benchmark runs.
+
+Two complementary measurements are taken around every tracked block:
+
+- Resident set size (RSS) from /proc, which includes allocations made by native
+  libraries such as OpenFHE and GMP. On Linux the high-water mark (VmHWM) is reset
+  before each block through /proc/self/clear_refs so that the reported peak belongs
+  to that block rather than to the whole process lifetime.
+- tracemalloc statistics, which only see Python-level allocations but can point at
+  the source lines responsible for them.
+
+Each block is attributed to a category (key material or ciphertext working set) so
+that the footprint of keys and of live ciphertexts can be reported separately.
+"""
+import os
+import resource
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterator, List, Optional
+
+KEY_MATERIAL = "key_material"
+CIPHERTEXT = "ciphertext"
+
+_PAGE_SIZE_KB = os.sysconf("SC_PAGE_SIZE") // 1024 if hasattr(os, "sysconf") else 4
+
+
+def _read_status_kb(field_name: str) -> Optional[int]:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith(field_name + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _max_rss_kb() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux.
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+def current_rss_kb() -> int:
+    """
+    Returns the current resident set size of the process in kilobytes.
+    Falls back to the lifetime peak where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE_KB
+    except OSError:
+        return _max_rss_kb()
+
+
+def peak_rss_kb() -> int:
+    """
+    Returns the peak resident set size in kilobytes since the last reset_peak_rss().
+    """
+    peak = _read_status_kb("VmHWM")
+    return peak if peak is not None else _max_rss_kb()
+
+
+def reset_peak_rss() -> bool:
+    """
+    Resets the kernel's RSS high-water mark for this process (Linux only).
+
+    Returns:
+        bool: True if the peak was reset, False if only the lifetime peak is available.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+@dataclass
+class MemoryRecord:
+    """
+    Memory usage of a single tracked block. All sizes are in kilobytes.
+    """
+    label: str
+    category: str
+    rss_before_kb: int = 0
+    rss_after_kb: int = 0
+    peak_rss_kb: int = 0
+    peak_is_scoped: bool = False
+    traced_retained_kb: float = 0.0
+    traced_peak_kb: float = 0.0
+    top_allocations: List[str] = field(default_factory=list)
+
+    @property
+    def retained_rss_kb(self) -> int:
+        """RSS still held after the block, i.e. the footprint of the objects it kept alive."""
+        return self.rss_after_kb - self.rss_before_kb
+
+    @property
+    def transient_rss_kb(self) -> int:
+        """Peak RSS above the starting point, including temporaries freed inside the block."""
+        return max(self.peak_rss_kb - self.rss_before_kb, 0)
+
+    def as_dict(self) -> Dict[str, object]:
+        record = asdict(self)
+        record["retained_rss_kb"] = self.retained_rss_kb
+        record["transient_rss_kb"] = self.transient_rss_kb
+        return record
+
+
+class MemoryProfiler:
+    """
+    Records RSS and tracemalloc measurements around blocks of code.
+
+    Example:
+        profiler = MemoryProfiler()
+        with profiler.track("generate_keys", KEY_MATERIAL):
+            keys = scheme.generate_keys()
+        with profiler.track("encrypt", CIPHERTEXT):
+            ciphertexts = [scheme.encrypt(m, pk) for m in values]
+        print(profiler.by_category())
+
+    Objects created inside a block must stay referenced until the block exits for
+    their footprint to show up as retained memory.
+    """
+
+    def __init__(self, top_n: int = 5, trace_frames: int = 1):
+        """
+        Args:
+            top_n (int): Number of tracemalloc allocation sites to keep per block (0 disables snapshots).
+            trace_frames (int): Stack depth recorded by tracemalloc.
+        """
+        self.top_n = top_n
+        self.trace_frames = trace_frames
+        self.records: List[MemoryRecord] = []
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    @contextmanager
+    def track(self, label: str, category: str = CIPHERTEXT) -> Iterator[MemoryRecord]:
+        """
+        Tracks the memory used by the enclosed block.
+
+        Args:
+            label (str): Name of the block (e.g. the operation name).
+            category (str): KEY_MATERIAL or CIPHERTEXT.
+
+        Yields:
+            MemoryRecord: The record, filled in when the block exits.
+        """
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(self.trace_frames)
+
+        record = MemoryRecord(label=label, category=category)
+        snapshot_before = self._snapshot() if self.top_n else None
+        traced_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        record.peak_is_scoped = reset_peak_rss()
+        record.rss_before_kb = current_rss_kb()
+
+        try:
+            yield record
+        finally:
+            record.rss_after_kb = current_rss_kb()
+            record.peak_rss_kb = max(peak_rss_kb(), record.rss_after_kb)
+            traced_after, traced_peak = tracemalloc.get_traced_memory()
+            record.traced_retained_kb = (traced_after - traced_before) / 1024
+            record.traced_peak_kb = max(traced_peak - traced_before, 0) / 1024
+
+            if snapshot_before is not None:
+                stats = self._snapshot().compare_to(snapshot_before, "lineno")
+                record.top_allocations = [str(stat) for stat in stats[:self.top_n]]
+
+            if started_tracing:
+                tracemalloc.stop()
+            self.records.append(record)
+
+    def by_category(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregates the records per category.
+
+        Returns:
+            Dict[str, Dict[str, float]]: category -> {'retained_rss_kb', 'traced_retained_kb', 'peak_rss_kb'}
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for record in self.records:
+            totals = summary.setdefault(
+                record.category,
+                {"retained_rss_kb": 0, "traced_retained_kb": 0.0, "peak_rss_kb": 0},
+            )
+            totals["retained_rss_kb"] += record.retained_rss_kb
+            totals["traced_retained_kb"] += record.traced_retained_kb
+            totals["peak_rss_kb"] = max(totals["peak_rss_kb"], record.peak_rss_kb)
+        return summary
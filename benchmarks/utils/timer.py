@@ -0,0 +1,46 @@
+import time
+from typing import Any, Callable, List, Tuple
+
+
+class Timer:
+    """
+    Context manager measuring wall-clock time with time.perf_counter.
+
+    Example:
+        with Timer() as t:
+            scheme.encrypt(1.0, public_key)
+        print(t.elapsed)
+    """
+
+    def __init__(self):
+        self.start = 0.0
+        self.elapsed = 0.0
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.elapsed = time.perf_counter() - self.start
+        return False
+
+
+def time_function(func: Callable[[], Any], repeats: int = 1) -> Tuple[List[float], List[Any]]:
+    """
+    Calls a function several times and records the duration of each call.
+
+    Args:
+        func (Callable[[], Any]): Zero-argument callable to time.
+        repeats (int): Number of calls.
+
+    Returns:
+        Tuple[List[float], List[Any]]: (durations in seconds, return values)
+    """
+    durations = []
+    results = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+        results.append(result)
+    return durations, results
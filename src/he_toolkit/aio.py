@@ -0,0 +1,230 @@
+"""
+Asyncio facade over the synchronous schemes.
+
+Every homomorphic operation blocks for milliseconds, which stalls an asyncio
+service if called directly. AsyncScheme runs the operations on an executor
+chosen per scheme and returns awaitables:
+
+- OpenFHE wrappers run on a thread pool: their contexts cannot be pickled, and the
+  native library releases the GIL during the heavy work.
+- gmpy2 / python-paillier schemes run on a process pool: their big-integer
+  arithmetic holds the GIL, so threads would not add throughput. Each worker gets a
+  copy of the scheme when the pool starts (lazily, on the first operation), so
+  generate the keys first; later changes to the scheme object are not seen.
+
+Concurrent calls to the same operation are coalesced: every `max_batch` queued
+calls are sent as one job, and calls still queued after `coalesce_delay` seconds
+are split evenly over the workers. Batching amortizes the executor round trip and,
+for process pools, the pickling of shared arguments such as keys (pickled once per
+batch). At most `max_concurrency` jobs are in flight; further batches wait on a
+semaphore. An AsyncScheme may be used from successive event loops (e.g. several
+asyncio.run calls), but only from one loop at a time.
+
+    async with AsyncScheme(PaillierScheme()) as scheme:
+        public_key, private_key = await scheme.generate_keys(key_size=2048)
+        ciphertexts = await asyncio.gather(*(scheme.encrypt(v, public_key) for v in values))
+        u = await scheme.matvec(K, ciphertexts)
+"""
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from he_toolkit.simulators.encrypted_controller import encrypted_matvec
+
+# Schemes from this package release the GIL and cannot be pickled.
+THREADED_PACKAGES = ("he_toolkit.schemes.openfhe_wrappers",)
+
+_worker_scheme = None
+
+
+def _init_worker(scheme: Any) -> None:
+    global _worker_scheme
+    _worker_scheme = scheme
+
+
+def _run_batch(scheme: Optional[Any], name: str, calls: List[tuple]) -> List[Tuple[bool, Any]]:
+    """
+    Runs scheme.<name>(*args) for every args tuple, capturing exceptions per call.
+    `scheme` is None in process workers, which use the copy installed at startup.
+    """
+    method = getattr(scheme if scheme is not None else _worker_scheme, name)
+    results = []
+    for args in calls:
+        try:
+            results.append((True, method(*args)))
+        except Exception as error:
+            results.append((False, error))
+    return results
+
+
+def _run_matvec(scheme: Optional[Any], matrix: Any, encrypted_vector: List[Any]) -> List[Any]:
+    return encrypted_matvec(scheme if scheme is not None else _worker_scheme, matrix, encrypted_vector)
+
+
+def executor_kind(scheme: Any) -> str:
+    """
+    Returns "thread" for schemes that release the GIL (OpenFHE wrappers) and
+    "process" for the pure-Python/gmpy2 schemes.
+    """
+    return "thread" if type(scheme).__module__.startswith(THREADED_PACKAGES) else "process"
+
+
+class AsyncScheme:
+    """
+    Awaitable wrapper of a scheme with request coalescing and a concurrency limit.
+    """
+
+    def __init__(self, scheme: Any, kind: Optional[str] = None, workers: Optional[int] = None,
+                 executor: Optional[Executor] = None, max_batch: int = 16, coalesce_delay: float = 0.001,
+                 max_concurrency: Optional[int] = None):
+        """
+        Args:
+            scheme (Any): The synchronous scheme.
+            kind (Optional[str]): "thread" or "process" (default: executor_kind(scheme)).
+            workers (Optional[int]): Pool size (default: os.cpu_count()).
+            executor (Optional[Executor]): Executor to use instead of an internal pool. Process
+                executors must have been created with initializer=_init_worker, initargs=(scheme,).
+            max_batch (int): Maximum calls coalesced into one job (1 disables coalescing).
+            coalesce_delay (float): Seconds to wait for more calls before submitting a batch.
+            max_concurrency (Optional[int]): Maximum jobs in flight (default: workers).
+        """
+        self.scheme = scheme
+        self.kind = kind or (executor_kind(scheme) if executor is None else
+                             "process" if isinstance(executor, ProcessPoolExecutor) else "thread")
+        if self.kind not in ("thread", "process"):
+            raise ValueError("kind must be 'thread' or 'process'")
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.coalesce_delay = coalesce_delay
+        self.max_concurrency = max_concurrency or self.workers
+        self.batches = 0
+        self._executor = executor
+        self._own_executor = executor is None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: Dict[str, List[Tuple[tuple, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set = set()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                     initargs=(self.scheme,))
+        return self._executor
+
+    @property
+    def _target(self) -> Optional[Any]:
+        return self.scheme if self.kind == "thread" else None
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        # The semaphore, futures and timers belong to the loop that created them.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._pending, self._timers, self._tasks = {}, {}, set()
+        return loop
+
+    async def _submit(self, func, *args) -> Any:
+        self._bind_loop()
+        async with self._semaphore:
+            return await asyncio.wrap_future(self.executor.submit(func, *args))
+
+    async def generate_keys(self, **kwargs: Any) -> Tuple[Any, Any]:
+        """
+        Generates keys on a helper thread, updating the local scheme object.
+        """
+        return await asyncio.to_thread(self.scheme.generate_keys, **kwargs)
+
+    async def call(self, name: str, *args: Any) -> Any:
+        """
+        Runs scheme.<name>(*args) on the executor, coalesced with concurrent calls to
+        the same operation.
+        """
+        if self.max_batch <= 1:
+            ok, value = (await self._submit(_run_batch, self._target, name, [args]))[0]
+            if not ok:
+                raise value
+            return value
+
+        loop = self._bind_loop()
+        future = loop.create_future()
+        queue = self._pending.setdefault(name, [])
+        queue.append((args, future))
+        if len(queue) >= self.max_batch:
+            self._flush(name)
+        elif name not in self._timers:
+            self._timers[name] = loop.call_later(self.coalesce_delay, self._flush, name)
+        return await future
+
+    def _flush(self, name: str) -> None:
+        timer = self._timers.pop(name, None)
+        if timer is not None:
+            timer.cancel()
+        queue = self._pending.pop(name, [])
+        # Spread a partial batch over the workers instead of sending it as one job.
+        size = max(1, -(-len(queue) // self.max_concurrency)) if len(queue) < self.max_batch else len(queue)
+        for start in range(0, len(queue), size):
+            task = asyncio.ensure_future(self._dispatch(name, queue[start:start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, name: str, queue: List[Tuple[tuple, asyncio.Future]]) -> None:
+        self.batches += 1
+        try:
+            results = await self._submit(_run_batch, self._target, name, [args for args, _ in queue])
+        except BaseException as error:
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), (ok, value) in zip(queue, results):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    async def encrypt(self, plaintext: Any, public_key: Any) -> Any:
+        return await self.call("encrypt", plaintext, public_key)
+
+    async def decrypt(self, ciphertext: Any, private_key: Any) -> Any:
+        return await self.call("decrypt", ciphertext, private_key)
+
+    async def add(self, ciphertext1: Any, ciphertext2: Any) -> Any:
+        return await self.call("add", ciphertext1, ciphertext2)
+
+    async def multiply(self, ciphertext1: Any, ciphertext2: Any) -> Any:
+        return await self.call("multiply", ciphertext1, ciphertext2)
+
+    async def multiply_scalar(self, ciphertext: Any, scalar: Any) -> Any:
+        return await self.call("multiply_scalar", ciphertext, scalar)
+
+    async def matvec(self, matrix: Any, encrypted_vector: List[Any]) -> List[Any]:
+        """
+        Computes Enc(M x) with encrypted_matvec as a single executor job.
+        """
+        return await self._submit(_run_matvec, self._target, matrix, list(encrypted_vector))
+
+    async def aclose(self) -> None:
+        """
+        Flushes pending calls, waits for them and shuts down the internal executor.
+        """
+        for name in list(self._pending):
+            self._flush(name)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._own_executor and self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown, True)
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncScheme":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
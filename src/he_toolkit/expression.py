@@ -0,0 +1,400 @@
+"""
+Lazy homomorphic expressions with an optimizing executor.
+
+Controller code is written as plain algebra over symbolic inputs:
+
+    x = [variable("x0"), variable("x1")]
+    u = -1.0 * x[0] - 1.5 * x[1]
+    plan = compile_plan([u])
+    [enc_u] = plan.run(scheme, {"x0": enc_x0, "x1": enc_x1}, public_key)
+
+Nothing is evaluated while the expressions are built. compile_plan turns the
+recorded DAG into a schedule of scheme calls and optimizes it:
+
+- constant folding: operations on plaintext constants are computed in the clear,
+  and identities (x * 1, x + 0, x * 0) disappear;
+- scalar fusion: sums are normalized to linear combinations, so chains such as
+  2 * (3 * x) + x become a single plaintext-ciphertext product 7 * x;
+- common subexpression elimination: additions and products are commutative, so
+  structurally equal subtrees (in any operand order) are computed once;
+- depth minimization: products of ciphertexts are regrouped into balanced trees
+  that always combine the two shallowest factors, which minimizes the
+  multiplicative depth (what limits leveled schemes such as CKKS). Relinearization
+  and rescaling are left to the scheme: the OpenFHE wrappers relinearize inside
+  EvalMult and rescale automatically, so each multiplication costs one level;
+- batching: steps are grouped into wavefronts of mutually independent calls, which
+  run in parallel on an executor, and independent ciphertext products in a
+  wavefront become one multiply_batch call on schemes that provide it (RSA).
+"""
+import heapq
+from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from he_toolkit.streaming import slot_count
+
+Number = Union[int, float]
+
+
+class Expr:
+    """
+    Node of a lazy homomorphic expression. Build expressions with variable(),
+    constant() and the arithmetic operators (+, -, *, unary -).
+    """
+    __slots__ = ("op", "args", "value")
+
+    def __init__(self, op: str, args: Tuple["Expr", ...] = (), value: Any = None):
+        self.op = op
+        self.args = args
+        self.value = value
+
+    def __add__(self, other: Any) -> "Expr":
+        return Expr("add", (self, _lift(other)))
+
+    def __radd__(self, other: Any) -> "Expr":
+        return Expr("add", (_lift(other), self))
+
+    def __sub__(self, other: Any) -> "Expr":
+        return self + (-_lift(other))
+
+    def __rsub__(self, other: Any) -> "Expr":
+        return _lift(other) + (-self)
+
+    def __mul__(self, other: Any) -> "Expr":
+        return Expr("mul", (self, _lift(other)))
+
+    def __rmul__(self, other: Any) -> "Expr":
+        return Expr("mul", (_lift(other), self))
+
+    def __neg__(self) -> "Expr":
+        return Expr("mul", (constant(-1), self))
+
+    def __repr__(self) -> str:
+        if self.op == "input":
+            return str(self.value)
+        if self.op == "const":
+            return repr(self.value)
+        symbol = " + " if self.op == "add" else " * "
+        return "(" + symbol.join(map(repr, self.args)) + ")"
+
+
+def variable(name: str) -> Expr:
+    """
+    Returns a symbolic encrypted input, bound to a ciphertext when the plan runs.
+    """
+    return Expr("input", value=name)
+
+
+def constant(value: Number) -> Expr:
+    """
+    Returns a plaintext constant.
+    """
+    return Expr("const", value=value)
+
+
+def _lift(value: Any) -> Expr:
+    return value if isinstance(value, Expr) else constant(value)
+
+
+class Step(NamedTuple):
+    """
+    One scheme call of a compiled plan.
+
+    Attributes:
+        op (str): "input", "const" (encrypt a constant), "scale" (multiply_scalar), "add" or "mul".
+        args (Tuple[int, ...]): Indices of the operand steps.
+        value (Any): Input name, constant or scalar.
+        depth (int): Multiplicative depth of the result (ciphertext and scalar products).
+    """
+    op: str
+    args: Tuple[int, ...]
+    value: Any
+    depth: int
+
+
+# Linear form: ({atom key: coefficient}, constant term). Atoms are inputs and products.
+_Linear = Tuple[Dict[Any, Number], Number]
+
+
+class _Compiler:
+    def __init__(self):
+        self.steps: List[Step] = []
+        self._memo: Dict[Any, int] = {}
+        # Keyed by the node itself (identity hash), which also keeps it alive: an id()
+        # key could be reused by a later temporary such as a lifted constant.
+        self._linear: Dict[Expr, _Linear] = {}
+        self._factors: Dict[Any, Tuple[Any, ...]] = {}
+
+    # Normalization: expressions -> linear forms over atoms.
+
+    def linear(self, expr: Expr) -> _Linear:
+        cached = self._linear.get(expr)
+        if cached is not None:
+            return cached
+        if expr.op == "input":
+            result = ({("input", expr.value): 1}, 0)
+        elif expr.op == "const":
+            result = ({}, expr.value)
+        elif expr.op == "add":
+            result = _sum(self.linear(arg) for arg in expr.args)
+        elif expr.op == "mul":
+            result = self._product(self.linear(expr.args[0]), self.linear(expr.args[1]))
+        else:
+            raise ValueError(f"Unknown expression op '{expr.op}'")
+        self._linear[expr] = result
+        return result
+
+    def _product(self, a: _Linear, b: _Linear) -> _Linear:
+        if not a[0]:
+            return _scaled(b, a[1])
+        if not b[0]:
+            return _scaled(a, b[1])
+        coefficient = 1
+        factors: List[Any] = []
+        for terms, const in (a, b):
+            if len(terms) == 1 and const == 0:
+                # A single scaled atom: pull the scalar out and flatten nested products.
+                (key, coef), = terms.items()
+                coefficient *= coef
+                factors.extend(self._factors.get(key, (key,)))
+            else:
+                factors.append(("sum", _freeze(terms), const))
+        key = ("product", tuple(sorted(factors, key=repr)))
+        self._factors[key] = key[1]
+        return {key: coefficient}, 0
+
+    # Lowering: atoms and linear forms -> steps.
+
+    def _emit(self, key: Any, op: str, args: Tuple[int, ...], value: Any = None) -> int:
+        index = self._memo.get(key)
+        if index is None:
+            depths = [self.steps[arg].depth for arg in args]
+            depth = max(depths, default=0) + (1 if op in ("mul", "scale") else 0)
+            index = len(self.steps)
+            self.steps.append(Step(op, args, value, depth))
+            self._memo[key] = index
+        return index
+
+    def _reduce(self, op: str, operands: List[int]) -> int:
+        # Combine the two shallowest operands first: a balanced tree of minimal depth.
+        heap = [(self.steps[index].depth, index) for index in operands]
+        heapq.heapify(heap)
+        while len(heap) > 1:
+            _, left = heapq.heappop(heap)
+            _, right = heapq.heappop(heap)
+            args = (min(left, right), max(left, right))
+            index = self._emit((op,) + args, op, args)
+            heapq.heappush(heap, (self.steps[index].depth, index))
+        return heap[0][1]
+
+    def atom(self, key: Any) -> int:
+        kind = key[0]
+        if kind == "input":
+            return self._emit(key, "input", (), key[1])
+        if kind == "product":
+            return self._reduce("mul", [self.atom(factor) for factor in key[1]])
+        return self.combination(dict(key[1]), key[2])
+
+    def combination(self, terms: Dict[Any, Number], const: Number) -> int:
+        operands = []
+        for key, coef in sorted(terms.items(), key=repr):
+            index = self.atom(key)
+            if coef != 1:
+                index = self._emit(("scale", index, coef), "scale", (index,), coef)
+            operands.append(index)
+        if const != 0 or not operands:
+            operands.append(self._emit(("const", const), "const", (), const))
+        return self._reduce("add", operands)
+
+    def output(self, expr: Expr) -> int:
+        terms, const = self.linear(_lift(expr))
+        if const == 0 and len(terms) == 1:
+            (key, coef), = terms.items()
+            if coef == 1:
+                return self.atom(key)
+        return self.combination(terms, const)
+
+
+def _sum(forms: Iterable[_Linear]) -> _Linear:
+    terms: Dict[Any, Number] = defaultdict(int)
+    const = 0
+    for form_terms, form_const in forms:
+        for key, coef in form_terms.items():
+            terms[key] += coef
+        const += form_const
+    return {key: coef for key, coef in terms.items() if coef != 0}, const
+
+
+def _scaled(form: _Linear, scalar: Number) -> _Linear:
+    if scalar == 0:
+        return {}, 0
+    return {key: coef * scalar for key, coef in form[0].items()}, form[1] * scalar
+
+
+def _freeze(terms: Dict[Any, Number]) -> Tuple[Tuple[Any, Number], ...]:
+    return tuple(sorted(terms.items(), key=repr))
+
+
+def _count_nodes(outputs: Iterable[Expr]) -> int:
+    seen = set()
+    stack = list(outputs)
+    while stack:
+        expr = stack.pop()
+        if expr not in seen:
+            seen.add(expr)
+            stack.extend(expr.args)
+    return len(seen)
+
+
+def _apply(scheme: Any, op: str, operands: Tuple[Any, ...], value: Any, public_key: Any) -> Any:
+    if op == "const":
+        if public_key is None:
+            raise ValueError("The plan encrypts constants; pass public_key to run()")
+        slots = slot_count(scheme)
+        # Broadcast to every slot: multiply_scalar and add act on all slots of packed inputs.
+        return scheme.encrypt([value] * slots if slots else value, public_key)
+    if op == "scale":
+        return scheme.multiply_scalar(operands[0], value)
+    if op == "add":
+        return scheme.add(*operands)
+    if op == "mul":
+        return scheme.multiply(*operands)
+    raise ValueError(f"Unknown step op '{op}'")
+
+
+def _apply_batch(scheme: Any, pairs: List[Tuple[Any, Any]]) -> List[Any]:
+    left, right = zip(*pairs)
+    return scheme.multiply_batch(list(left), list(right))
+
+
+class Plan:
+    """
+    A compiled, optimized schedule of scheme calls for a set of output expressions.
+    """
+
+    def __init__(self, steps: List[Step], outputs: List[int], source_nodes: int):
+        """
+        Args:
+            steps (List[Step]): Steps in topological order.
+            outputs (List[int]): Step index of each output.
+            source_nodes (int): Number of nodes in the expression DAG before optimization.
+        """
+        self.steps = steps
+        self.outputs = outputs
+        self.source_nodes = source_nodes
+        # Wavefronts: every step only depends on steps of earlier wavefronts.
+        wave = []
+        for step in steps:
+            wave.append(max((wave[arg] + 1 for arg in step.args), default=0))
+        self.wavefronts: List[List[int]] = [[] for _ in range(max(wave, default=-1) + 1)]
+        for index, level in enumerate(wave):
+            self.wavefronts[level].append(index)
+
+    @property
+    def depth(self) -> int:
+        """
+        Multiplicative depth of the deepest output.
+        """
+        return max((self.steps[index].depth for index in self.outputs), default=0)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Node and operation counts of the plan.
+        """
+        counts = defaultdict(int)
+        for step in self.steps:
+            counts[step.op] += 1
+        return {
+            "source_nodes": self.source_nodes,
+            "steps": len(self.steps),
+            "inputs": counts["input"],
+            "constants": counts["const"],
+            "additions": counts["add"],
+            "scalar_multiplications": counts["scale"],
+            "multiplications": counts["mul"],
+            "depth": self.depth,
+            "wavefronts": len(self.wavefronts),
+        }
+
+    def run(self, scheme: Any, inputs: Dict[str, Any], public_key: Any = None, workers: int = 1,
+            executor: Optional[Executor] = None) -> List[Any]:
+        """
+        Evaluates the plan.
+
+        Args:
+            scheme (Any): Scheme providing the operations the plan uses.
+            inputs (Dict[str, Any]): Ciphertext for every variable name.
+            public_key (Any): Public key, needed only if the plan encrypts constants.
+            workers (int): Threads per wavefront if no executor is given (1 runs inline).
+            executor (Optional[Executor]): Executor to submit independent steps to.
+
+        Returns:
+            List[Any]: One ciphertext per output expression.
+        """
+        own_executor = executor is None and workers > 1
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        batch_multiply = hasattr(scheme, "multiply_batch")
+        values: List[Any] = [None] * len(self.steps)
+        try:
+            for wavefront in self.wavefronts:
+                tasks = []
+                products = []
+                for index in wavefront:
+                    step = self.steps[index]
+                    if step.op == "input":
+                        if step.value not in inputs:
+                            raise ValueError(f"No ciphertext bound to input '{step.value}'")
+                        values[index] = inputs[step.value]
+                    elif step.op == "mul" and batch_multiply:
+                        products.append(index)
+                    else:
+                        operands = tuple(values[arg] for arg in step.args)
+                        tasks.append(([index], _apply, (scheme, step.op, operands, step.value, public_key)))
+                if len(products) == 1:
+                    index = products[0]
+                    operands = tuple(values[arg] for arg in self.steps[index].args)
+                    tasks.append(([index], _apply, (scheme, "mul", operands, None, public_key)))
+                elif products:
+                    pairs = [tuple(values[arg] for arg in self.steps[index].args) for index in products]
+                    tasks.append((products, _apply_batch, (scheme, pairs)))
+
+                if executor is None:
+                    results = [func(*args) for _, func, args in tasks]
+                else:
+                    futures = [executor.submit(func, *args) for _, func, args in tasks]
+                    results = [future.result() for future in futures]
+                for (indices, func, _), result in zip(tasks, results):
+                    if func is _apply_batch:
+                        for index, value in zip(indices, result):
+                            values[index] = value
+                    else:
+                        values[indices[0]] = result
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True)
+        return [values[index] for index in self.outputs]
+
+
+def compile_plan(outputs: Union[Expr, Iterable[Any]]) -> Plan:
+    """
+    Optimizes the expression DAG reachable from `outputs` into a Plan.
+
+    Args:
+        outputs (Union[Expr, Iterable[Any]]): Output expression(s). Plain numbers are
+            allowed and become encrypted constants.
+
+    Returns:
+        Plan: The optimized schedule.
+    """
+    outputs = [_lift(expr) for expr in ([outputs] if isinstance(outputs, Expr) else outputs)]
+    compiler = _Compiler()
+    indices = [compiler.output(expr) for expr in outputs]
+    return Plan(compiler.steps, indices, _count_nodes(outputs))
+
+
+def matvec(matrix: Iterable[Iterable[Number]], vector: List[Expr]) -> List[Expr]:
+    """
+    Symbolic plaintext-matrix / encrypted-vector product.
+    """
+    return [sum((coefficient * x for coefficient, x in zip(row, vector)), constant(0)) for row in matrix]
@@ -0,0 +1,531 @@
+"""
+Opt-in per-operation profiling for schemes.
+
+instrument() wraps any scheme (HEScheme subclasses and the OpenFHE wrappers alike)
+in a proxy that records, per public method:
+
+- call and error counts,
+- a latency histogram with Prometheus-style cumulative buckets,
+- the byte size of arguments and results (integers, gmpy2 numbers, ciphertext dicts
+  without their public modulus, tuples, python-paillier numbers and NumPy arrays;
+  other objects, including OpenFHE ones, are skipped unless a custom `sizer` such
+  as SerializedSizer is given).
+
+Selected operations can additionally be captured with cProfile or with a sampling
+profiler that periodically records the call stack of the thread running the
+operation (much cheaper than cProfile for long operations).
+
+Metrics are exported as Prometheus text (for the node exporter's textfile
+collector) or as JSON snapshots. When the registry is disabled the proxy forwards
+every call after a single flag check.
+
+    registry = MetricsRegistry()
+    scheme = instrument(PaillierScheme(), registry)
+    ...
+    registry.write_prometheus("/var/lib/node_exporter/he.prom")
+"""
+import bisect
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Latency bucket upper bounds in seconds (10 us to 10 s).
+DEFAULT_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+CPROFILE = "cprofile"
+SAMPLING = "sampling"
+
+
+# Ciphertext dict entries that hold the public modulus rather than ciphertext data
+# (ElGamal 'p', Damgard-Jurik 'modulus', RSA 'n'); they are not counted.
+MODULUS_KEYS = frozenset(("p", "modulus", "n"))
+
+
+def _openfhe_size(value: Any) -> Optional[int]:
+    """
+    Serialized (binary) size of an OpenFHE object, or None if it cannot be serialized.
+    openfhe is only looked up if already imported, since the value came from it.
+    """
+    openfhe = sys.modules.get("openfhe")
+    if openfhe is None:
+        return None
+    serialize = getattr(openfhe, "Serialize", None)
+    if serialize is not None:
+        try:
+            return len(serialize(value, openfhe.BINARY))
+        except Exception:
+            pass
+    descriptor, path = tempfile.mkstemp(suffix=".bin")
+    os.close(descriptor)
+    try:
+        if not openfhe.SerializeToFile(path, value, openfhe.BINARY):
+            return None
+        return os.path.getsize(path)
+    except Exception:
+        return None
+    finally:
+        os.remove(path)
+
+
+def object_size(value: Any) -> Optional[int]:
+    """
+    Best-effort size in bytes of a plaintext, ciphertext or key. OpenFHE objects are
+    not measured (see SerializedSizer).
+
+    Returns:
+        Optional[int]: The size, or None if the type is unknown.
+    """
+    if isinstance(value, bool) or value is None:
+        return 0
+    if isinstance(value, float):
+        return 8
+    if hasattr(value, "bit_length"):  # int, gmpy2.mpz
+        return (int(value).bit_length() + 7) // 8
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        value = [item for key, item in value.items() if key not in MODULUS_KEYS]
+    elif hasattr(value, "ciphertext") and callable(value.ciphertext):  # phe.EncryptedNumber
+        return object_size(value.ciphertext(be_secure=False))
+    if isinstance(value, (list, tuple)):
+        total = 0
+        for item in value:
+            size = object_size(item)
+            if size is None:
+                return None
+            total += size
+        return total
+    return None
+
+
+def _is_openfhe(value: Any) -> bool:
+    return type(value).__module__.startswith("openfhe")
+
+
+class SerializedSizer:
+    """
+    Sizer that also measures OpenFHE objects by their binary serialization.
+
+    Serializing a ciphertext costs about as much as copying it, so each size is
+    measured once per (type, level, noise scale degree, slots) and cached. This
+    assumes the instrumented schemes share one set of parameters; use one sizer
+    per crypto context otherwise.
+
+        registry = MetricsRegistry(sizer=SerializedSizer())
+    """
+
+    SHAPE_GETTERS = ("GetLevel", "GetNoiseScaleDeg", "GetSlots")
+
+    def __init__(self, serialize: Callable[[Any], Optional[int]] = _openfhe_size):
+        """
+        Args:
+            serialize (Callable[[Any], Optional[int]]): Measures one OpenFHE object.
+        """
+        self.serialize = serialize
+        self._sizes: Dict[Tuple[Any, ...], Optional[int]] = {}
+
+    def _shape(self, value: Any) -> Tuple[Any, ...]:
+        return (type(value).__qualname__,) + tuple(
+            getattr(value, getter)() for getter in self.SHAPE_GETTERS if hasattr(value, getter))
+
+    def __call__(self, value: Any) -> Optional[int]:
+        if isinstance(value, (list, tuple)) and any(_is_openfhe(item) for item in value):
+            sizes = [self(item) for item in value]
+            return None if None in sizes else sum(sizes)
+        if not _is_openfhe(value):
+            return object_size(value)
+        shape = self._shape(value)
+        if shape not in self._sizes:
+            self._sizes[shape] = self.serialize(value)
+        return self._sizes[shape]
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (Prometheus semantics: `le` upper bounds plus +Inf).
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.bounds = sorted(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """
+        Returns (le, cumulative count) pairs including "+Inf".
+        """
+        pairs = []
+        total = 0
+        for bound, count in zip(self.bounds + [float("inf")], self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bucket bound below which a fraction q of the observations falls.
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        total = 0
+        for bound, count in zip(self.bounds + [float("inf")], self.counts):
+            total += count
+            if total >= target:
+                return bound
+        return float("inf")
+
+
+class OperationStats:
+    """
+    Metrics of one (scheme, operation) pair.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram(buckets)
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_seconds": {
+                "sum": self.latency.sum,
+                "count": self.latency.count,
+                "mean": self.latency.sum / self.latency.count if self.latency.count else 0.0,
+                "p50_bound": self.latency.quantile(0.5),
+                "p99_bound": self.latency.quantile(0.99),
+                "buckets": dict(self.latency.cumulative()),
+            },
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+
+class StackSampler:
+    """
+    Sampling profiler: a daemon thread records the stacks of the threads that are
+    currently inside a captured operation every `interval` seconds. Stacks are kept
+    in collapsed form ("outer;...;inner" -> samples), as used by flame graph tools.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: Dict[str, Counter] = defaultdict(Counter)
+        self._active: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def begin(self, label: str) -> None:
+        with self._lock:
+            self._active[threading.get_ident()] = label
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="he-stack-sampler", daemon=True)
+                self._thread.start()
+
+    def end(self) -> None:
+        with self._lock:
+            self._active.pop(threading.get_ident(), None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                active = dict(self._active)
+            frames = sys._current_frames()
+            for thread_id, label in active.items():
+                frame = frames.get(thread_id)
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                if names:
+                    self.stacks[label][";".join(reversed(names))] += 1
+            time.sleep(self.interval)
+
+    def collapsed(self, label: str) -> str:
+        """
+        Returns the samples of one operation in collapsed-stack text format.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks[label].most_common())
+
+
+class MetricsRegistry:
+    """
+    Collects the metrics of all instrumented schemes.
+    """
+
+    def __init__(self, enabled: bool = True, buckets: Iterable[float] = DEFAULT_BUCKETS,
+                 measure_bytes: bool = True, sizer: Callable[[Any], Optional[int]] = object_size):
+        """
+        Args:
+            enabled (bool): Whether instrumented calls are recorded (can be toggled at runtime).
+            buckets (Iterable[float]): Latency histogram bucket bounds in seconds.
+            measure_bytes (bool): Whether argument and result sizes are recorded. Sizing
+                runs after the latency is taken but still on the calling thread; the
+                default sizer only inspects Python objects and skips OpenFHE ones.
+            sizer (Callable[[Any], Optional[int]]): Size function for arguments and results
+                (SerializedSizer also measures OpenFHE objects, serializing each
+                ciphertext shape once).
+        """
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.measure_bytes = measure_bytes
+        self.sizer = sizer
+        self.operations: Dict[Tuple[str, str], OperationStats] = {}
+        self.profiles: Dict[Tuple[str, str], pstats.Stats] = {}
+        self.sampler = StackSampler()
+        self._capture: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def capture(self, operations: Iterable[str], mode: str = CPROFILE, interval: Optional[float] = None) -> None:
+        """
+        Enables detailed capture for the named operations.
+
+        Args:
+            operations (Iterable[str]): Method names, e.g. ["multiply", "decrypt"].
+            mode (str): "cprofile" (deterministic) or "sampling".
+            interval (Optional[float]): Sampling interval in seconds (sampling mode).
+        """
+        if mode not in (CPROFILE, SAMPLING):
+            raise ValueError(f"Unknown capture mode '{mode}'")
+        if interval is not None:
+            self.sampler.interval = interval
+        for operation in operations:
+            self._capture[operation] = mode
+
+    def stats(self, scheme: str, operation: str) -> OperationStats:
+        key = (scheme, operation)
+        stats = self.operations.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self.operations.setdefault(key, OperationStats(self.buckets))
+        return stats
+
+    def _size(self, values: Iterable[Any]) -> int:
+        total = 0
+        for value in values:
+            size = self.sizer(value)
+            if size is not None:
+                total += size
+        return total
+
+    def call(self, scheme: str, operation: str, method: Callable, args: tuple, kwargs: dict) -> Any:
+        """
+        Calls `method` and records its metrics.
+        """
+        mode = self._capture.get(operation)
+        profiler = None
+        if mode == CPROFILE:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:  # Another profiler is active (e.g. a concurrent capture).
+                profiler = None
+        elif mode == SAMPLING:
+            self.sampler.begin(f"{scheme}.{operation}")
+
+        failed = False
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler is not None:
+                profiler.disable()
+            elif mode == SAMPLING:
+                self.sampler.end()
+            with self._lock:
+                stats = self.stats(scheme, operation)
+                stats.calls += 1
+                stats.latency.observe(elapsed)
+                if failed:
+                    stats.errors += 1
+                if profiler is not None:
+                    key = (scheme, operation)
+                    if key in self.profiles:
+                        self.profiles[key].add(profiler)
+                    else:
+                        self.profiles[key] = pstats.Stats(profiler)
+        if self.measure_bytes:
+            bytes_in = self._size(args) + self._size(kwargs.values())
+            bytes_out = self._size((result,))
+            with self._lock:
+                stats.bytes_in += bytes_in
+                stats.bytes_out += bytes_out
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self.operations.clear()
+            self.profiles.clear()
+            self.sampler.stacks.clear()
+
+    def profile_report(self, scheme: str, operation: str, limit: int = 20) -> str:
+        """
+        Returns the cProfile report (sorted by cumulative time) of a captured operation.
+        """
+        stats = self.profiles.get((scheme, operation))
+        if stats is None:
+            return ""
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns all metrics as a JSON-serializable dict.
+        """
+        with self._lock:
+            operations = [dict(scheme=scheme, operation=operation, **stats.to_dict())
+                          for (scheme, operation), stats in sorted(self.operations.items())]
+        return {"timestamp": time.time(), "operations": operations}
+
+    def to_prometheus(self, prefix: str = "he") -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            items = sorted(self.operations.items())
+            metrics = [
+                ("operation_calls_total", "counter", "Calls per homomorphic operation.", lambda s: s.calls),
+                ("operation_errors_total", "counter", "Failed calls per homomorphic operation.", lambda s: s.errors),
+                ("operation_bytes_in_total", "counter", "Bytes of arguments passed to the operation.",
+                 lambda s: s.bytes_in),
+                ("operation_bytes_out_total", "counter", "Bytes of results returned by the operation.",
+                 lambda s: s.bytes_out),
+            ]
+            for name, kind, description, getter in metrics:
+                lines.append(f"# HELP {prefix}_{name} {description}")
+                lines.append(f"# TYPE {prefix}_{name} {kind}")
+                for (scheme, operation), stats in items:
+                    lines.append(f'{prefix}_{name}{{scheme="{scheme}",operation="{operation}"}} {getter(stats)}')
+
+            name = f"{prefix}_operation_latency_seconds"
+            lines.append(f"# HELP {name} Latency of homomorphic operations.")
+            lines.append(f"# TYPE {name} histogram")
+            for (scheme, operation), stats in items:
+                labels = f'scheme="{scheme}",operation="{operation}"'
+                for le, count in stats.latency.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {stats.latency.sum!r}")
+                lines.append(f"{name}_count{{{labels}}} {stats.latency.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "he") -> None:
+        """
+        Writes the Prometheus text atomically (as the textfile collector expects).
+        """
+        _write_atomic(path, self.to_prometheus(prefix))
+
+    def write_json(self, path: str) -> None:
+        """
+        Writes a JSON snapshot atomically.
+        """
+        _write_atomic(path, json.dumps(self.snapshot(), indent=2))
+
+
+def _write_atomic(path: str, text: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class InstrumentedScheme:
+    """
+    Proxy that records the metrics of a scheme's public methods. Attributes that
+    are not instrumented methods are forwarded unchanged.
+    """
+
+    def __init__(self, scheme: Any, registry: "MetricsRegistry", name: Optional[str] = None,
+                 operations: Optional[Iterable[str]] = None):
+        """
+        Args:
+            scheme (Any): The scheme to wrap.
+            registry (MetricsRegistry): Where metrics are recorded.
+            name (Optional[str]): Scheme label (default: the class name).
+            operations (Optional[Iterable[str]]): Methods to instrument (default: all public methods).
+        """
+        self._scheme = scheme
+        self._registry = registry
+        self._name = name or type(scheme).__name__
+        self._operations = None if operations is None else frozenset(operations)
+
+    def __getattr__(self, attribute: str) -> Any:
+        value = getattr(self._scheme, attribute)
+        if attribute.startswith("_") or not callable(value) or \
+                (self._operations is not None and attribute not in self._operations):
+            return value
+
+        registry, name = self._registry, self._name
+
+        @wraps(value)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return value(*args, **kwargs)
+            return registry.call(name, attribute, value, args, kwargs)
+
+        # Cache the wrapper so later lookups skip __getattr__.
+        self.__dict__[attribute] = wrapper
+        return wrapper
+
+    @property
+    def wrapped(self) -> Any:
+        """
+        The underlying scheme.
+        """
+        return self._scheme
+
+
+def instrument(scheme: Any, registry: MetricsRegistry, name: Optional[str] = None,
+               operations: Optional[Iterable[str]] = None) -> InstrumentedScheme:
+    """
+    Wraps a scheme so that its operations are recorded in `registry`.
+
+    Args:
+        scheme (Any): The scheme to wrap.
+        registry (MetricsRegistry): Where metrics are recorded.
+        name (Optional[str]): Scheme label (default: the class name).
+        operations (Optional[Iterable[str]]): Methods to instrument (default: all public methods).
+
+    Returns:
+        InstrumentedScheme: A drop-in replacement for the scheme.
+    """
+    return InstrumentedScheme(scheme, registry, name, operations)
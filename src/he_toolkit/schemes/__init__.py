@@ -0,0 +1,2 @@
+from he_toolkit.schemes.registry import (Capabilities, available_schemes, capabilities, get_scheme,
+                                         get_scheme_class, register, schemes_with)
@@ -1,16 +1,24 @@
-from typing import Tuple, Any, List
+from typing import Tuple, Any, List, Iterable, Optional
 from openfhe import *
+from he_toolkit.schemes.openfhe_wrappers.parallelism import ParallelismConfig, uses_parallelism
 
 class BFVScheme:
     """
     Wrapper for OpenFHE BFV Scheme.
     """
 
-    def __init__(self):
+    def __init__(self, num_threads: Optional[int] = None, cpu_affinity: Optional[Iterable[int]] = None):
+        """
+        Args:
+            num_threads (Optional[int]): OpenMP threads used by OpenFHE calls (default: process setting).
+            cpu_affinity (Optional[Iterable[int]]): CPUs the calling thread is pinned to (default: no pinning).
+        """
+        self.parallelism = ParallelismConfig(num_threads, cpu_affinity)
         self.crypto_context = None
         self.key_pair = None
         self.batch_size = 0
 
+    @uses_parallelism
     def generate_keys(self, plain_modulus: int = 65537, mult_depth: int = 2, scale_mod_size: int = 50, batch_size: int = 8) -> Tuple[Any, Any]:
         """
         Generates keys and sets up the CryptoContext.
@@ -45,6 +53,7 @@ class BFVScheme:
 
         return self.key_pair.publicKey, self.key_pair.secretKey
 
+    @uses_parallelism
     def encrypt(self, plaintext_list: List[int], public_key: Any) -> Any:
         """
         Encrypts a list of integers.
@@ -63,6 +72,7 @@ class BFVScheme:
         ciphertext = self.crypto_context.Encrypt(public_key, plaintext)
         return ciphertext
 
+    @uses_parallelism
     def decrypt(self, ciphertext: Any, private_key: Any) -> List[int]:
         """
         Decrypts a ciphertext to a list of integers.
@@ -80,18 +90,21 @@ class BFVScheme:
         plaintext_result = self.crypto_context.Decrypt(ciphertext, private_key)
         return plaintext_result.GetPackedValue()
 
+    @uses_parallelism
     def add(self, ciphertext1: Any, ciphertext2: Any) -> Any:
         """
         Homomorphically adds two ciphertexts.
         """
         return self.crypto_context.EvalAdd(ciphertext1, ciphertext2)
 
+    @uses_parallelism
     def multiply(self, ciphertext1: Any, ciphertext2: Any) -> Any:
         """
         Homomorphically multiplies two ciphertexts.
         """
         return self.crypto_context.EvalMult(ciphertext1, ciphertext2)
 
+    @uses_parallelism
     def multiply_scalar(self, ciphertext: Any, scalar: int) -> Any:
         """
         Homomorphically multiplies a ciphertext by a scalar.
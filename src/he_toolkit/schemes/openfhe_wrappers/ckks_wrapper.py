@@ -1,39 +1,103 @@
-from typing import Tuple, Any, List
+from typing import Tuple, Any, Callable, List, Iterable, Optional, Sequence
 from openfhe import *
+from he_toolkit.schemes.openfhe_wrappers.parallelism import ParallelismConfig, uses_parallelism
+
+# Multiplicative depth of EvalChebyshevFunction per polynomial degree (upper bounds
+# of the degree ranges from the OpenFHE function evaluation documentation).
+CHEBYSHEV_DEPTHS = ((5, 3), (13, 4), (27, 5), (59, 6), (119, 7), (247, 8), (495, 9), (1007, 10), (2031, 11))
+
+
+def chebyshev_depth(degree: int) -> int:
+    """
+    Returns the levels consumed by a Chebyshev approximation of the given degree.
+    """
+    for max_degree, depth in CHEBYSHEV_DEPTHS:
+        if degree <= max_degree:
+            return depth
+    raise ValueError("Chebyshev degree must be at most 2031")
+
 
 class CKKSScheme:
     """
     Wrapper for OpenFHE CKKS Scheme.
+
+    Every multiplication consumes one level of the modulus chain, so a ciphertext
+    can only go through `mult_depth` of them. With `bootstrap=True` the context is
+    set up for CKKS bootstrapping and multiply/multiply_scalar refresh their inputs
+    with EvalBootstrap once fewer than `min_levels` levels are left, which lets a
+    recursive computation (e.g. a controller with an encrypted state) run forever.
     """
 
-    def __init__(self):
+    def __init__(self, num_threads: Optional[int] = None, cpu_affinity: Optional[Iterable[int]] = None):
+        """
+        Args:
+            num_threads (Optional[int]): OpenMP threads used by OpenFHE calls (default: process setting).
+            cpu_affinity (Optional[Iterable[int]]): CPUs the calling thread is pinned to (default: no pinning).
+        """
+        self.parallelism = ParallelismConfig(num_threads, cpu_affinity)
         self.crypto_context = None
         self.key_pair = None
+        self.batch_size = 0
+        self.bootstrapping = False
+        self.depth = 0
+        self.min_levels = 0
+        self.bootstrap_count = 0
 
-    def generate_keys(self, mult_depth: int = 3, scale_mod_size: int = 50, batch_size: int = 8) -> Tuple[Any, Any]:
+    @uses_parallelism
+    def generate_keys(self, mult_depth: int = 3, scale_mod_size: int = 50, batch_size: int = 8,
+                      bootstrap: bool = False, level_budget: Sequence[int] = (3, 3),
+                      first_mod_size: int = 60, min_levels: int = 2) -> Tuple[Any, Any]:
         """
         Generates keys and sets up the CryptoContext.
         
         Args:
-            mult_depth (int): Multiplicative depth.
+            mult_depth (int): Multiplicative depth. With bootstrapping, the number of levels
+                left for computation after each refresh.
             scale_mod_size (int): Size of the scaling modulus.
             batch_size (int): Size of the batch (slots).
+            bootstrap (bool): Whether to enable bootstrapping (FHE).
+            level_budget (Sequence[int]): Levels spent on the (encoding, decoding) linear
+                transforms of bootstrapping; larger budgets are faster but deeper.
+            first_mod_size (int): Size of the first modulus (bootstrapping only).
+            min_levels (int): Inputs of a multiplication with fewer levels left are
+                bootstrapped first (bootstrapping only). The default keeps one level for
+                the multiplication and one for the next bootstrap.
             
         Returns:
             Tuple[Any, Any]: (public_key, private_key)
         """
+        self.batch_size = batch_size
+        self.bootstrapping = bootstrap
+        self.bootstrap_count = 0
         parameters = CCParamsCKKSRNS()
-        parameters.SetMultiplicativeDepth(mult_depth)
         parameters.SetScalingModSize(scale_mod_size)
         parameters.SetBatchSize(batch_size)
+        if bootstrap:
+            if mult_depth < min_levels:
+                raise ValueError("mult_depth must leave at least min_levels levels after bootstrapping")
+            secret_key_dist = SecretKeyDist.UNIFORM_TERNARY
+            parameters.SetSecretKeyDist(secret_key_dist)
+            parameters.SetScalingTechnique(ScalingTechnique.FLEXIBLEAUTO)
+            parameters.SetFirstModSize(first_mod_size)
+            self.depth = mult_depth + FHECKKSRNS.GetBootstrapDepth(list(level_budget), secret_key_dist)
+            self.min_levels = min_levels
+        else:
+            self.depth = mult_depth
+        parameters.SetMultiplicativeDepth(self.depth)
         
         self.crypto_context = GenCryptoContext(parameters)
         self.crypto_context.Enable(PKESchemeFeature.PKE)
         self.crypto_context.Enable(PKESchemeFeature.KEYSWITCH)
         self.crypto_context.Enable(PKESchemeFeature.LEVELEDSHE)
+        if bootstrap:
+            self.crypto_context.Enable(PKESchemeFeature.ADVANCEDSHE)
+            self.crypto_context.Enable(PKESchemeFeature.FHE)
+            self.crypto_context.EvalBootstrapSetup(list(level_budget), [0, 0], batch_size)
         
         self.key_pair = self.crypto_context.KeyGen()
         self.crypto_context.EvalMultKeyGen(self.key_pair.secretKey)
+        if bootstrap:
+            self.crypto_context.EvalBootstrapKeyGen(self.key_pair.secretKey, batch_size)
         
         # Generate rotation keys for summation if needed, but basic interface might not need it yet.
         # For now, we enable basic rotation just in case.
@@ -41,6 +105,7 @@ class CKKSScheme:
 
         return self.key_pair.publicKey, self.key_pair.secretKey
 
+    @uses_parallelism
     def encrypt(self, plaintext_list: List[float], public_key: Any) -> Any:
         """
         Encrypts a list of floats.
@@ -59,6 +124,7 @@ class CKKSScheme:
         ciphertext = self.crypto_context.Encrypt(public_key, plaintext)
         return ciphertext
 
+    @uses_parallelism
     def decrypt(self, ciphertext: Any, private_key: Any) -> List[float]:
         """
         Decrypts a ciphertext to a list of floats.
@@ -80,20 +146,102 @@ class CKKSScheme:
         # Let's return the real part of the packed plaintext.
         return plaintext_result.GetRealPackedValue()
 
+    @uses_parallelism
     def add(self, ciphertext1: Any, ciphertext2: Any) -> Any:
         """
         Homomorphically adds two ciphertexts.
         """
         return self.crypto_context.EvalAdd(ciphertext1, ciphertext2)
 
+    @uses_parallelism
     def multiply(self, ciphertext1: Any, ciphertext2: Any) -> Any:
         """
         Homomorphically multiplies two ciphertexts.
         """
-        return self.crypto_context.EvalMult(ciphertext1, ciphertext2)
+        return self.crypto_context.EvalMult(self.ensure_levels(ciphertext1), self.ensure_levels(ciphertext2))
 
+    @uses_parallelism
     def multiply_scalar(self, ciphertext: Any, scalar: float) -> Any:
         """
         Homomorphically multiplies a ciphertext by a scalar.
         """
-        return self.crypto_context.EvalMult(ciphertext, scalar)
+        return self.crypto_context.EvalMult(self.ensure_levels(ciphertext), scalar)
+
+    @uses_parallelism
+    def multiply_plain(self, ciphertext: Any, values: List[float]) -> Any:
+        """
+        Homomorphically multiplies a ciphertext slot-wise by a plaintext vector.
+
+        Unlike multiply_scalar this never bootstraps: callers multiplying several
+        rotations of one ciphertext call ensure_levels once beforehand instead of
+        refreshing every copy.
+        """
+        plaintext = self.crypto_context.MakeCKKSPackedPlaintext(list(values))
+        return self.crypto_context.EvalMult(ciphertext, plaintext)
+
+    @uses_parallelism
+    def generate_rotation_keys(self, steps: Iterable[int]) -> None:
+        """
+        Generates the keys needed to rotate by each of `steps` slots.
+        """
+        self.crypto_context.EvalRotateKeyGen(self.key_pair.secretKey, list(steps))
+
+    @uses_parallelism
+    def rotate(self, ciphertext: Any, steps: int) -> Any:
+        """
+        Rotates the slots left by `steps` (cyclic over batch_size slots).
+        Keys exist for +-1 and +-2; call generate_rotation_keys for other steps.
+        """
+        return self.crypto_context.EvalRotate(ciphertext, steps)
+
+    @uses_parallelism
+    def evaluate_chebyshev(self, ciphertext: Any, function: Callable[[float], float],
+                           a: float, b: float, degree: int) -> Any:
+        """
+        Evaluates a Chebyshev approximation of `function` on [a, b] slot-wise.
+        Consumes chebyshev_depth(degree) levels.
+        """
+        ciphertext = self.ensure_levels(ciphertext, chebyshev_depth(degree))
+        return self.crypto_context.EvalChebyshevFunction(function, ciphertext, a, b, degree)
+
+    def levels_remaining(self, ciphertext: Any) -> int:
+        """
+        Returns how many more multiplications the ciphertext can go through.
+
+        With FLEXIBLEAUTO scaling the rescale after a multiplication is deferred to the
+        next operation, so a pending rescale (noise scale degree 2) counts as a used level.
+        """
+        return self.depth - ciphertext.GetLevel() - (ciphertext.GetNoiseScaleDeg() - 1)
+
+    @uses_parallelism
+    def refresh(self, ciphertext: Any) -> Any:
+        """
+        Bootstraps a ciphertext, restoring `mult_depth` levels.
+
+        Args:
+            ciphertext (Any): The ciphertext (with at least one level left).
+
+        Returns:
+            Any: An encryption of the same values.
+        """
+        if not self.bootstrapping:
+            raise RuntimeError("Bootstrapping is not enabled. Call generate_keys with bootstrap=True.")
+        self.bootstrap_count += 1
+        return self.crypto_context.EvalBootstrap(ciphertext)
+
+    def ensure_levels(self, ciphertext: Any, levels: int = 1) -> Any:
+        """
+        Bootstraps the ciphertext if it cannot go through `levels` more multiplications
+        and still be refreshed afterwards (no-op without bootstrapping).
+
+        Args:
+            ciphertext (Any): The ciphertext.
+            levels (int): Levels the next operations will consume.
+
+        Returns:
+            Any: The ciphertext, refreshed if needed.
+        """
+        # An operation consuming `levels` levels must leave min_levels - 1 for the next bootstrap.
+        if self.bootstrapping and self.levels_remaining(ciphertext) < levels + self.min_levels - 1:
+            return self.refresh(ciphertext)
+        return ciphertext
@@ -0,0 +1,183 @@
+"""
+Thread-count and CPU-affinity control for the OpenFHE-backed wrappers.
+
+OpenFHE parallelizes internally with OpenMP and by default uses every core the
+process can see. When several control loops share a host this oversubscribes the
+CPU, so each wrapper accepts a ParallelismConfig that is applied to the calling
+thread before every OpenFHE call:
+
+- the OpenMP thread count is set with omp_set_num_threads (an OpenMP per-thread
+  setting, so it also holds when different Python threads use different schemes);
+- the CPU affinity is set with os.sched_setaffinity, which on Linux pins the calling
+  thread. OpenMP worker threads inherit the mask when they are created, so pin before
+  the first parallel call (generate_keys does this automatically).
+
+The thread count is cached per thread, so it costs a single attribute lookup once a
+thread has been configured; the CPU mask is re-checked on every call because other
+code may change it. omp_set_num_threads is looked up in the OpenMP runtime that is
+already loaded (the one OpenFHE uses), never in a separately loaded copy.
+"""
+import ctypes
+import glob
+import os
+import sys
+import threading
+import warnings
+from functools import wraps
+from typing import Callable, Iterable, Iterator, List, Optional, Set
+
+# Sonames of the OpenMP runtimes OpenFHE may be linked against (GNU, LLVM, Intel).
+OPENMP_LIBRARIES = ("libgomp", "libomp", "libiomp5")
+
+_openmp = None
+_applied = threading.local()
+
+
+def _mapped_openmp_paths(maps: str) -> List[str]:
+    """
+    Returns the paths of the OpenMP runtimes listed in a /proc/<pid>/maps dump.
+    """
+    paths = []
+    for line in maps.splitlines():
+        fields = line.split(maxsplit=5)
+        path = fields[5].strip() if len(fields) == 6 else ""
+        if os.path.basename(path).startswith(OPENMP_LIBRARIES) and ".so" in path and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def _candidates() -> Iterator[ctypes.CDLL]:
+    # 1. Runtimes already mapped into the process: dlopen of a loaded path returns
+    #    the existing handle, i.e. the very runtime OpenFHE uses.
+    try:
+        with open("/proc/self/maps") as maps:
+            paths = _mapped_openmp_paths(maps.read())
+    except OSError:
+        paths = []
+    for path in paths:
+        try:
+            yield ctypes.CDLL(path)
+        except OSError:
+            continue
+    # 2. Symbols in the global namespace of the process.
+    yield ctypes.CDLL(None)
+    # 3. A runtime linked statically into the openfhe extension module.
+    module = sys.modules.get("openfhe")
+    if getattr(module, "__file__", None):
+        for path in [module.__file__] + sorted(glob.glob(os.path.join(os.path.dirname(module.__file__), "*.so*"))):
+            try:
+                yield ctypes.CDLL(path)
+            except OSError:
+                continue
+
+
+def _openmp_library() -> Optional[ctypes.CDLL]:
+    """
+    Returns the OpenMP runtime loaded in this process, or None if there is none yet.
+
+    Only runtimes that are already loaded are considered: loading one by name could
+    bring in a second runtime, on which omp_set_num_threads has no effect on OpenFHE.
+    A miss is not cached, so the lookup succeeds once openfhe has been imported.
+    """
+    global _openmp
+    if _openmp is None:
+        for library in _candidates():
+            try:
+                library.omp_set_num_threads.argtypes = [ctypes.c_int]
+                library.omp_get_max_threads.restype = ctypes.c_int
+            except AttributeError:
+                continue
+            _openmp = library
+            break
+    return _openmp
+
+
+def set_num_threads(num_threads: int) -> bool:
+    """
+    Sets the OpenMP thread count for parallel regions started by the calling thread.
+
+    Args:
+        num_threads (int): Number of OpenMP threads (>= 1).
+
+    Returns:
+        bool: False if no OpenMP runtime could be found.
+    """
+    if num_threads < 1:
+        raise ValueError("num_threads must be at least 1")
+    library = _openmp_library()
+    if library is None:
+        return False
+    library.omp_set_num_threads(num_threads)
+    return library.omp_get_max_threads() == num_threads
+
+
+def get_max_threads() -> Optional[int]:
+    """
+    Returns the OpenMP thread count the calling thread would use, or None if unknown.
+    """
+    library = _openmp_library()
+    return None if library is None else library.omp_get_max_threads()
+
+
+def set_cpu_affinity(cpus: Iterable[int]) -> bool:
+    """
+    Pins the calling thread to the given CPUs.
+
+    Returns:
+        bool: False if the platform does not support affinity control.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, set(cpus))
+    return True
+
+
+class ParallelismConfig:
+    """
+    OpenMP thread count and CPU affinity for one scheme instance.
+    Leaving both unset keeps whatever the process started with.
+    """
+
+    def __init__(self, num_threads: Optional[int] = None, cpu_affinity: Optional[Iterable[int]] = None):
+        """
+        Args:
+            num_threads (Optional[int]): OpenMP threads used by OpenFHE calls.
+            cpu_affinity (Optional[Iterable[int]]): CPUs the calling thread is pinned to.
+        """
+        if num_threads is not None and num_threads < 1:
+            raise ValueError("num_threads must be at least 1")
+        self.num_threads = num_threads
+        self.cpu_affinity: Optional[Set[int]] = set(cpu_affinity) if cpu_affinity is not None else None
+
+    def _pinned(self) -> bool:
+        return self.cpu_affinity is None or not hasattr(os, "sched_getaffinity") \
+            or os.sched_getaffinity(0) == self.cpu_affinity
+
+    def apply(self) -> None:
+        """
+        Applies the configuration to the calling thread. The thread count is skipped
+        if this config was the last one applied on the thread; the CPU mask is
+        checked every time, since other code may have changed it in between.
+        """
+        if getattr(_applied, "config", None) is self:
+            if not self._pinned():
+                set_cpu_affinity(self.cpu_affinity)
+            return
+        if self.cpu_affinity is not None and not set_cpu_affinity(self.cpu_affinity):
+            warnings.warn("CPU affinity is not supported on this platform; ignoring cpu_affinity.")
+        if self.num_threads is not None and not set_num_threads(self.num_threads):
+            warnings.warn("Could not set the OpenMP thread count: no OpenMP runtime is loaded in this "
+                          "process (or it ignored the call); set OMP_NUM_THREADS before importing openfhe.")
+        _applied.config = self
+
+
+def uses_parallelism(method: Callable) -> Callable:
+    """
+    Decorator for wrapper methods that call into OpenFHE: applies the instance's
+    ParallelismConfig (stored as self.parallelism) to the calling thread first.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.parallelism.apply()
+        return method(self, *args, **kwargs)
+    return wrapper
@@ -1,18 +1,26 @@
-from typing import Any
+from typing import Any, Iterable, Optional
 from openfhe import *
+from he_toolkit.schemes.openfhe_wrappers.parallelism import ParallelismConfig, uses_parallelism
 
 class TFHEScheme:
     """
     Wrapper for OpenFHE BinFHE Scheme (TFHE).
     """
 
-    def __init__(self):
+    def __init__(self, num_threads: Optional[int] = None, cpu_affinity: Optional[Iterable[int]] = None):
+        """
+        Args:
+            num_threads (Optional[int]): OpenMP threads used by OpenFHE calls (default: process setting).
+            cpu_affinity (Optional[Iterable[int]]): CPUs the calling thread is pinned to (default: no pinning).
+        """
+        self.parallelism = ParallelismConfig(num_threads, cpu_affinity)
         self.binfhe_context = BinFHEContext()
         self.secret_key = None
         # Public key is generally not used explicitly in BinFHE encryption in OpenFHE 
         # (it often uses symmetric encryption for fresh ciphertexts, though public key encryption is possible).
         # We will follow standard BinFHE usage.
         
+    @uses_parallelism
     def generate_keys(self, security_level=STD128):
         """
         Generates keys and sets up the BinFHEContext.
@@ -26,6 +34,7 @@ class TFHEScheme:
         
         return self.secret_key
 
+    @uses_parallelism
     def encrypt(self, value: int, secret_key: Any) -> Any:
         """
         Encrypts a bit (0 or 1).
@@ -40,6 +49,7 @@ class TFHEScheme:
         # BinFHE usually encrypts using secret key
         return self.binfhe_context.Encrypt(secret_key, value % 2)
 
+    @uses_parallelism
     def decrypt(self, ciphertext: Any, secret_key: Any) -> int:
         """
         Decrypts a ciphertext to a bit.
@@ -53,18 +63,23 @@ class TFHEScheme:
         """
         return self.binfhe_context.Decrypt(secret_key, ciphertext)
 
+    @uses_parallelism
     def eval_nand(self, ct1: Any, ct2: Any) -> Any:
         return self.binfhe_context.EvalBinGate(NAND, ct1, ct2)
 
+    @uses_parallelism
     def eval_and(self, ct1: Any, ct2: Any) -> Any:
         return self.binfhe_context.EvalBinGate(AND, ct1, ct2)
 
+    @uses_parallelism
     def eval_or(self, ct1: Any, ct2: Any) -> Any:
         return self.binfhe_context.EvalBinGate(OR, ct1, ct2)
 
+    @uses_parallelism
     def eval_xor(self, ct1: Any, ct2: Any) -> Any:
         return self.binfhe_context.EvalBinGate(XOR, ct1, ct2)
         
+    @uses_parallelism
     def eval_not(self, ct: Any) -> Any:
         # NOT is usually XOR with 1 or specific EvalNOT
         return self.binfhe_context.EvalNOT(ct)
@@ -0,0 +1,201 @@
+from math import factorial
+from typing import Tuple, Any, Dict
+import gmpy2
+from gmpy2 import mpz
+from he_toolkit.interfaces import HEScheme
+from he_toolkit.schemes.partial.randomness import random_prime, random_unit
+from he_toolkit.schemes.partial.integers import as_integer
+
+
+class DamgardJurikScheme(HEScheme):
+    """
+    Implementation of the Damgard-Jurik Homomorphic Encryption Scheme using gmpy2.
+    This is the generalization of Paillier to the modulus n^(s+1) and supports
+    ADDITIVE homomorphism.
+
+    Properties:
+    - Plaintexts live in Z_{n^s}, ciphertexts in Z*_{n^(s+1)}.
+    - Ciphertext expansion is (s+1)/s: 2x for s=1 (Paillier), 1.5x for s=2, ...
+    - Enc(m1) * Enc(m2) = Enc(m1 + m2), Enc(m)^k = Enc(k * m).
+    - Plaintexts are integers; values above n^s / 2 decode as negative numbers.
+    """
+
+    def __init__(self, s: int = 1):
+        """
+        Args:
+            s (int): Degree of the modulus n^(s+1). Larger s lowers the expansion ratio.
+        """
+        if s < 1:
+            raise ValueError("s must be at least 1")
+        self.s = s
+
+    @property
+    def expansion_ratio(self) -> float:
+        """
+        Ratio between ciphertext and plaintext size.
+        """
+        return (self.s + 1) / self.s
+
+    def generate_keys(self, key_size: int = 2048) -> Tuple[Any, Any]:
+        """
+        Generates a public/private key pair.
+
+        Args:
+            key_size (int): The size of n in bits.
+
+        Returns:
+            Tuple[Any, Any]: (public_key, private_key)
+                public_key = (n, s)
+                private_key = (n, s, p, q, d_p, d_q, q_inv) where d_p, d_q are the
+                decryption exponent reduced modulo phi(p^(s+1)), phi(q^(s+1)) and
+                q_inv = (q^(s+1))^(-1) mod p^(s+1), for CRT decryption.
+        """
+        s = self.s
+        while True:
+            p = random_prime(key_size // 2)
+            q = random_prime(key_size - key_size // 2)
+            n = p * q
+            lam = gmpy2.lcm(p - 1, q - 1)
+            if p != q and gmpy2.gcd(n, lam) == 1:
+                break
+
+        n_s = n ** s
+        # d = 1 mod n^s and d = 0 mod lambda, so c^d = (1+n)^m mod n^(s+1).
+        d = lam * gmpy2.invert(lam, n_s)
+
+        p_s1 = p ** (s + 1)
+        q_s1 = q ** (s + 1)
+        d_p = d % (p ** s * (p - 1))
+        d_q = d % (q ** s * (q - 1))
+        q_inv = gmpy2.invert(q_s1, p_s1)
+
+        public_key = (n, s)
+        private_key = (n, s, p, q, d_p, d_q, q_inv)
+        return public_key, private_key
+
+    def encrypt(self, plaintext: float, public_key: Any) -> Dict[str, Any]:
+        """
+        Encrypts a plaintext value.
+        c = (1+n)^m * r^(n^s) mod n^(s+1)
+
+        Args:
+            plaintext (float): The value to encrypt. Must be an integer with |m| < n^s / 2.
+            public_key (Any): The public key (n, s).
+
+        Returns:
+            Dict[str, Any]: The encrypted ciphertext {'c': c, 'modulus': n^(s+1)}.
+        """
+        n, s = public_key
+        n_s = n ** s
+        modulus = n_s * n
+        m = mpz(as_integer(plaintext)) % n_s
+
+        r = random_unit(n)
+
+        c = gmpy2.mul(self._one_plus_n_pow(m, n, s, modulus), gmpy2.powmod(r, n_s, modulus)) % modulus
+        return {'c': c, 'modulus': modulus}
+
+    @staticmethod
+    def _one_plus_n_pow(m: mpz, n: mpz, s: int, modulus: mpz) -> mpz:
+        """
+        Computes (1+n)^m mod n^(s+1) with the binomial expansion
+        sum_{k=0..s} C(m, k) n^k, which avoids a full modular exponentiation.
+        """
+        result = mpz(1)
+        binomial = mpz(1)
+        n_k = mpz(1)
+        for k in range(1, s + 1):
+            binomial = binomial * (m - k + 1) * gmpy2.invert(k, modulus) % modulus
+            n_k *= n
+            result += binomial * n_k
+        return result % modulus
+
+    @staticmethod
+    def _discrete_log(a: mpz, n: mpz, s: int) -> mpz:
+        """
+        Recovers i from a = (1+n)^i mod n^(s+1), one power of n at a time.
+        """
+        i = mpz(0)
+        for j in range(1, s + 1):
+            n_j = n ** j
+            t1 = ((a % (n_j * n)) - 1) // n
+            t2 = i
+            for k in range(2, j + 1):
+                i -= 1
+                t2 = t2 * i % n_j
+                t1 -= t2 * n ** (k - 1) * gmpy2.invert(factorial(k), n_j)
+            i = t1 % n_j
+        return i
+
+    def decrypt(self, ciphertext: Dict[str, Any], private_key: Any) -> float:
+        """
+        Decrypts a ciphertext value. See decrypt_int for plaintexts beyond float range.
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext {'c': c, 'modulus': n^(s+1)}.
+            private_key (Any): The private key (n, s, p, q, d_p, d_q, q_inv).
+
+        Returns:
+            float: The decrypted plaintext.
+        """
+        return float(self.decrypt_int(ciphertext, private_key))
+
+    def decrypt_int(self, ciphertext: Dict[str, Any], private_key: Any) -> int:
+        """
+        Decrypts a ciphertext to the exact integer plaintext using CRT.
+        a = c^d mod n^(s+1) is computed modulo p^(s+1) and q^(s+1) separately with
+        reduced exponents, then m is extracted from a = (1+n)^m.
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext {'c': c, 'modulus': n^(s+1)}.
+            private_key (Any): The private key (n, s, p, q, d_p, d_q, q_inv).
+
+        Returns:
+            int: The decrypted plaintext in (-n^s / 2, n^s / 2].
+        """
+        n, s, p, q, d_p, d_q, q_inv = private_key
+        c = ciphertext['c']
+        p_s1 = p ** (s + 1)
+        q_s1 = q ** (s + 1)
+
+        a_p = gmpy2.powmod(c, d_p, p_s1)
+        a_q = gmpy2.powmod(c, d_q, q_s1)
+        a = a_q + q_s1 * ((a_p - a_q) * q_inv % p_s1)
+
+        m = self._discrete_log(a, n, s)
+        n_s = n ** s
+        if m > n_s // 2:
+            m -= n_s
+        return int(m)
+
+    def add(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Homomorphically adds two ciphertexts.
+        Enc(m1) * Enc(m2) = Enc(m1 + m2)
+
+        Args:
+            ciphertext1 (Dict[str, Any]): The first ciphertext.
+            ciphertext2 (Dict[str, Any]): The second ciphertext.
+
+        Returns:
+            Dict[str, Any]: The result of the addition (Enc(m1 + m2)).
+        """
+        modulus = ciphertext1['modulus']
+        if modulus != ciphertext2['modulus']:
+            raise ValueError("Ciphertexts must be from the same key (same modulus n^(s+1))")
+        return {'c': gmpy2.mul(ciphertext1['c'], ciphertext2['c']) % modulus, 'modulus': modulus}
+
+    def multiply_scalar(self, ciphertext: Dict[str, Any], scalar: float) -> Dict[str, Any]:
+        """
+        Homomorphically multiplies a ciphertext by an integer scalar.
+        Enc(m)^k = Enc(k * m)
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext.
+            scalar (float): The scalar value. Must be an integer.
+
+        Returns:
+            Dict[str, Any]: The result of the multiplication (Enc(m * scalar)).
+        """
+        modulus = ciphertext['modulus']
+        return {'c': gmpy2.powmod(ciphertext['c'], as_integer(scalar, "scalar"), modulus), 'modulus': modulus}
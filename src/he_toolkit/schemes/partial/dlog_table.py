@@ -0,0 +1,89 @@
+import os
+import tempfile
+from typing import Iterable, List
+import numpy as np
+
+# One entry per baby step: the low 64 bits of the group element and its exponent.
+TABLE_DTYPE = np.dtype([('key', '<u8'), ('exponent', '<u4')])
+
+KEY_MASK = (1 << 64) - 1
+
+
+class DiscreteLogTable:
+    """
+    Baby-step table for baby-step giant-step discrete logarithms.
+
+    Maps a 64-bit key derived from each group element g^j (0 <= j < size) back to j.
+    Entries are sorted by key and stored as a packed 12-byte record array, so a
+    saved table can be memory-mapped by later processes and searched in place
+    without being loaded or rebuilt. Keys are truncated, so lookups return
+    candidate exponents that the caller must verify.
+    """
+
+    def __init__(self, entries: np.ndarray):
+        """
+        Args:
+            entries (np.ndarray): Record array of TABLE_DTYPE sorted by key (may be a memmap).
+        """
+        self.entries = entries
+        self.keys = entries['key']
+        self.exponents = entries['exponent']
+
+    @classmethod
+    def build(cls, keys: Iterable[int]) -> "DiscreteLogTable":
+        """
+        Builds a table from the keys of g^0, g^1, ..., g^(size-1) in order.
+        """
+        keys = np.fromiter(keys, dtype=np.uint64)
+        if len(keys) >= 2 ** 32:
+            raise ValueError("Table size must be below 2^32 entries")
+        order = np.argsort(keys, kind='stable')
+        entries = np.empty(len(keys), dtype=TABLE_DTYPE)
+        entries['key'] = keys[order]
+        entries['exponent'] = order
+        return cls(entries)
+
+    @classmethod
+    def load(cls, path: str) -> "DiscreteLogTable":
+        """
+        Memory-maps a table saved with save().
+        """
+        entries = np.load(path, mmap_mode='r')
+        if entries.dtype != TABLE_DTYPE:
+            raise ValueError(f"{path} is not a discrete log table")
+        return cls(entries)
+
+    def save(self, path: str) -> None:
+        """
+        Saves the table as a .npy file. The file is written to a temporary name and
+        renamed, so concurrent readers never see a partial table.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.npy.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.asarray(self.entries))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self.entries.nbytes
+
+    def lookup(self, key: int) -> List[int]:
+        """
+        Returns the exponents whose element key equals `key` (usually zero or one).
+        """
+        key = np.uint64(key)
+        index = int(np.searchsorted(self.keys, key))
+        matches = []
+        while index < len(self.keys) and self.keys[index] == key:
+            matches.append(int(self.exponents[index]))
+            index += 1
+        return matches
@@ -0,0 +1,471 @@
+import hashlib
+import os
+from math import isqrt
+from typing import Tuple, Any, Dict, List, Optional
+import gmpy2
+from gmpy2 import mpz
+from he_toolkit.interfaces import HEScheme
+from he_toolkit.schemes.partial import randomness
+from he_toolkit.schemes.partial.dlog_table import DiscreteLogTable, KEY_MASK
+from he_toolkit.schemes.partial.integers import as_integer
+
+# NIST P-256 (secp256r1): y^2 = x^3 - 3x + b over GF(P), generator G of prime order N.
+P = mpz(0xffffffff00000001000000000000000000000000ffffffffffffffffffffffff)
+B = mpz(0x5ac635d8aa3a93e7b3ebbd55769886bc651d06b0cc53b0f63bce3c3e27d2604b)
+N = mpz(0xffffffff00000000ffffffffffffffffbce6faada7179e84f3b9cac2fc632551)
+G = (mpz(0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296),
+     mpz(0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5))
+
+# Affine points are (x, y) tuples and the point at infinity is None.
+# Jacobian points are (X, Y, Z) tuples with x = X/Z^2, y = Y/Z^3; Z = 0 is infinity.
+INFINITY = (mpz(1), mpz(1), mpz(0))
+
+# Embedded encoding: x = m * 2^EMBED_BITS + t for the first t that lands on the curve.
+EMBED_BITS = 8
+MAX_EMBEDDED = (1 << (P.bit_length() - EMBED_BITS - 1)) - 1
+
+
+def _to_jacobian(point: Optional[Tuple[mpz, mpz]]) -> Tuple[mpz, mpz, mpz]:
+    return INFINITY if point is None else (point[0], point[1], mpz(1))
+
+
+def to_affine(point: Tuple[mpz, mpz, mpz]) -> Optional[Tuple[mpz, mpz]]:
+    """
+    Converts a Jacobian point to affine coordinates (one field inversion).
+    """
+    X, Y, Z = point
+    if Z == 0:
+        return None
+    z_inv = gmpy2.invert(Z, P)
+    z_inv2 = z_inv * z_inv % P
+    return (X * z_inv2 % P, Y * z_inv2 * z_inv % P)
+
+
+def _batch_to_affine(points: List[Tuple[mpz, mpz, mpz]]) -> List[Optional[Tuple[mpz, mpz]]]:
+    """
+    Converts many Jacobian points with a single inversion (Montgomery's trick).
+    """
+    prefix = []
+    acc = mpz(1)
+    for _, _, Z in points:
+        prefix.append(acc)
+        if Z != 0:
+            acc = acc * Z % P
+    inv = gmpy2.invert(acc, P)
+    result: List[Optional[Tuple[mpz, mpz]]] = [None] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        X, Y, Z = points[i]
+        if Z == 0:
+            continue
+        z_inv = inv * prefix[i] % P
+        inv = inv * Z % P
+        z_inv2 = z_inv * z_inv % P
+        result[i] = (X * z_inv2 % P, Y * z_inv2 * z_inv % P)
+    return result
+
+
+def point_double(point: Tuple[mpz, mpz, mpz]) -> Tuple[mpz, mpz, mpz]:
+    """
+    Doubles a Jacobian point (dbl-2001-b, using a = -3).
+    """
+    X, Y, Z = point
+    if Z == 0 or Y == 0:
+        return INFINITY
+    delta = Z * Z % P
+    gamma = Y * Y % P
+    beta = X * gamma % P
+    alpha = 3 * (X - delta) * (X + delta) % P
+    X3 = (alpha * alpha - 8 * beta) % P
+    Z3 = ((Y + Z) ** 2 - gamma - delta) % P
+    Y3 = (alpha * (4 * beta - X3) - 8 * gamma * gamma) % P
+    return (X3, Y3, Z3)
+
+
+def point_add_mixed(point: Tuple[mpz, mpz, mpz], affine: Optional[Tuple[mpz, mpz]]) -> Tuple[mpz, mpz, mpz]:
+    """
+    Adds an affine point to a Jacobian point (madd-2007-bl).
+    """
+    if affine is None:
+        return point
+    X1, Y1, Z1 = point
+    if Z1 == 0:
+        return (affine[0], affine[1], mpz(1))
+    x2, y2 = affine
+    Z1Z1 = Z1 * Z1 % P
+    U2 = x2 * Z1Z1 % P
+    S2 = y2 * Z1 * Z1Z1 % P
+    H = (U2 - X1) % P
+    r = 2 * (S2 - Y1) % P
+    if H == 0:
+        return point_double(point) if r == 0 else INFINITY
+    HH = H * H % P
+    I = 4 * HH % P
+    J = H * I % P
+    V = X1 * I % P
+    X3 = (r * r - J - 2 * V) % P
+    Y3 = (r * (V - X3) - 2 * Y1 * J) % P
+    Z3 = ((Z1 + H) ** 2 - Z1Z1 - HH) % P
+    return (X3, Y3, Z3)
+
+
+def point_negate(affine: Optional[Tuple[mpz, mpz]]) -> Optional[Tuple[mpz, mpz]]:
+    return None if affine is None else (affine[0], (-affine[1]) % P)
+
+
+def add_points(p1: Optional[Tuple[mpz, mpz]], p2: Optional[Tuple[mpz, mpz]]) -> Optional[Tuple[mpz, mpz]]:
+    """
+    Adds two affine points.
+    """
+    return to_affine(point_add_mixed(_to_jacobian(p1), p2))
+
+
+def scalar_mult(k: int, point: Optional[Tuple[mpz, mpz]], window: int = 4) -> Tuple[mpz, mpz, mpz]:
+    """
+    Variable-base scalar multiplication k * point with a fixed window.
+
+    Returns:
+        Tuple[mpz, mpz, mpz]: The Jacobian result.
+    """
+    k = mpz(k) % N
+    if k == 0 or point is None:
+        return INFINITY
+    # Precompute 1..2^w - 1 times the point in affine form.
+    multiples = [_to_jacobian(point)]
+    for _ in range(2, 1 << window):
+        multiples.append(point_add_mixed(multiples[-1], point))
+    table = [None] + _batch_to_affine(multiples)
+
+    acc = INFINITY
+    mask = (1 << window) - 1
+    for shift in range((k.bit_length() - 1) // window * window, -1, -window):
+        for _ in range(window):
+            acc = point_double(acc)
+        acc = point_add_mixed(acc, table[(k >> shift) & mask])
+    return acc
+
+
+class FixedBaseTable:
+    """
+    Precomputed multiples d * 2^(w*i) * base for fast scalar multiplication with a
+    fixed base (comb/windowed method): a 256-bit scalar then costs 256/w mixed
+    additions and no doublings.
+    """
+
+    def __init__(self, base: Tuple[mpz, mpz], window: int = 4):
+        self.window = window
+        digits = 1 << window
+        rows = []
+        row_base = _to_jacobian(base)
+        for _ in range(-(-N.bit_length() // window)):
+            base_affine = to_affine(row_base)
+            row = [_to_jacobian(base_affine)]
+            for _ in range(2, digits):
+                row.append(point_add_mixed(row[-1], base_affine))
+            rows.append(row)
+            row_base = point_add_mixed(row[-1], base_affine)  # 2^w * row base
+        flat = _batch_to_affine([point for row in rows for point in row])
+        self.rows = [[None] + flat[i * (digits - 1):(i + 1) * (digits - 1)] for i in range(len(rows))]
+
+    def mult(self, k: int) -> Tuple[mpz, mpz, mpz]:
+        """
+        Returns k * base as a Jacobian point.
+        """
+        k = mpz(k) % N
+        acc = INFINITY
+        mask = (1 << self.window) - 1
+        for row in self.rows:
+            if k == 0:
+                break
+            acc = point_add_mixed(acc, row[k & mask])
+            k >>= self.window
+        return acc
+
+
+_GENERATOR_TABLE: Optional[FixedBaseTable] = None
+
+
+def generator_table() -> FixedBaseTable:
+    """
+    Returns the shared fixed-base table for the generator G (built on first use).
+    """
+    global _GENERATOR_TABLE
+    if _GENERATOR_TABLE is None:
+        _GENERATOR_TABLE = FixedBaseTable(G)
+    return _GENERATOR_TABLE
+
+
+def point_key(affine: Optional[Tuple[mpz, mpz]]) -> int:
+    """
+    64-bit lookup key of an affine point: low 63 bits of x and the parity of y.
+    """
+    if affine is None:
+        return 0
+    return ((int(affine[0]) << 1) | int(affine[1] & 1)) & KEY_MASK
+
+
+def point_to_bytes(affine: Optional[Tuple[mpz, mpz]]) -> bytes:
+    """
+    SEC1 compressed encoding (33 bytes, or b'\\x00' for the point at infinity).
+    """
+    if affine is None:
+        return b'\x00'
+    return bytes([2 | int(affine[1] & 1)]) + int(affine[0]).to_bytes(32, 'big')
+
+
+def point_from_bytes(data: bytes) -> Optional[Tuple[mpz, mpz]]:
+    """
+    Decodes a SEC1 compressed point.
+    """
+    if data == b'\x00':
+        return None
+    x = mpz(int.from_bytes(data[1:33], 'big'))
+    y = _lift_x(x)
+    if y is None:
+        raise ValueError("Invalid point encoding")
+    if (y & 1) != (data[0] & 1):
+        y = P - y
+    return (x, y)
+
+
+def _lift_x(x: mpz) -> Optional[mpz]:
+    rhs = (x * x * x - 3 * x + B) % P
+    # P = 3 mod 4, so a square root is rhs^((P+1)/4).
+    y = gmpy2.powmod(rhs, (P + 1) // 4, P)
+    return y if y * y % P == rhs else None
+
+
+class ECElGamalScheme(HEScheme):
+    """
+    Implementation of Elliptic-Curve ElGamal over NIST P-256 using gmpy2 field
+    arithmetic in Jacobian coordinates.
+
+    Ciphertext = (C1, C2) = (r G, M + r H) with public key H = x G. Encryption only
+    multiplies the fixed points G and H, both through precomputed fixed-base tables.
+
+    Message encodings:
+    - "exponential" (default): M = m G, which makes the scheme ADDITIVE:
+      Enc(m1) + Enc(m2) = Enc(m1 + m2), k Enc(m) = Enc(k m). Decryption solves a
+      bounded discrete log with baby-step giant-step, so |m| <= max_message.
+    - "embedded": the message is the group element itself, as in ElGamalScheme; m is
+      placed in the x-coordinate of M (Koblitz encoding). Any 0 <= m <= MAX_EMBEDDED
+      decrypts directly, but the curve has no group operation that maps to an
+      arithmetic operation on the integers, so no homomorphic operation is offered.
+    """
+
+    def __init__(self, encoding: str = "exponential", max_message: int = 2 ** 20,
+                 table_size: Optional[int] = None, table_dir: Optional[str] = None):
+        """
+        Args:
+            encoding (str): "exponential" (additive) or "embedded".
+            max_message (int): Largest |m| decryption has to recover (exponential encoding).
+            table_size (Optional[int]): Baby steps for decryption (default sqrt(2 * max_message + 1)).
+            table_dir (Optional[str]): Directory where the baby-step table is cached. The table only
+                depends on the curve and its size, so it is shared by all keys.
+        """
+        if encoding not in ("exponential", "embedded"):
+            raise ValueError("encoding must be 'exponential' or 'embedded'")
+        self.encoding = encoding
+        self.max_message = max_message
+        self.table_size = table_size or isqrt(2 * max_message) + 1
+        self.table_dir = table_dir
+        self._table: Optional[DiscreteLogTable] = None
+        self._giant_step: Optional[Tuple[mpz, mpz]] = None
+        self._offset: Optional[Tuple[mpz, mpz]] = None
+        self._public_tables: Dict[Tuple[mpz, mpz], FixedBaseTable] = {}
+
+    def generate_keys(self, key_size: int = 256) -> Tuple[Any, Any]:
+        """
+        Generates a public/private key pair.
+
+        Args:
+            key_size (int): Must be 256 (the P-256 group order).
+
+        Returns:
+            Tuple[Any, Any]: (public_key, private_key)
+                public_key = H = x G as an affine point (x, y)
+                private_key = x
+        """
+        if key_size != 256:
+            raise ValueError("ECElGamalScheme only supports the 256-bit curve P-256")
+        x = randomness.random_range(1, N)
+        public_key = to_affine(generator_table().mult(x))
+        return public_key, x
+
+    def _public_table(self, public_key: Tuple[mpz, mpz]) -> FixedBaseTable:
+        table = self._public_tables.get(public_key)
+        if table is None:
+            table = self._public_tables[public_key] = FixedBaseTable(public_key)
+        return table
+
+    def encode(self, plaintext: float) -> Tuple[mpz, mpz, mpz]:
+        """
+        Maps a plaintext to the curve point M (Jacobian).
+        """
+        m = as_integer(plaintext)
+        if self.encoding == "exponential":
+            return generator_table().mult(m)
+        if not 0 <= m <= MAX_EMBEDDED:
+            raise ValueError(f"Embedded plaintexts must be in [0, {MAX_EMBEDDED}]")
+        for t in range(1 << EMBED_BITS):
+            x = mpz(m << EMBED_BITS | t)
+            y = _lift_x(x)
+            if y is not None:
+                return (x, y, mpz(1))
+        raise ValueError("Could not embed plaintext on the curve")
+
+    def encrypt(self, plaintext: float, public_key: Any) -> Dict[str, Any]:
+        """
+        Encrypts a plaintext value.
+        c = (C1, C2) = (r G, M + r H)
+
+        Args:
+            plaintext (float): The value to encrypt. Must be an integer.
+            public_key (Any): The public key H.
+
+        Returns:
+            Dict[str, Any]: The encrypted ciphertext {'c1': C1, 'c2': C2} with affine points.
+        """
+        r = randomness.random_range(1, N)
+        c1 = generator_table().mult(r)
+        shared = self._public_table(public_key).mult(r)
+        m_point = to_affine(self.encode(plaintext))
+        c1_affine, c2_affine = _batch_to_affine([c1, point_add_mixed(shared, m_point)])
+        return {'c1': c1_affine, 'c2': c2_affine}
+
+    def table_path(self) -> Optional[str]:
+        """
+        Returns the cache file of the baby-step table, or None without table_dir.
+        """
+        if self.table_dir is None:
+            return None
+        digest = hashlib.sha256(f"P-256:{self.table_size}".encode()).hexdigest()[:16]
+        return os.path.join(self.table_dir, f"ec_elgamal_bsgs_{digest}.npy")
+
+    def load_table(self) -> DiscreteLogTable:
+        """
+        Returns the baby-step table j G (0 <= j < table_size), memory-mapping the cached
+        file if it exists and otherwise building (and caching) it.
+        """
+        if self._table is not None:
+            return self._table
+        path = self.table_path()
+        if path is not None and os.path.exists(path):
+            self._table = DiscreteLogTable.load(path)
+            return self._table
+
+        steps = [INFINITY]
+        for _ in range(1, self.table_size):
+            steps.append(point_add_mixed(steps[-1], G))
+        self._table = DiscreteLogTable.build(point_key(point) for point in _batch_to_affine(steps))
+        if path is not None:
+            self._table.save(path)
+        return self._table
+
+    def _decrypt_point(self, ciphertext: Dict[str, Any], private_key: Any) -> Optional[Tuple[mpz, mpz]]:
+        """
+        Recovers M = C2 - x C1.
+        """
+        shared = to_affine(scalar_mult(private_key, ciphertext['c1']))
+        return add_points(ciphertext['c2'], point_negate(shared))
+
+    def decrypt(self, ciphertext: Dict[str, Any], private_key: Any) -> float:
+        """
+        Decrypts a ciphertext value. See decrypt_int for embedded messages above 2^53.
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext {'c1': C1, 'c2': C2}.
+            private_key (Any): The private key x.
+
+        Returns:
+            float: The decrypted plaintext.
+        """
+        return float(self.decrypt_int(ciphertext, private_key))
+
+    def decrypt_int(self, ciphertext: Dict[str, Any], private_key: Any) -> int:
+        """
+        Decrypts a ciphertext to the exact integer plaintext.
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext {'c1': C1, 'c2': C2}.
+            private_key (Any): The private key x.
+
+        Returns:
+            int: The decrypted plaintext.
+        """
+        m_point = self._decrypt_point(ciphertext, private_key)
+        if self.encoding == "embedded":
+            if m_point is None:
+                raise ValueError("Ciphertext does not decrypt to an embedded message")
+            return int(m_point[0] >> EMBED_BITS)
+
+        table = self.load_table()
+        fixed = generator_table()
+        if self._giant_step is None:
+            self._giant_step = point_negate(to_affine(fixed.mult(self.table_size)))
+            self._offset = to_affine(fixed.mult(self.max_message))
+        # Search k = m + max_message in [0, 2 * max_message] so negative values work too.
+        span = 2 * self.max_message
+        gamma = point_add_mixed(_to_jacobian(m_point), self._offset)
+        for i in range(span // self.table_size + 1):
+            gamma_affine = to_affine(gamma)
+            for j in table.lookup(point_key(gamma_affine)):
+                k = i * self.table_size + j
+                # Keys are truncated, so confirm the match on the full point.
+                if k <= span and to_affine(fixed.mult(j)) == gamma_affine:
+                    return int(k - self.max_message)
+            gamma = point_add_mixed(gamma, self._giant_step)
+        raise ValueError(f"Plaintext is outside the decryptable range [-{self.max_message}, {self.max_message}]")
+
+    def _require_exponential(self) -> None:
+        if self.encoding != "exponential":
+            raise NotImplementedError("Embedded EC-ElGamal messages have no homomorphic operations; "
+                                      "use the exponential encoding.")
+
+    def add(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Homomorphically adds two ciphertexts (exponential encoding).
+        (C1 + C1', C2 + C2') = Enc(m1 + m2)
+
+        Args:
+            ciphertext1 (Dict[str, Any]): The first ciphertext.
+            ciphertext2 (Dict[str, Any]): The second ciphertext.
+
+        Returns:
+            Dict[str, Any]: The result of the addition (Enc(m1 + m2)).
+        """
+        self._require_exponential()
+        c1, c2 = _batch_to_affine([
+            point_add_mixed(_to_jacobian(ciphertext1['c1']), ciphertext2['c1']),
+            point_add_mixed(_to_jacobian(ciphertext1['c2']), ciphertext2['c2']),
+        ])
+        return {'c1': c1, 'c2': c2}
+
+    def multiply_scalar(self, ciphertext: Dict[str, Any], scalar: float) -> Dict[str, Any]:
+        """
+        Homomorphically multiplies a ciphertext by an integer scalar (exponential encoding).
+        (k C1, k C2) = Enc(k m)
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext.
+            scalar (float): The scalar value. Must be an integer.
+
+        Returns:
+            Dict[str, Any]: The result of the multiplication (Enc(m * scalar)).
+        """
+        self._require_exponential()
+        k = as_integer(scalar, "scalar")
+        c1, c2 = _batch_to_affine([scalar_mult(k, ciphertext['c1']), scalar_mult(k, ciphertext['c2'])])
+        return {'c1': c1, 'c2': c2}
+
+    def multiply(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Any:
+        """
+        EC-ElGamal does NOT support multiplying two ciphertexts.
+        """
+        raise NotImplementedError("EC-ElGamal does not support homomorphic multiplication.")
+
+    @staticmethod
+    def ciphertext_bytes(ciphertext: Dict[str, Any]) -> bytes:
+        """
+        Compact encoding of a ciphertext: two SEC1 compressed points (66 bytes).
+        """
+        return point_to_bytes(ciphertext['c1']) + point_to_bytes(ciphertext['c2'])
@@ -1,7 +1,9 @@
-from typing import Tuple, Any, Dict
+from typing import Tuple, Any, Dict, List, Sequence
 import gmpy2
 from gmpy2 import mpz
 from he_toolkit.interfaces import HEScheme
+from he_toolkit.schemes.partial import randomness
+from he_toolkit.schemes.partial.integers import as_integer
 
 class ElGamalScheme(HEScheme):
     """
@@ -26,20 +28,14 @@ class ElGamalScheme(HEScheme):
                 public_key = (p, g, h) where h = g^x mod p
                 private_key = (p, x)
         """
-        rs = gmpy2.random_state()
-        
         # Generate prime p
-        p = gmpy2.next_prime(gmpy2.mpz_urandomb(rs, key_size))
+        p = gmpy2.next_prime(randomness.random_bits(key_size))
         
         # Generate generator g
-        g = gmpy2.mpz_urandomb(rs, key_size) % p
-        while g <= 1:
-             g = gmpy2.mpz_urandomb(rs, key_size) % p
+        g = randomness.random_range(2, p)
 
         # Generate private key x
-        x = gmpy2.mpz_urandomb(rs, key_size - 1) % (p - 1)
-        while x <= 1:
-            x = gmpy2.mpz_urandomb(rs, key_size - 1) % (p - 1)
+        x = randomness.random_range(2, p - 1)
 
         # Compute public parameter h = g^x mod p
         h = gmpy2.powmod(g, x, p)
@@ -61,12 +57,27 @@ class ElGamalScheme(HEScheme):
         Returns:
             Dict[str, Any]: The encrypted ciphertext {'c1': c1, 'c2': c2, 'p': p}.
         """
+        r = randomness.random_below(public_key[0] - 1)
+        return self._encrypt_with_nonce(plaintext, r, public_key)
+
+    def encrypt_batch(self, plaintexts: Sequence[float], public_key: Any) -> List[Dict[str, Any]]:
+        """
+        Encrypts many plaintexts, drawing all nonces with a single randomness read.
+
+        Args:
+            plaintexts (Sequence[float]): The values to encrypt. Must be integers.
+            public_key (Any): The public key (p, g, h).
+
+        Returns:
+            List[Dict[str, Any]]: One ciphertext per plaintext.
+        """
+        nonces = randomness.random_below_many(public_key[0] - 1, len(plaintexts))
+        return [self._encrypt_with_nonce(m, r, public_key) for m, r in zip(plaintexts, nonces)]
+
+    def _encrypt_with_nonce(self, plaintext: float, r: mpz, public_key: Any) -> Dict[str, Any]:
         p, g, h = public_key
-        m = int(plaintext)
-        
-        rs = gmpy2.random_state()
-        r = gmpy2.mpz_urandomb(rs, p.bit_length() - 1) % (p - 1)
-        
+        m = as_integer(plaintext)
+
         # c1 = g^r
         c1 = gmpy2.powmod(g, r, p)
         
@@ -90,7 +101,13 @@ class ElGamalScheme(HEScheme):
         Returns:
             float: The decrypted plaintext.
         """
-        p, x = private_key
+        return float(self._decrypt_element(ciphertext, private_key))
+
+    def _decrypt_element(self, ciphertext: Dict[str, Any], private_key: Any) -> mpz:
+        """
+        Recovers the encrypted group element m = c2 * (c1^x)^(-1) mod p.
+        """
+        p, x = private_key[:2]
         c1 = ciphertext['c1']
         c2 = ciphertext['c2']
         
@@ -101,9 +118,7 @@ class ElGamalScheme(HEScheme):
         s_inv = gmpy2.invert(s, p)
         
         # m = c2 * s_inv mod p
-        m = gmpy2.mul(c2, s_inv) % p
-        
-        return float(m)
+        return gmpy2.mul(c2, s_inv) % p
 
     def add(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Any:
         """
@@ -0,0 +1,184 @@
+import hashlib
+import os
+from math import isqrt
+from typing import Tuple, Any, Dict, List, Optional, Sequence
+import gmpy2
+from gmpy2 import mpz
+from he_toolkit.schemes.partial.elgamal import ElGamalScheme
+from he_toolkit.schemes.partial.dlog_table import DiscreteLogTable, KEY_MASK
+from he_toolkit.schemes.partial.integers import as_integer
+
+
+class ExponentialElGamalScheme(ElGamalScheme):
+    """
+    Implementation of Exponential (additive) ElGamal using gmpy2.
+    Messages are encrypted in the exponent, Enc(m) = (g^r, g^m h^r), which turns the
+    multiplicative homomorphism of ElGamal into an ADDITIVE one.
+
+    Properties:
+    - Enc(m1) * Enc(m2) = Enc(m1 + m2), Enc(m)^k = Enc(k * m).
+    - Decryption recovers g^m and solves a bounded discrete logarithm, so plaintexts
+      must be integers with |m| <= max_message (e.g. quantized control signals).
+    - The discrete log is solved with baby-step giant-step. The baby-step table only
+      depends on (p, g, table_size); with `table_dir` set it is saved once and then
+      memory-mapped by every later process using the same key.
+    - Ciphertext-ciphertext multiplication is NOT supported.
+    """
+
+    def __init__(self, max_message: int = 2 ** 20, table_size: Optional[int] = None,
+                 table_dir: Optional[str] = None):
+        """
+        Args:
+            max_message (int): Largest |m| decryption has to recover.
+            table_size (Optional[int]): Number of baby steps. Defaults to sqrt(2 * max_message + 1),
+                which balances table size against the number of giant steps.
+            table_dir (Optional[str]): Directory where baby-step tables are cached. None keeps
+                the table in memory only.
+        """
+        self.max_message = max_message
+        self.table_size = table_size or isqrt(2 * max_message) + 1
+        self.table_dir = table_dir
+        self._tables: Dict[Tuple[int, int], Tuple[DiscreteLogTable, mpz]] = {}
+
+    def generate_keys(self, key_size: int = 2048) -> Tuple[Any, Any]:
+        """
+        Generates a public/private key pair.
+
+        Args:
+            key_size (int): The size of the prime p in bits.
+
+        Returns:
+            Tuple[Any, Any]: (public_key, private_key)
+                public_key = (p, g, h) where h = g^x mod p
+                private_key = (p, x, g); g is needed to solve the discrete log.
+        """
+        public_key, (p, x) = super().generate_keys(key_size)
+        return public_key, (p, x, public_key[1])
+
+    def encrypt(self, plaintext: float, public_key: Any) -> Dict[str, Any]:
+        """
+        Encrypts a plaintext value in the exponent.
+        c = (c1, c2) = (g^r, g^m * h^r)
+
+        Args:
+            plaintext (float): The value to encrypt. Must be an integer with |m| <= max_message.
+            public_key (Any): The public key (p, g, h).
+
+        Returns:
+            Dict[str, Any]: The encrypted ciphertext {'c1': c1, 'c2': c2, 'p': p}.
+        """
+        p, g, _ = public_key
+        return super().encrypt(gmpy2.powmod(g, as_integer(plaintext), p), public_key)
+
+    def encrypt_batch(self, plaintexts: Sequence[float], public_key: Any) -> List[Dict[str, Any]]:
+        """
+        Encrypts many plaintexts in the exponent, drawing all nonces at once.
+        """
+        p, g, _ = public_key
+        return super().encrypt_batch([gmpy2.powmod(g, as_integer(m), p) for m in plaintexts], public_key)
+
+    def table_path(self, p: mpz, g: mpz) -> Optional[str]:
+        """
+        Returns the cache file of the baby-step table for (p, g), or None without table_dir.
+        """
+        if self.table_dir is None:
+            return None
+        digest = hashlib.sha256(f"{p}:{g}:{self.table_size}".encode()).hexdigest()[:16]
+        return os.path.join(self.table_dir, f"exp_elgamal_bsgs_{digest}.npy")
+
+    def build_table(self, p: mpz, g: mpz) -> DiscreteLogTable:
+        """
+        Computes the baby steps g^0 ... g^(table_size - 1).
+        """
+        def keys():
+            element = mpz(1)
+            for _ in range(self.table_size):
+                yield int(element & KEY_MASK)
+                element = gmpy2.mul(element, g) % p
+
+        return DiscreteLogTable.build(keys())
+
+    def load_table(self, p: mpz, g: mpz) -> DiscreteLogTable:
+        """
+        Returns the baby-step table for (p, g), memory-mapping the cached file if it
+        exists and otherwise building (and caching) it.
+        """
+        cached = self._tables.get((p, g))
+        if cached is not None:
+            return cached[0]
+
+        path = self.table_path(p, g)
+        if path is not None and os.path.exists(path):
+            table = DiscreteLogTable.load(path)
+        else:
+            table = self.build_table(p, g)
+            if path is not None:
+                table.save(path)
+        # Giant step: multiply by g^(-table_size).
+        giant_step = gmpy2.invert(gmpy2.powmod(g, self.table_size, p), p)
+        self._tables[(p, g)] = (table, giant_step)
+        return table
+
+    def decrypt(self, ciphertext: Dict[str, Any], private_key: Any) -> float:
+        """
+        Decrypts a ciphertext value: recovers g^m and solves for m with baby-step giant-step.
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext {'c1': c1, 'c2': c2, 'p': p}.
+            private_key (Any): The private key (p, x, g).
+
+        Returns:
+            float: The decrypted plaintext.
+        """
+        p, _, g = private_key
+        table = self.load_table(p, g)
+        _, giant_step = self._tables[(p, g)]
+
+        # Search k = m + max_message in [0, 2 * max_message] so negative values work too.
+        span = 2 * self.max_message
+        gamma = gmpy2.mul(self._decrypt_element(ciphertext, private_key),
+                          gmpy2.powmod(g, self.max_message, p)) % p
+        for i in range(span // self.table_size + 1):
+            for j in table.lookup(int(gamma & KEY_MASK)):
+                k = i * self.table_size + j
+                # Keys are truncated to 64 bits, so confirm the match on the full element.
+                if k <= span and gmpy2.powmod(g, j, p) == gamma:
+                    return float(k - self.max_message)
+            gamma = gmpy2.mul(gamma, giant_step) % p
+        raise ValueError(f"Plaintext is outside the decryptable range [-{self.max_message}, {self.max_message}]")
+
+    def add(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Homomorphically adds two ciphertexts.
+        Enc(m1) * Enc(m2) = (g^(r1+r2), g^(m1+m2) h^(r1+r2)) = Enc(m1 + m2)
+
+        Args:
+            ciphertext1 (Dict[str, Any]): The first ciphertext.
+            ciphertext2 (Dict[str, Any]): The second ciphertext.
+
+        Returns:
+            Dict[str, Any]: The result of the addition (Enc(m1 + m2)).
+        """
+        return super().multiply(ciphertext1, ciphertext2)
+
+    def multiply_scalar(self, ciphertext: Dict[str, Any], scalar: float) -> Dict[str, Any]:
+        """
+        Homomorphically multiplies a ciphertext by an integer scalar.
+        Enc(m)^k = (g^(rk), g^(mk) h^(rk)) = Enc(k * m)
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext.
+            scalar (float): The scalar value. Must be an integer.
+
+        Returns:
+            Dict[str, Any]: The result of the multiplication (Enc(m * scalar)).
+        """
+        p = ciphertext['p']
+        k = as_integer(scalar, "scalar")
+        return {'c1': gmpy2.powmod(ciphertext['c1'], k, p), 'c2': gmpy2.powmod(ciphertext['c2'], k, p), 'p': p}
+
+    def multiply(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Any:
+        """
+        Exponential ElGamal does NOT support multiplying two ciphertexts.
+        """
+        raise NotImplementedError("Exponential ElGamal does not support homomorphic multiplication.")
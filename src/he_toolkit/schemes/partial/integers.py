@@ -0,0 +1,25 @@
+"""
+Integer plaintexts for the gmpy2 schemes.
+
+Damgard-Jurik, RSA and the ElGamal variants work on integers. Floats are accepted
+only when they hold an integral value (e.g. 3.0); anything else raises ValueError
+instead of being truncated, so quantize control signals explicitly before
+encrypting.
+"""
+import numbers
+from typing import Any
+from gmpy2 import mpz
+
+
+def as_integer(value: Any, name: str = "plaintext") -> int:
+    """
+    Converts an integral value (int, mpz, NumPy integer or integral float) to int.
+
+    Raises:
+        ValueError: If the value has a fractional part or is not a number.
+    """
+    if isinstance(value, (numbers.Integral, type(mpz(0)))):
+        return int(value)
+    if isinstance(value, numbers.Real) and float(value).is_integer():
+        return int(value)
+    raise ValueError(f"The {name} must be an integer, got {value!r}; scale and round it first")
@@ -0,0 +1,112 @@
+"""
+Shared cryptographic randomness for the partial schemes.
+
+All keys and nonces come from os.urandom. Each thread keeps a small buffer of
+urandom bytes so that a nonce costs a slice instead of a system call, and batched
+encryption draws all of its nonces with a single read.
+
+The buffers are discarded in the child after os.fork (os.register_at_fork), so
+process-pool workers never reuse bytes their parent had already buffered.
+
+Uniform values below a bound are taken from EXTRA_BITS more random bits than the
+bound has, reduced modulo the bound; the bias is below 2^-EXTRA_BITS.
+"""
+import os
+import threading
+from typing import List
+import gmpy2
+from gmpy2 import mpz
+
+# Bytes fetched from os.urandom per buffer refill.
+BUFFER_SIZE = 4096
+EXTRA_BITS = 64
+
+_local = threading.local()
+_generation = 0
+
+
+def _after_fork_in_child() -> None:
+    global _generation
+    _generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def random_bytes(count: int) -> bytes:
+    """
+    Returns `count` bytes from the calling thread's urandom buffer.
+    """
+    if count >= BUFFER_SIZE:
+        return os.urandom(count)
+    if getattr(_local, "generation", None) != _generation:
+        _local.generation = _generation
+        _local.buffer = b""
+        _local.position = 0
+    position = _local.position
+    if position + count > len(_local.buffer):
+        _local.buffer = os.urandom(BUFFER_SIZE)
+        position = 0
+    _local.position = position + count
+    return _local.buffer[position:position + count]
+
+
+def random_bits(bits: int) -> mpz:
+    """
+    Returns a uniform integer in [0, 2^bits).
+    """
+    value = mpz.from_bytes(random_bytes((bits + 7) // 8), "big")
+    return value >> (-bits % 8)
+
+
+def _width(bound: int) -> int:
+    return (int(bound).bit_length() + EXTRA_BITS + 7) // 8
+
+
+def random_below(bound: int) -> mpz:
+    """
+    Returns a uniform integer in [0, bound).
+    """
+    return mpz.from_bytes(random_bytes(_width(bound)), "big") % bound
+
+
+def random_range(low: int, high: int) -> mpz:
+    """
+    Returns a uniform integer in [low, high).
+    """
+    return low + random_below(high - low)
+
+
+def random_below_many(bound: int, count: int) -> List[mpz]:
+    """
+    Returns `count` uniform integers in [0, bound) drawn with a single read.
+    """
+    width = _width(bound)
+    data = memoryview(random_bytes(width * count))
+    return [mpz.from_bytes(data[i:i + width], "big") % bound for i in range(0, width * count, width)]
+
+
+def random_range_many(low: int, high: int, count: int) -> List[mpz]:
+    """
+    Returns `count` uniform integers in [low, high) drawn with a single read.
+    """
+    return [low + r for r in random_below_many(high - low, count)]
+
+
+def random_unit(n: int) -> mpz:
+    """
+    Returns a uniform element of the multiplicative group modulo n.
+    """
+    r = random_below(n)
+    while r == 0 or gmpy2.gcd(r, n) != 1:
+        r = random_below(n)
+    return r
+
+
+def random_prime(bits: int) -> mpz:
+    """
+    Returns a random prime of exactly `bits` bits. Setting the two top bits keeps
+    the product of two such primes at the full size.
+    """
+    return gmpy2.next_prime(random_bits(bits) | (mpz(3) << (bits - 2)))
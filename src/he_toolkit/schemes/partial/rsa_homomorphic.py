@@ -0,0 +1,181 @@
+from typing import Tuple, Any, Dict, List, Sequence
+import gmpy2
+from gmpy2 import mpz
+from he_toolkit.interfaces import HEScheme
+from he_toolkit.schemes.partial.randomness import random_prime
+from he_toolkit.schemes.partial.integers import as_integer
+
+PUBLIC_EXPONENT = 65537
+
+
+class RSAScheme(HEScheme):
+    """
+    Implementation of unpadded (textbook) RSA using gmpy2.
+    This scheme supports MULTIPLICATIVE homomorphism.
+
+    Properties:
+    - Enc(m1) * Enc(m2) = Enc(m1 * m2) mod n, Enc(m) * k^e = Enc(k * m).
+    - Encryption is a single exponentiation with e = 65537; decryption uses CRT with
+      precomputed d_p, d_q and q_inv (about 4x faster than c^d mod n).
+    - Plaintexts are integers modulo n; values above n / 2 decode as negative numbers.
+    - Encryption is deterministic and unpadded, so it is NOT semantically secure. It
+      is included as the cheapest multiplicative baseline.
+    - Additive homomorphism is NOT supported.
+    """
+
+    def generate_keys(self, key_size: int = 2048) -> Tuple[Any, Any]:
+        """
+        Generates a public/private key pair.
+
+        Args:
+            key_size (int): The size of the modulus n in bits.
+
+        Returns:
+            Tuple[Any, Any]: (public_key, private_key)
+                public_key = (n, e)
+                private_key = (n, p, q, d_p, d_q, q_inv) with d_p = d mod (p-1),
+                d_q = d mod (q-1) and q_inv = q^(-1) mod p, for CRT decryption.
+        """
+        e = mpz(PUBLIC_EXPONENT)
+        while True:
+            p = random_prime(key_size // 2)
+            q = random_prime(key_size - key_size // 2)
+            if p != q and gmpy2.gcd(e, (p - 1) * (q - 1)) == 1:
+                break
+
+        n = p * q
+        d = gmpy2.invert(e, gmpy2.lcm(p - 1, q - 1))
+        public_key = (n, e)
+        private_key = (n, p, q, d % (p - 1), d % (q - 1), gmpy2.invert(q, p))
+        return public_key, private_key
+
+    def encrypt(self, plaintext: float, public_key: Any) -> Dict[str, Any]:
+        """
+        Encrypts a plaintext value.
+        c = m^e mod n
+
+        Args:
+            plaintext (float): The value to encrypt. Must be an integer.
+            public_key (Any): The public key (n, e).
+
+        Returns:
+            Dict[str, Any]: The encrypted ciphertext {'c': c, 'n': n}.
+        """
+        n, e = public_key
+        return {'c': gmpy2.powmod(mpz(as_integer(plaintext)) % n, e, n), 'n': n}
+
+    def decrypt_int(self, ciphertext: Dict[str, Any], private_key: Any) -> int:
+        """
+        Decrypts a ciphertext to an exact integer with CRT.
+        m_p = c^d_p mod p, m_q = c^d_q mod q, m = m_q + q * (q_inv (m_p - m_q) mod p)
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext {'c': c, 'n': n}.
+            private_key (Any): The private key (n, p, q, d_p, d_q, q_inv).
+
+        Returns:
+            int: The decrypted plaintext, centered to (-n/2, n/2].
+        """
+        n, p, q, d_p, d_q, q_inv = private_key
+        c = ciphertext['c']
+        m_p = gmpy2.powmod(c, d_p, p)
+        m_q = gmpy2.powmod(c, d_q, q)
+        m = m_q + q * (gmpy2.mul(q_inv, m_p - m_q) % p)
+        return int(m - n if m > n // 2 else m)
+
+    def decrypt(self, ciphertext: Dict[str, Any], private_key: Any) -> float:
+        """
+        Decrypts a ciphertext value.
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext {'c': c, 'n': n}.
+            private_key (Any): The private key (n, p, q, d_p, d_q, q_inv).
+
+        Returns:
+            float: The decrypted plaintext.
+        """
+        return float(self.decrypt_int(ciphertext, private_key))
+
+    def decrypt_batch(self, ciphertexts: Sequence[Dict[str, Any]], private_key: Any) -> List[float]:
+        """
+        Decrypts many ciphertexts under one key, unpacking the CRT parameters once.
+
+        Args:
+            ciphertexts (Sequence[Dict[str, Any]]): The ciphertexts.
+            private_key (Any): The private key (n, p, q, d_p, d_q, q_inv).
+
+        Returns:
+            List[float]: The decrypted plaintexts.
+        """
+        n, p, q, d_p, d_q, q_inv = private_key
+        half = n // 2
+        powmod, mul = gmpy2.powmod, gmpy2.mul
+        results = []
+        for ciphertext in ciphertexts:
+            c = ciphertext['c']
+            m_p = powmod(c, d_p, p)
+            m_q = powmod(c, d_q, q)
+            m = m_q + q * (mul(q_inv, m_p - m_q) % p)
+            results.append(float(m - n if m > half else m))
+        return results
+
+    def add(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Any:
+        """
+        RSA does NOT support additive homomorphism.
+        """
+        raise NotImplementedError("RSA does not support homomorphic addition.")
+
+    def multiply_scalar(self, ciphertext: Dict[str, Any], scalar: float) -> Dict[str, Any]:
+        """
+        Homomorphically multiplies a ciphertext by an integer scalar.
+        Enc(m) * k^e = (m k)^e = Enc(k * m)
+
+        Args:
+            ciphertext (Dict[str, Any]): The ciphertext.
+            scalar (float): The scalar value. Must be an integer.
+
+        Returns:
+            Dict[str, Any]: The result of the multiplication (Enc(m * scalar)).
+        """
+        n = ciphertext['n']
+        k = gmpy2.powmod(mpz(as_integer(scalar, "scalar")) % n, PUBLIC_EXPONENT, n)
+        return {'c': gmpy2.mul(ciphertext['c'], k) % n, 'n': n}
+
+    def multiply(self, ciphertext1: Dict[str, Any], ciphertext2: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Homomorphically multiplies two ciphertexts.
+        Enc(m1) * Enc(m2) = m1^e m2^e = (m1 m2)^e = Enc(m1 * m2)
+
+        Args:
+            ciphertext1 (Dict[str, Any]): The first ciphertext.
+            ciphertext2 (Dict[str, Any]): The second ciphertext.
+
+        Returns:
+            Dict[str, Any]: The result of the multiplication.
+        """
+        n = ciphertext1['n']
+        if n != ciphertext2['n']:
+            raise ValueError("Ciphertexts must be from the same key (same modulus n)")
+        return {'c': gmpy2.mul(ciphertext1['c'], ciphertext2['c']) % n, 'n': n}
+
+    def multiply_batch(self, ciphertexts1: Sequence[Dict[str, Any]],
+                       ciphertexts2: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Element-wise homomorphic multiplication of two ciphertext vectors.
+
+        Args:
+            ciphertexts1 (Sequence[Dict[str, Any]]): The first ciphertexts.
+            ciphertexts2 (Sequence[Dict[str, Any]]): The second ciphertexts (same length).
+
+        Returns:
+            List[Dict[str, Any]]: Enc(m1_i * m2_i) for every i.
+        """
+        if len(ciphertexts1) != len(ciphertexts2):
+            raise ValueError("Ciphertext vectors must have the same length")
+        if not ciphertexts1:
+            return []
+        n = ciphertexts1[0]['n']
+        if any(c['n'] != n for c in ciphertexts1) or any(c['n'] != n for c in ciphertexts2):
+            raise ValueError("Ciphertexts must be from the same key (same modulus n)")
+        mul = gmpy2.mul
+        return [{'c': mul(a['c'], b['c']) % n, 'n': n} for a, b in zip(ciphertexts1, ciphertexts2)]
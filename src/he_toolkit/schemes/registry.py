@@ -0,0 +1,161 @@
+"""
+Registry of the available schemes, imported lazily by name.
+
+Schemes are registered as "package.module:ClassName" strings together with their
+capabilities, so listing schemes or querying capabilities imports nothing, and
+get_scheme("paillier") imports only the Paillier module. In particular, processes
+that never ask for an OpenFHE scheme never load the OpenFHE native library.
+
+Other packages can add schemes through the "he_toolkit.schemes" entry point group:
+
+    [project.entry-points."he_toolkit.schemes"]
+    my_scheme = "my_package.module:MyScheme"
+
+Entry points are discovered on first use. Their capabilities are read from a
+`CAPABILITIES` class attribute (a Capabilities), so they are only known once the
+class has been imported.
+"""
+import importlib
+from importlib import metadata
+from typing import Any, Dict, List, NamedTuple, Optional
+
+ENTRY_POINT_GROUP = "he_toolkit.schemes"
+
+
+class Capabilities(NamedTuple):
+    """
+    Homomorphic operations a scheme supports.
+
+    Attributes:
+        additive (bool): add / multiply_scalar on ciphertexts.
+        multiplicative (bool): multiply of two ciphertexts.
+        boolean (bool): Encrypted logic gates (eval_and, eval_xor, ...).
+        simd (bool): Packs batch_size slots per ciphertext (see streaming.slot_count).
+        bootstrapping (bool): Can refresh ciphertexts for unbounded depth.
+    """
+    additive: bool = False
+    multiplicative: bool = False
+    boolean: bool = False
+    simd: bool = False
+    bootstrapping: bool = False
+
+
+class SchemeInfo(NamedTuple):
+    name: str
+    target: str
+    capabilities: Optional[Capabilities]
+    entry_point: Optional[metadata.EntryPoint] = None
+
+
+_registry: Dict[str, SchemeInfo] = {}
+_classes: Dict[str, type] = {}
+_entry_points_loaded = False
+
+
+def register(name: str, target: str, capabilities: Optional[Capabilities] = None) -> None:
+    """
+    Registers (or replaces) a scheme.
+
+    Args:
+        name (str): Name used with get_scheme.
+        target (str): "package.module:ClassName", imported on first use.
+        capabilities (Optional[Capabilities]): Supported operations (default: the
+            class's CAPABILITIES attribute, read when it is imported).
+    """
+    _registry[name] = SchemeInfo(name, target, capabilities)
+    _classes.pop(name, None)
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+        # Built-in and explicitly registered schemes take precedence.
+        if entry_point.name not in _registry:
+            _registry[entry_point.name] = SchemeInfo(entry_point.name, entry_point.value, None, entry_point)
+
+
+def _info(name: str) -> SchemeInfo:
+    if name not in _registry:
+        _load_entry_points()
+    if name not in _registry:
+        raise ValueError(f"Unknown scheme '{name}'. Available: {', '.join(available_schemes())}")
+    return _registry[name]
+
+
+def available_schemes() -> List[str]:
+    """
+    Returns the names of all registered schemes (built-in and entry points).
+    """
+    _load_entry_points()
+    return sorted(_registry)
+
+
+def get_scheme_class(name: str) -> type:
+    """
+    Imports and returns the class of a registered scheme.
+    """
+    if name not in _classes:
+        info = _info(name)
+        if info.entry_point is not None:
+            # EntryPoint.load also resolves values such as "pkg.module:Outer.Inner".
+            _classes[name] = info.entry_point.load()
+        else:
+            module_name, class_name = info.target.split(":")
+            _classes[name] = getattr(importlib.import_module(module_name), class_name)
+    return _classes[name]
+
+
+def get_scheme(name: str, **params: Any) -> Any:
+    """
+    Instantiates a registered scheme, importing its backend on first use.
+
+    Args:
+        name (str): Registered scheme name, e.g. "paillier" or "ckks".
+        **params: Constructor arguments (e.g. num_threads for the OpenFHE wrappers).
+
+    Returns:
+        Any: The scheme instance.
+    """
+    return get_scheme_class(name)(**params)
+
+
+def capabilities(name: str) -> Capabilities:
+    """
+    Returns the capabilities of a registered scheme. Built-in schemes are answered
+    without importing them.
+    """
+    info = _info(name)
+    if info.capabilities is not None:
+        return info.capabilities
+    return getattr(get_scheme_class(name), "CAPABILITIES", Capabilities())
+
+
+def schemes_with(**required: bool) -> List[str]:
+    """
+    Returns the registered schemes whose capabilities match all given flags,
+    e.g. schemes_with(additive=True, simd=True).
+    """
+    for flag in required:
+        if flag not in Capabilities._fields:
+            raise ValueError(f"Unknown capability '{flag}'")
+    return [name for name in available_schemes()
+            if all(getattr(capabilities(name), flag) == value for flag, value in required.items())]
+
+
+_PARTIAL = "he_toolkit.schemes.partial"
+_OPENFHE = "he_toolkit.schemes.openfhe_wrappers"
+
+register("paillier", f"{_PARTIAL}.paillier:PaillierScheme", Capabilities(additive=True))
+register("elgamal", f"{_PARTIAL}.elgamal:ElGamalScheme", Capabilities(multiplicative=True))
+register("exp_elgamal", f"{_PARTIAL}.exp_elgamal:ExponentialElGamalScheme", Capabilities(additive=True))
+register("ec_elgamal", f"{_PARTIAL}.ec_elgamal:ECElGamalScheme", Capabilities(additive=True))
+register("damgard_jurik", f"{_PARTIAL}.damgard_jurik:DamgardJurikScheme", Capabilities(additive=True))
+register("rsa", f"{_PARTIAL}.rsa_homomorphic:RSAScheme", Capabilities(multiplicative=True))
+register("bfv", f"{_OPENFHE}.bfv_wrapper:BFVScheme", Capabilities(additive=True, multiplicative=True, simd=True))
+register("bgv", f"{_OPENFHE}.bgv_wrapper:BGVScheme", Capabilities(additive=True, multiplicative=True, simd=True))
+register("ckks", f"{_OPENFHE}.ckks_wrapper:CKKSScheme",
+         Capabilities(additive=True, multiplicative=True, simd=True, bootstrapping=True))
+register("tfhe", f"{_OPENFHE}.tfhe_wrapper:TFHEScheme", Capabilities(boolean=True, bootstrapping=True))
@@ -0,0 +1,295 @@
+"""
+Fixed-width binary ciphertext encodings and memory-mapped ciphertext stores.
+
+Every ciphertext of a given key has the same encoded size: big-endian integers
+padded to the byte length of their modulus. A codec turns ciphertexts into
+records of `record_size` bytes and back; decoding reads straight from a buffer
+(bytes, memoryview or mmap) without intermediate copies.
+
+Codecs are created from the public key, which carries everything shared by all
+ciphertexts (the modulus, the python-paillier key object). Nothing per ciphertext
+is repeated, unlike pickle, which embeds the key in every EncryptedNumber.
+
+CiphertextStore keeps a large encrypted dataset in a single file:
+
+    16-byte header: magic b"HEC1", record size (uint32 LE), record count (uint64 LE)
+    count * record_size bytes of records
+
+Opened stores are memory-mapped, so any record can be read without loading the
+rest of the file.
+"""
+import os
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator, List, Union
+import numpy as np
+from gmpy2 import mpz
+from phe import paillier
+from he_toolkit.schemes.partial import ec_elgamal
+from he_toolkit.schemes.partial.damgard_jurik import DamgardJurikScheme
+from he_toolkit.schemes.partial.elgamal import ElGamalScheme
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+from he_toolkit.schemes.partial.rsa_homomorphic import RSAScheme
+
+MAGIC = b"HEC1"
+HEADER = struct.Struct("<4sIQ")
+
+
+def _width(modulus: Any) -> int:
+    return (int(modulus).bit_length() + 7) // 8
+
+
+def _to_bytes(value: Any, width: int) -> bytes:
+    return mpz(value).to_bytes(width, "big")
+
+
+def _from_bytes(buffer: Any) -> mpz:
+    return mpz.from_bytes(buffer, "big")
+
+
+class FixedWidthCodec(ABC):
+    """
+    Abstract base class of the fixed-width codecs. Subclasses set `record_size`
+    and implement encode() and decode().
+    """
+    record_size = 0
+
+    @abstractmethod
+    def encode(self, ciphertext: Any) -> bytes:
+        """
+        Encodes one ciphertext.
+
+        Args:
+            ciphertext (Any): The ciphertext to encode.
+
+        Returns:
+            bytes: A record of exactly `record_size` bytes.
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, buffer: Any) -> Any:
+        """
+        Decodes one record.
+
+        Args:
+            buffer (Any): A bytes-like object of `record_size` bytes.
+
+        Returns:
+            Any: The ciphertext.
+        """
+        pass
+
+    def encode_many(self, ciphertexts: Iterable[Any]) -> bytes:
+        """
+        Concatenates the records of many ciphertexts.
+        """
+        return b"".join(self.encode(ciphertext) for ciphertext in ciphertexts)
+
+    def decode_many(self, buffer: Any) -> List[Any]:
+        """
+        Decodes a buffer of concatenated records.
+        """
+        if isinstance(buffer, np.ndarray):
+            buffer = np.ascontiguousarray(buffer)
+        view = memoryview(buffer).cast("B")
+        size = self.record_size
+        if len(view) % size:
+            raise ValueError(f"Buffer length {len(view)} is not a multiple of the record size {size}")
+        return [self.decode(view[offset:offset + size]) for offset in range(0, len(view), size)]
+
+
+class PaillierCodec(FixedWidthCodec):
+    """
+    python-paillier EncryptedNumber: ciphertext modulo n^2 followed by the signed
+    32-bit exponent of its fixed-point encoding.
+    """
+
+    def __init__(self, public_key: paillier.PaillierPublicKey):
+        self.public_key = public_key
+        self.width = _width(public_key.nsquare)
+        self.record_size = self.width + 4
+
+    def encode(self, ciphertext: paillier.EncryptedNumber) -> bytes:
+        # ciphertext() applies the pending obfuscation, as phe does before sending.
+        return _to_bytes(ciphertext.ciphertext(), self.width) + ciphertext.exponent.to_bytes(4, "big", signed=True)
+
+    def decode(self, buffer: Any) -> paillier.EncryptedNumber:
+        width = self.width
+        exponent = int.from_bytes(buffer[width:width + 4], "big", signed=True)
+        return paillier.EncryptedNumber(self.public_key, int(_from_bytes(buffer[:width])), exponent)
+
+
+class ElGamalCodec(FixedWidthCodec):
+    """
+    ElGamal and Exponential ElGamal ciphertexts {'c1', 'c2', 'p'}: c1 || c2.
+    """
+
+    def __init__(self, public_key: Any):
+        self.p = public_key[0]
+        self.width = _width(self.p)
+        self.record_size = 2 * self.width
+
+    def encode(self, ciphertext: dict) -> bytes:
+        return _to_bytes(ciphertext['c1'], self.width) + _to_bytes(ciphertext['c2'], self.width)
+
+    def decode(self, buffer: Any) -> dict:
+        width = self.width
+        return {'c1': _from_bytes(buffer[:width]), 'c2': _from_bytes(buffer[width:2 * width]), 'p': self.p}
+
+
+class DamgardJurikCodec(FixedWidthCodec):
+    """
+    Damgard-Jurik ciphertexts {'c', 'modulus'}: c padded to the size of n^(s+1).
+    """
+
+    def __init__(self, public_key: Any):
+        n, s = public_key
+        self.modulus = n ** (s + 1)
+        self.record_size = _width(self.modulus)
+
+    def encode(self, ciphertext: dict) -> bytes:
+        return _to_bytes(ciphertext['c'], self.record_size)
+
+    def decode(self, buffer: Any) -> dict:
+        return {'c': _from_bytes(buffer[:self.record_size]), 'modulus': self.modulus}
+
+
+class RSACodec(FixedWidthCodec):
+    """
+    RSA ciphertexts {'c', 'n'}: c padded to the size of n.
+    """
+
+    def __init__(self, public_key: Any):
+        self.n = public_key[0]
+        self.record_size = _width(self.n)
+
+    def encode(self, ciphertext: dict) -> bytes:
+        return _to_bytes(ciphertext['c'], self.record_size)
+
+    def decode(self, buffer: Any) -> dict:
+        return {'c': _from_bytes(buffer[:self.record_size]), 'n': self.n}
+
+
+class ECElGamalCodec(FixedWidthCodec):
+    """
+    EC-ElGamal ciphertexts {'c1', 'c2'}: two SEC1 compressed points (33 bytes each;
+    the point at infinity is stored as zeros).
+    """
+    record_size = 66
+
+    def __init__(self, public_key: Any = None):
+        self.public_key = public_key
+
+    @staticmethod
+    def _point(point: Any) -> bytes:
+        return ec_elgamal.point_to_bytes(point) if point is not None else bytes(33)
+
+    @staticmethod
+    def _unpoint(buffer: Any) -> Any:
+        data = bytes(buffer)
+        return None if data[0] == 0 else ec_elgamal.point_from_bytes(data)
+
+    def encode(self, ciphertext: dict) -> bytes:
+        return self._point(ciphertext['c1']) + self._point(ciphertext['c2'])
+
+    def decode(self, buffer: Any) -> dict:
+        return {'c1': self._unpoint(buffer[:33]), 'c2': self._unpoint(buffer[33:66])}
+
+
+def codec_for(scheme: Any, public_key: Any) -> FixedWidthCodec:
+    """
+    Returns the codec for the ciphertexts of `scheme` under `public_key`.
+    """
+    for scheme_class, codec_class in ((PaillierScheme, PaillierCodec), (ElGamalScheme, ElGamalCodec),
+                                      (DamgardJurikScheme, DamgardJurikCodec), (RSAScheme, RSACodec),
+                                      (ec_elgamal.ECElGamalScheme, ECElGamalCodec)):
+        if isinstance(scheme, scheme_class):
+            return codec_class(public_key)
+    raise TypeError(f"No fixed-width codec for {type(scheme).__name__}")
+
+
+class CiphertextStore:
+    """
+    Memory-mapped file of fixed-width ciphertext records with random access.
+    """
+
+    def __init__(self, path: str, codec: FixedWidthCodec, writable: bool = False):
+        """
+        Opens an existing store. Use CiphertextStore.write() or create() to make one.
+
+        Args:
+            path (str): Store file.
+            codec (FixedWidthCodec): Codec of the stored ciphertexts.
+            writable (bool): Whether records may be overwritten in place.
+        """
+        with open(path, "rb") as f:
+            magic, record_size, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a ciphertext store")
+        if record_size != codec.record_size:
+            raise ValueError(f"Record size {record_size} does not match the codec ({codec.record_size})")
+        self.path = path
+        self.codec = codec
+        self.count = count
+        if count:
+            self.records = np.memmap(path, dtype=np.uint8, mode="r+" if writable else "r",
+                                     offset=HEADER.size, shape=(count, record_size))
+        else:
+            self.records = np.empty((0, record_size), dtype=np.uint8)
+
+    @classmethod
+    def create(cls, path: str, codec: FixedWidthCodec, count: int) -> "CiphertextStore":
+        """
+        Creates a zero-filled store of `count` records, opened for writing.
+        """
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, codec.record_size, count))
+            f.truncate(HEADER.size + count * codec.record_size)
+        return cls(path, codec, writable=True)
+
+    @classmethod
+    def write(cls, path: str, codec: FixedWidthCodec, ciphertexts: Iterable[Any],
+              chunk_size: int = 1024) -> "CiphertextStore":
+        """
+        Streams ciphertexts into a new store (the input may be a generator of any
+        length) and returns it opened read-only.
+        """
+        count = 0
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, codec.record_size, 0))
+            chunk = []
+            for ciphertext in ciphertexts:
+                chunk.append(codec.encode(ciphertext))
+                if len(chunk) == chunk_size:
+                    f.write(b"".join(chunk))
+                    count += len(chunk)
+                    chunk = []
+            f.write(b"".join(chunk))
+            count += len(chunk)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, codec.record_size, count))
+        return cls(path, codec)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self.codec.decode_many(self.records[index])
+        return self.codec.decode(memoryview(self.records[index]))
+
+    def __setitem__(self, index: int, ciphertext: Any) -> None:
+        self.records[index] = np.frombuffer(self.codec.encode(ciphertext), dtype=np.uint8)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self.count):
+            yield self[index]
+
+    def flush(self) -> None:
+        if isinstance(self.records, np.memmap):
+            self.records.flush()
+
+    @property
+    def nbytes(self) -> int:
+        return os.path.getsize(self.path)
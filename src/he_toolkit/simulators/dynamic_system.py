@@ -0,0 +1,66 @@
+from typing import Optional
+import numpy as np
+
+
+class DynamicSystem:
+    """
+    Discrete-time linear time-invariant plant.
+
+        x[k+1] = A x[k] + B u[k]
+        y[k]   = C x[k]
+    """
+
+    def __init__(self, A, B, C=None, x0=None):
+        """
+        Args:
+            A: State matrix (n x n).
+            B: Input matrix (n x m).
+            C: Output matrix (p x n). Defaults to the identity (full state output).
+            x0: Initial state (n). Defaults to zeros.
+        """
+        self.A = np.atleast_2d(np.asarray(A, dtype=float))
+        self.B = np.atleast_2d(np.asarray(B, dtype=float))
+        n = self.A.shape[0]
+        if self.A.shape != (n, n):
+            raise ValueError("A must be square")
+        if self.B.shape[0] != n:
+            raise ValueError("B must have as many rows as A")
+        self.C = np.eye(n) if C is None else np.atleast_2d(np.asarray(C, dtype=float))
+        self.x0 = np.zeros(n) if x0 is None else np.asarray(x0, dtype=float).reshape(n)
+        self.x = self.x0.copy()
+
+    @property
+    def n_states(self) -> int:
+        return self.A.shape[0]
+
+    @property
+    def n_inputs(self) -> int:
+        return self.B.shape[1]
+
+    def output(self) -> np.ndarray:
+        """
+        Returns the current measurement y = C x.
+        """
+        return self.C @ self.x
+
+    def step(self, u) -> np.ndarray:
+        """
+        Advances the plant by one sample.
+
+        Args:
+            u: Control input (m).
+
+        Returns:
+            np.ndarray: The measurement after the update.
+        """
+        u = np.asarray(u, dtype=float).reshape(self.n_inputs)
+        self.x = self.A @ self.x + self.B @ u
+        return self.output()
+
+    def reset(self, x0: Optional[np.ndarray] = None) -> None:
+        """
+        Resets the state to x0 (or to the initial state given at construction).
+        """
+        if x0 is not None:
+            self.x0 = np.asarray(x0, dtype=float).reshape(self.n_states)
+        self.x = self.x0.copy()
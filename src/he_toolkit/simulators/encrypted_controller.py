@@ -0,0 +1,189 @@
+from typing import Any, List
+import numpy as np
+
+
+def encrypted_matvec(scheme: Any, matrix, encrypted_vector: List[Any]) -> List[Any]:
+    """
+    Computes Enc(M x) from a plaintext matrix and an element-wise encrypted vector,
+    using only multiply_scalar and add.
+
+    Args:
+        scheme (Any): Any scheme with multiply_scalar and add.
+        matrix: Plaintext matrix (rows x len(encrypted_vector)), already encoded for the scheme.
+        encrypted_vector (List[Any]): One ciphertext per vector element.
+
+    Returns:
+        List[Any]: One ciphertext per matrix row.
+    """
+    result = []
+    for row in matrix:
+        acc = None
+        for coefficient, ciphertext in zip(row, encrypted_vector):
+            term = scheme.multiply_scalar(ciphertext, coefficient)
+            acc = term if acc is None else scheme.add(acc, term)
+        result.append(acc)
+    return result
+
+
+class EncryptedStateFeedback:
+    """
+    State-feedback controller u = K x evaluated on an encrypted state.
+
+    Each control step is split into the three parties of an encrypted control loop:
+    the sensor encrypts the state, the (untrusted) controller evaluates K x
+    homomorphically, and the actuator decrypts the input.
+
+    Integer schemes (BFV, BGV) use fixed-point encoding: both K and x are scaled by
+    `scale` and rounded, and the decrypted result is divided by scale**2. Packed
+    schemes encrypt each state element into the first slot of its own ciphertext.
+    """
+
+    def __init__(self, scheme: Any, gain, public_key: Any, private_key: Any,
+                 packed: bool = False, scale: float = 1.0):
+        """
+        Args:
+            scheme (Any): Scheme supporting encrypt, decrypt, add and multiply_scalar.
+            gain: Feedback gain K (m x n).
+            public_key (Any): Key used by the sensor.
+            private_key (Any): Key used by the actuator.
+            packed (bool): Whether the scheme encrypts lists (BFV, BGV, CKKS).
+            scale (float): Fixed-point scale for integer schemes (1 keeps values as floats).
+        """
+        self.scheme = scheme
+        self.public_key = public_key
+        self.private_key = private_key
+        self.packed = packed
+        self.scale = scale
+        gain = np.atleast_2d(np.asarray(gain, dtype=float))
+        self.gain = self._encode(gain) if scale != 1 else gain.tolist()
+
+    def _encode(self, values: np.ndarray) -> list:
+        return np.rint(values * self.scale).astype(int).tolist()
+
+    def encrypt_state(self, x) -> List[Any]:
+        """
+        Sensor side: encrypts the state element-wise.
+        """
+        x = np.asarray(x, dtype=float).reshape(-1)
+        values = self._encode(x) if self.scale != 1 else x.tolist()
+        if self.packed:
+            return [self.scheme.encrypt([v], self.public_key) for v in values]
+        return [self.scheme.encrypt(v, self.public_key) for v in values]
+
+    def evaluate(self, encrypted_state: List[Any]) -> List[Any]:
+        """
+        Controller side: computes Enc(K x) without access to any secret.
+        """
+        return encrypted_matvec(self.scheme, self.gain, encrypted_state)
+
+    def decrypt_input(self, encrypted_input: List[Any]) -> np.ndarray:
+        """
+        Actuator side: decrypts the control input.
+        """
+        values = []
+        for ciphertext in encrypted_input:
+            value = self.scheme.decrypt(ciphertext, self.private_key)
+            values.append(value[0] if self.packed else value)
+        u = np.asarray(values, dtype=float)
+        return u / self.scale ** 2 if self.scale != 1 else u
+
+    def step(self, x) -> np.ndarray:
+        """
+        Runs one full control step: encrypt, evaluate, decrypt.
+
+        Args:
+            x: Current plant state.
+
+        Returns:
+            np.ndarray: The control input u = K x.
+        """
+        return self.decrypt_input(self.evaluate(self.encrypt_state(x)))
+
+
+class EncryptedDynamicController:
+    """
+    Dynamic output-feedback controller with an encrypted internal state.
+
+        xc[k+1] = F xc[k] + G y[k]
+        u[k]    = H xc[k] + J y[k]
+
+    The controller state never leaves the encrypted domain, so every step multiplies
+    it by plaintext gains again. Leveled schemes (CKKS) run out of levels after
+    `mult_depth` steps unless the scheme bootstraps (CKKSScheme with bootstrap=True)
+    or the client decrypts and re-encrypts the state (`reencrypt_state`), which
+    costs a round trip per refresh. Values are used as-is (no fixed-point scaling).
+    """
+
+    def __init__(self, scheme: Any, F, G, H, J, public_key: Any, private_key: Any,
+                 packed: bool = False, xc0=None):
+        """
+        Args:
+            scheme (Any): Scheme supporting encrypt, decrypt, add and multiply_scalar.
+            F, G, H, J: Controller matrices.
+            public_key (Any): Key used by the sensor.
+            private_key (Any): Key used by the actuator (and for re-encryption).
+            packed (bool): Whether the scheme encrypts lists (BFV, BGV, CKKS).
+            xc0: Initial controller state. Defaults to zeros.
+        """
+        self.scheme = scheme
+        self.public_key = public_key
+        self.private_key = private_key
+        self.packed = packed
+        self.F, self.G, self.H, self.J = (np.atleast_2d(np.asarray(M, dtype=float)).tolist() for M in (F, G, H, J))
+        xc0 = np.zeros(len(self.F)) if xc0 is None else xc0
+        self.state = self._encrypt(xc0)
+
+    def _encrypt(self, values) -> List[Any]:
+        values = np.asarray(values, dtype=float).reshape(-1).tolist()
+        if self.packed:
+            return [self.scheme.encrypt([v], self.public_key) for v in values]
+        return [self.scheme.encrypt(v, self.public_key) for v in values]
+
+    def _decrypt(self, ciphertexts: List[Any]) -> np.ndarray:
+        values = []
+        for ciphertext in ciphertexts:
+            value = self.scheme.decrypt(ciphertext, self.private_key)
+            values.append(value[0] if self.packed else value)
+        return np.asarray(values, dtype=float)
+
+    def encrypt_output(self, y) -> List[Any]:
+        """
+        Sensor side: encrypts the plant measurement.
+        """
+        return self._encrypt(y)
+
+    def evaluate(self, encrypted_output: List[Any]) -> List[Any]:
+        """
+        Controller side: computes Enc(u) and advances the encrypted state.
+        """
+        encrypted_input = [self.scheme.add(a, b) for a, b in zip(
+            encrypted_matvec(self.scheme, self.H, self.state),
+            encrypted_matvec(self.scheme, self.J, encrypted_output))]
+        self.state = [self.scheme.add(a, b) for a, b in zip(
+            encrypted_matvec(self.scheme, self.F, self.state),
+            encrypted_matvec(self.scheme, self.G, encrypted_output))]
+        return encrypted_input
+
+    def decrypt_input(self, encrypted_input: List[Any]) -> np.ndarray:
+        """
+        Actuator side: decrypts the control input.
+        """
+        return self._decrypt(encrypted_input)
+
+    def reencrypt_state(self) -> None:
+        """
+        Client round trip: decrypts the controller state and encrypts it afresh.
+        """
+        self.state = self._encrypt(self._decrypt(self.state))
+
+    def step(self, y) -> np.ndarray:
+        """
+        Runs one full control step: encrypt, evaluate, decrypt.
+
+        Args:
+            y: Current plant measurement.
+
+        Returns:
+            np.ndarray: The control input u.
+        """
+        return self.decrypt_input(self.evaluate(self.encrypt_output(y)))
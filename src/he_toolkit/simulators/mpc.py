@@ -0,0 +1,279 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from he_toolkit.simulators.encrypted_controller import encrypted_matvec
+
+
+def condensed_qp(A, B, Q, R, horizon: int, P=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Condenses the finite-horizon LQ problem
+
+        min sum_{k=1..N} x[k]' Q x[k] + u[k-1]' R u[k-1]   (P replaces Q for x[N])
+        s.t. x[k+1] = A x[k] + B u[k]
+
+    into a QP over the stacked inputs U = (u[0], ..., u[N-1]):
+    min 1/2 U' H U + x0' F' U, whose gradient is H U + F x0.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (H, F) with shapes (N m, N m) and (N m, n).
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    B = np.atleast_2d(np.asarray(B, dtype=float))
+    Q = np.atleast_2d(np.asarray(Q, dtype=float))
+    R = np.atleast_2d(np.asarray(R, dtype=float))
+    P = Q if P is None else np.atleast_2d(np.asarray(P, dtype=float))
+    n, m = B.shape
+
+    powers = [np.eye(n)]
+    for _ in range(horizon):
+        powers.append(A @ powers[-1])
+    Phi = np.vstack(powers[1:])
+    Gamma = np.zeros((horizon * n, horizon * m))
+    for k in range(horizon):
+        for j in range(k + 1):
+            Gamma[k * n:(k + 1) * n, j * m:(j + 1) * m] = powers[k - j] @ B
+
+    Q_bar = np.kron(np.eye(horizon), Q)
+    Q_bar[-n:, -n:] = P
+    R_bar = np.kron(np.eye(horizon), R)
+    H = 2 * (Gamma.T @ Q_bar @ Gamma + R_bar)
+    F = 2 * Gamma.T @ Q_bar @ Phi
+    return H, F
+
+
+class ProjectedGradientMPC:
+    """
+    Input-constrained linear MPC solved with a fixed number of projected-gradient
+    iterations per control step (cold-started from U = 0):
+
+        U <- clip(M U + G x, u_min, u_max),   M = I - eta H,  G = -eta F
+
+    The affine part is what an encrypted controller evaluates homomorphically; the
+    projection (clip) is the only non-linear operation.
+    """
+
+    def __init__(self, A, B, Q, R, horizon: int, u_min, u_max, iterations: int = 10,
+                 P=None, step_size: Optional[float] = None):
+        """
+        Args:
+            A, B: Plant matrices.
+            Q, R: State and input weights (P: terminal weight, defaults to Q).
+            horizon (int): Prediction horizon N.
+            u_min, u_max: Input bounds (scalars or one value per input).
+            iterations (int): Projected-gradient iterations per step.
+            step_size (Optional[float]): Gradient step eta (default 1 / largest eigenvalue of H).
+        """
+        self.H, self.F = condensed_qp(A, B, Q, R, horizon, P)
+        self.horizon = horizon
+        self.n_inputs = np.atleast_2d(np.asarray(B)).shape[1]
+        self.iterations = iterations
+        self.step_size = step_size or 1.0 / np.linalg.eigvalsh(self.H).max()
+        self.M = np.eye(len(self.H)) - self.step_size * self.H
+        self.G = -self.step_size * self.F
+        self.lower = np.tile(np.broadcast_to(np.asarray(u_min, dtype=float), (self.n_inputs,)), horizon)
+        self.upper = np.tile(np.broadcast_to(np.asarray(u_max, dtype=float), (self.n_inputs,)), horizon)
+
+    @property
+    def n_variables(self) -> int:
+        return len(self.H)
+
+    def project(self, U: np.ndarray) -> np.ndarray:
+        return np.clip(U, self.lower, self.upper)
+
+    def solve(self, x) -> np.ndarray:
+        """
+        Returns the input sequence U after `iterations` projected-gradient steps.
+        """
+        c = self.G @ np.asarray(x, dtype=float)
+        U = np.zeros(self.n_variables)
+        for _ in range(self.iterations):
+            U = self.project(self.M @ U + c)
+        return U
+
+    def control(self, x) -> np.ndarray:
+        """
+        Returns the first input u[0] of the solution (receding horizon).
+        """
+        return self.solve(x)[:self.n_inputs]
+
+
+class _Timings:
+    def __init__(self, phases: List[str]):
+        self.totals = {phase: 0.0 for phase in phases}
+
+    def measure(self, phase: str, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.totals[phase] += time.perf_counter() - start
+        return result
+
+
+class ClientAssistedMPC:
+    """
+    Encrypted projected-gradient MPC for element-wise schemes (e.g. Paillier).
+
+    The server evaluates the affine update on one ciphertext per variable with
+    encrypted_matvec; the client decrypts, projects and re-encrypts U in every
+    iteration, so each iteration costs one round trip.
+
+    Phases reported by step(): "sensor" (encrypt x), "server" (homomorphic affine
+    maps), "client" (decrypt, project, re-encrypt).
+    """
+    PHASES = ["sensor", "server", "client"]
+
+    def __init__(self, scheme: Any, mpc: ProjectedGradientMPC, public_key: Any, private_key: Any):
+        self.scheme = scheme
+        self.mpc = mpc
+        self.public_key = public_key
+        self.private_key = private_key
+        self.M = mpc.M.tolist()
+        self.G = mpc.G.tolist()
+
+    def _encrypt(self, values: np.ndarray) -> List[Any]:
+        return [self.scheme.encrypt(v, self.public_key) for v in values.tolist()]
+
+    def _project(self, encrypted: List[Any]) -> Tuple[np.ndarray, List[Any]]:
+        values = np.array([self.scheme.decrypt(c, self.private_key) for c in encrypted], dtype=float)
+        U = self.mpc.project(values)
+        return U, self._encrypt(U)
+
+    def _affine(self, encrypted_U: List[Any], encrypted_c: List[Any]) -> List[Any]:
+        return [self.scheme.add(a, b) for a, b in zip(encrypted_matvec(self.scheme, self.M, encrypted_U), encrypted_c)]
+
+    def step(self, x) -> Tuple[np.ndarray, Dict[str, float]]:
+        """
+        Runs one control step.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, float]]: (u[0], seconds spent per phase)
+        """
+        timings = _Timings(self.PHASES)
+        encrypted_x = timings.measure("sensor", self._encrypt, np.asarray(x, dtype=float))
+        # U starts at 0, so the first iterate before projection is c = G x.
+        encrypted_v = encrypted_c = timings.measure("server", encrypted_matvec, self.scheme, self.G, encrypted_x)
+        for iteration in range(self.mpc.iterations):
+            if iteration:
+                encrypted_v = timings.measure("server", self._affine, encrypted_U, encrypted_c)
+            U, encrypted_U = timings.measure("client", self._project, encrypted_v)
+        return U[:self.mpc.n_inputs], timings.totals
+
+
+def diagonals(matrix: np.ndarray, slots: int) -> List[np.ndarray]:
+    """
+    Generalized diagonals of a matrix zero-padded to slots x slots:
+    diag_d[i] = M[i, (i + d) mod slots], so M v = sum_d diag_d * rotate(v, d).
+    """
+    padded = np.zeros((slots, slots))
+    padded[:matrix.shape[0], :matrix.shape[1]] = matrix
+    rows = np.arange(slots)
+    return [padded[rows, (rows + d) % slots] for d in range(slots)]
+
+
+def packed_matvec(scheme: Any, diags: List[np.ndarray], ciphertext: Any) -> Any:
+    """
+    Computes Enc(M v) from one packed ciphertext Enc(v) with the diagonal method
+    (one plaintext product per non-zero diagonal, one level in total).
+    """
+    # Rotations keep the level, so bootstrapping once here covers every product.
+    ciphertext = scheme.ensure_levels(ciphertext)
+    result = None
+    for d, diagonal in enumerate(diags):
+        if not np.any(diagonal):
+            continue
+        rotated = ciphertext if d == 0 else scheme.rotate(ciphertext, d)
+        term = scheme.multiply_plain(rotated, diagonal.tolist())
+        result = term if result is None else scheme.add(result, term)
+    return result
+
+
+class PackedMPC:
+    """
+    Encrypted projected-gradient MPC for packed CKKS: x and U each travel in one
+    ciphertext and the affine update uses the diagonal method (rotations and
+    plaintext-ciphertext products).
+
+    Projection:
+    - "client": the client decrypts, clips and re-encrypts U every iteration.
+    - "chebyshev": the server applies a degree-`degree` Chebyshev approximation of
+      the clip on [-bound, bound], so the whole solve runs without round trips at
+      the cost of 1 + chebyshev_depth(degree) levels per iteration (use a deep
+      context or bootstrapping). The actuator clips the decrypted u[0] once more.
+
+    Phases reported by step(): "sensor", "server", "client" and "actuator".
+    """
+    PHASES = ["sensor", "server", "client", "actuator"]
+
+    def __init__(self, scheme: Any, mpc: ProjectedGradientMPC, public_key: Any, private_key: Any,
+                 projection: str = "client", degree: int = 13, bound: Optional[float] = None):
+        """
+        Args:
+            scheme (Any): CKKSScheme with keys generated for at least `required_slots` slots.
+            mpc (ProjectedGradientMPC): The plaintext problem.
+            public_key (Any): Key used by the sensor and client.
+            private_key (Any): Key used by the client and actuator.
+            projection (str): "client" or "chebyshev".
+            degree (int): Chebyshev degree (chebyshev projection).
+            bound (Optional[float]): Approximation interval half-width (default: 4 * max |u bound|).
+        """
+        if projection not in ("client", "chebyshev"):
+            raise ValueError("projection must be 'client' or 'chebyshev'")
+        self.slots = self.required_slots(mpc, len(mpc.G[0]))
+        if scheme.batch_size < self.slots:
+            raise ValueError(f"The scheme needs at least {self.slots} slots")
+        self.scheme = scheme
+        self.mpc = mpc
+        self.public_key = public_key
+        self.private_key = private_key
+        self.projection = projection
+        self.degree = degree
+        self.bound = bound or 4 * float(np.max(np.abs(np.concatenate([mpc.lower, mpc.upper]))))
+        self.M_diagonals = diagonals(mpc.M, scheme.batch_size)
+        self.G_diagonals = diagonals(mpc.G, scheme.batch_size)
+        scheme.generate_rotation_keys(range(1, scheme.batch_size))
+
+    @staticmethod
+    def required_slots(mpc: ProjectedGradientMPC, n_states: int) -> int:
+        """
+        Smallest power of two that holds both U and x.
+        """
+        return 1 << (max(mpc.n_variables, n_states) - 1).bit_length()
+
+    def _encrypt(self, values: np.ndarray) -> Any:
+        padded = np.zeros(self.scheme.batch_size)
+        padded[:len(values)] = values
+        return self.scheme.encrypt(padded.tolist(), self.public_key)
+
+    def _decrypt(self, ciphertext: Any) -> np.ndarray:
+        return np.asarray(self.scheme.decrypt(ciphertext, self.private_key)[:self.mpc.n_variables], dtype=float)
+
+    def _clip(self, value: float) -> float:
+        return min(max(value, float(self.mpc.lower.min())), float(self.mpc.upper.max()))
+
+    def _client_project(self, ciphertext: Any) -> Any:
+        return self._encrypt(self.mpc.project(self._decrypt(ciphertext)))
+
+    def _server_project(self, ciphertext: Any) -> Any:
+        return self.scheme.evaluate_chebyshev(ciphertext, self._clip, -self.bound, self.bound, self.degree)
+
+    def _affine(self, encrypted_U: Any, encrypted_c: Any) -> Any:
+        return self.scheme.add(packed_matvec(self.scheme, self.M_diagonals, encrypted_U), encrypted_c)
+
+    def step(self, x) -> Tuple[np.ndarray, Dict[str, float]]:
+        """
+        Runs one control step.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, float]]: (u[0], seconds spent per phase)
+        """
+        timings = _Timings(self.PHASES)
+        encrypted_x = timings.measure("sensor", self._encrypt, np.asarray(x, dtype=float))
+        encrypted_v = encrypted_c = timings.measure("server", packed_matvec, self.scheme, self.G_diagonals, encrypted_x)
+        for iteration in range(self.mpc.iterations):
+            if iteration:
+                encrypted_v = timings.measure("server", self._affine, encrypted_U, encrypted_c)
+            if self.projection == "client":
+                encrypted_U = timings.measure("client", self._client_project, encrypted_v)
+            else:
+                encrypted_U = timings.measure("server", self._server_project, encrypted_v)
+        U = timings.measure("actuator", self._decrypt, encrypted_U)
+        return self.mpc.project(U)[:self.mpc.n_inputs], timings.totals
@@ -0,0 +1,180 @@
+"""
+Streaming encryption and decryption over iterators of NumPy chunks.
+
+The input stream is regrouped into fixed-size batches of values. For packed schemes
+(BFV, BGV, CKKS; anything with a positive `batch_size` attribute after
+generate_keys) each batch is split into SIMD ciphertexts of `batch_size` slots; for
+scalar schemes (Paillier, ElGamal, ...) every value gets its own ciphertext.
+
+Batches are processed by an optional pool of workers with at most `max_pending`
+batches in flight. The generators only pull more input once earlier results have
+been consumed, so memory stays bounded regardless of the stream length, and
+results are always yielded in input order.
+
+Thread workers suit the OpenFHE wrappers, whose contexts cannot be pickled. A
+ProcessPoolExecutor can be passed for pure-Python/gmpy2 schemes whose scheme object
+and keys are picklable.
+"""
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional
+import numpy as np
+
+# Values per work item for scalar schemes.
+DEFAULT_SCALAR_BATCH = 256
+
+
+class EncryptedBatch(NamedTuple):
+    """
+    A batch of encrypted values.
+
+    Attributes:
+        ciphertexts (List[Any]): SIMD ciphertexts (packed schemes) or one ciphertext per value.
+        length (int): Number of values in the batch (the last SIMD ciphertext may be padded).
+    """
+    ciphertexts: List[Any]
+    length: int
+
+
+def slot_count(scheme: Any) -> int:
+    """
+    Returns the number of SIMD slots of a packed scheme, or 0 for scalar schemes.
+    """
+    return int(getattr(scheme, "batch_size", 0) or 0)
+
+
+def rebatch(chunks: Iterable[Any], size: int) -> Iterator[np.ndarray]:
+    """
+    Regroups a stream of array-like chunks into flat arrays of `size` values
+    (the last one may be shorter). Only one batch is buffered at a time.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    buffer: List[np.ndarray] = []
+    buffered = 0
+    for chunk in chunks:
+        chunk = np.asarray(chunk).reshape(-1)
+        while len(chunk):
+            take = min(size - buffered, len(chunk))
+            buffer.append(chunk[:take])
+            buffered += take
+            chunk = chunk[take:]
+            if buffered == size:
+                yield np.concatenate(buffer)
+                buffer, buffered = [], 0
+    if buffered:
+        yield np.concatenate(buffer)
+
+
+def ordered_map(func: Callable[[Any], Any], items: Iterable[Any], workers: int = 1,
+                max_pending: Optional[int] = None, executor: Optional[Executor] = None) -> Iterator[Any]:
+    """
+    Lazily applies func to items on a pool of workers, yielding results in order.
+
+    Args:
+        func (Callable[[Any], Any]): Function to apply (must be picklable for process pools).
+        items (Iterable[Any]): Input items, consumed lazily.
+        workers (int): Number of threads if no executor is given (1 runs inline).
+        max_pending (Optional[int]): Maximum items in flight (default: twice the pool size,
+            i.e. 2 * workers, or 2 * the executor's max_workers). Required for executors
+            that do not expose their pool size.
+        executor (Optional[Executor]): Executor to submit to instead of an internal thread pool.
+
+    Yields:
+        Any: func(item) for each item, in input order.
+    """
+    if executor is None and workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    own_executor = executor is None
+    if max_pending is None:
+        # `workers` describes the internal pool only; size the window from a supplied executor.
+        pool_size = workers if own_executor else getattr(executor, "_max_workers", None)
+        if pool_size is None:
+            raise ValueError("max_pending is required for executors without a known pool size")
+        max_pending = 2 * pool_size
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    limit = max_pending
+    pending: deque = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
+
+
+def _encrypt_batch(scheme: Any, public_key: Any, slots: int, values: np.ndarray) -> EncryptedBatch:
+    items = values.tolist()
+    if slots:
+        ciphertexts = [scheme.encrypt(items[i:i + slots], public_key) for i in range(0, len(items), slots)]
+    else:
+        ciphertexts = [scheme.encrypt(item, public_key) for item in items]
+    return EncryptedBatch(ciphertexts, len(items))
+
+
+def _decrypt_batch(scheme: Any, private_key: Any, slots: int, batch: EncryptedBatch) -> np.ndarray:
+    if slots:
+        values = []
+        for ciphertext in batch.ciphertexts:
+            values.extend(scheme.decrypt(ciphertext, private_key)[:slots])
+        return np.asarray(values[:batch.length])
+    return np.asarray([scheme.decrypt(ciphertext, private_key) for ciphertext in batch.ciphertexts])
+
+
+def encrypt_stream(scheme: Any, public_key: Any, chunks: Iterable[Any], batch_values: Optional[int] = None,
+                   workers: int = 1, max_pending: Optional[int] = None,
+                   executor: Optional[Executor] = None) -> Iterator[EncryptedBatch]:
+    """
+    Encrypts a stream of NumPy chunks.
+
+    Args:
+        scheme (Any): A scheme with keys generated.
+        public_key (Any): The public key.
+        chunks (Iterable[Any]): Iterator of array-like chunks of any length.
+        batch_values (Optional[int]): Values per work item. Rounded up to a multiple of the
+            slot count for packed schemes (default: one SIMD ciphertext, or 256 values).
+        workers (int): Worker threads (ignored if executor is given).
+        max_pending (Optional[int]): Maximum batches in flight (default: see ordered_map).
+        executor (Optional[Executor]): Custom executor, e.g. a ProcessPoolExecutor.
+
+    Yields:
+        EncryptedBatch: Encrypted batches in input order.
+    """
+    slots = slot_count(scheme)
+    if slots:
+        size = -(-(batch_values or slots) // slots) * slots
+    else:
+        size = batch_values or DEFAULT_SCALAR_BATCH
+    func = partial(_encrypt_batch, scheme, public_key, slots)
+    return ordered_map(func, rebatch(chunks, size), workers, max_pending, executor)
+
+
+def decrypt_stream(scheme: Any, private_key: Any, batches: Iterable[EncryptedBatch], workers: int = 1,
+                   max_pending: Optional[int] = None, executor: Optional[Executor] = None) -> Iterator[np.ndarray]:
+    """
+    Decrypts a stream produced by encrypt_stream.
+
+    Args:
+        scheme (Any): The scheme used for encryption.
+        private_key (Any): The private key.
+        batches (Iterable[EncryptedBatch]): Encrypted batches.
+        workers (int): Worker threads (ignored if executor is given).
+        max_pending (Optional[int]): Maximum batches in flight (default: see ordered_map).
+        executor (Optional[Executor]): Custom executor, e.g. a ProcessPoolExecutor.
+
+    Yields:
+        np.ndarray: The decrypted values of each batch, padding removed, in input order.
+    """
+    func = partial(_decrypt_batch, scheme, private_key, slot_count(scheme))
+    return ordered_map(func, batches, workers, max_pending, executor)
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+from he_toolkit.aio import AsyncScheme, executor_kind
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+from he_toolkit.schemes.partial.rsa_homomorphic import RSAScheme
+
+
+class TestAsyncScheme(unittest.TestCase):
+    def setUp(self):
+        self.scheme = PaillierScheme()
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=512)
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_executor_kind(self):
+        self.assertEqual("process", executor_kind(self.scheme))
+
+    def test_round_trip_threads(self):
+        async def scenario():
+            async with AsyncScheme(self.scheme, kind="thread", workers=2) as scheme:
+                c1, c2 = await asyncio.gather(scheme.encrypt(1.5, self.public_key),
+                                              scheme.encrypt(2.0, self.public_key))
+                total = await scheme.add(c1, await scheme.multiply_scalar(c2, 3))
+                return await scheme.decrypt(total, self.private_key)
+        self.assertAlmostEqual(7.5, self.run_async(scenario()))
+
+    def test_coalescing(self):
+        async def scenario():
+            async with AsyncScheme(self.scheme, kind="thread", workers=2, max_batch=8,
+                                   coalesce_delay=0.05) as scheme:
+                ciphertexts = await asyncio.gather(*(scheme.encrypt(v, self.public_key) for v in range(16)))
+                values = await asyncio.gather(*(scheme.decrypt(c, self.private_key) for c in ciphertexts))
+                return values, scheme.batches
+        values, batches = self.run_async(scenario())
+        self.assertEqual(list(range(16)), values)
+        self.assertEqual(4, batches)
+
+    def test_errors_are_per_call(self):
+        rsa = RSAScheme()
+        public_key, _ = rsa.generate_keys(key_size=512)
+
+        async def scenario():
+            async with AsyncScheme(rsa, kind="thread", workers=1) as scheme:
+                c = await scheme.encrypt(3, public_key)
+                return await asyncio.gather(scheme.add(c, c), scheme.multiply(c, c), return_exceptions=True)
+        added, multiplied = self.run_async(scenario())
+        self.assertIsInstance(added, Exception)
+        self.assertIsInstance(multiplied, dict)
+
+    def test_reused_across_event_loops(self):
+        facade = AsyncScheme(self.scheme, kind="thread", workers=2, max_concurrency=1, max_batch=2)
+
+        async def scenario(values):
+            # More batches than max_concurrency, so calls wait on the semaphore.
+            ciphertexts = await asyncio.gather(*(facade.encrypt(v, self.public_key) for v in values))
+            return await asyncio.gather(*(facade.decrypt(c, self.private_key) for c in ciphertexts))
+        try:
+            self.assertEqual([1, 2, 3, 4], self.run_async(scenario([1, 2, 3, 4])))
+            self.assertEqual([5, 6, 7, 8], self.run_async(scenario([5, 6, 7, 8])))
+        finally:
+            self.run_async(facade.aclose())
+
+    def test_matvec_processes(self):
+        async def scenario():
+            async with AsyncScheme(self.scheme, workers=2) as scheme:
+                x = await asyncio.gather(scheme.encrypt(1.0, self.public_key),
+                                         scheme.encrypt(-2.0, self.public_key))
+                u = await scheme.matvec([[0.5, 1.0], [2.0, 0.0]], x)
+                return [await scheme.decrypt(c, self.private_key) for c in u]
+        u = self.run_async(scenario())
+        self.assertAlmostEqual(-1.5, u[0])
+        self.assertAlmostEqual(2.0, u[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
-from he_toolkit.schemes.openfhe_wrappers.ckks_wrapper import CKKSScheme
+from he_toolkit.schemes.openfhe_wrappers.ckks_wrapper import CKKSScheme, chebyshev_depth
+from he_toolkit.simulators.mpc import PackedMPC, ProjectedGradientMPC
 
 class TestCKKSScheme(unittest.TestCase):
     def setUp(self):
@@ -55,5 +56,110 @@ class TestCKKSScheme(unittest.TestCase):
         for i in range(len(expected)):
             self.assertAlmostEqual(expected[i], decrypted[i].real, places=4)
 
+    def test_levels_remaining_counts_pending_rescale(self):
+        c = self.scheme.encrypt([1.0, 2.0], self.public_key)
+        fresh = self.scheme.levels_remaining(c)
+        c = self.scheme.multiply(c, c)
+        # The rescale of this product is deferred, but the level is already spent.
+        self.assertEqual(fresh - 1, self.scheme.levels_remaining(c))
+        c = self.scheme.multiply_scalar(c, 0.5)
+        self.assertEqual(fresh - 2, self.scheme.levels_remaining(c))
+        self.assertAlmostEqual(0.5, self.scheme.decrypt(c, self.private_key)[0], places=3)
+
+    def test_packed_matvec(self):
+        from he_toolkit.simulators.mpc import diagonals, packed_matvec
+        M = np.array([[1.0, 2.0], [-0.5, 0.25]])
+        self.scheme.generate_rotation_keys(range(1, 8))
+        c = self.scheme.encrypt([1.0, 2.0], self.public_key)
+        decrypted = self.scheme.decrypt(packed_matvec(self.scheme, diagonals(M, 8), c), self.private_key)
+        for expected, value in zip(M @ np.array([1.0, 2.0]), decrypted):
+            self.assertAlmostEqual(expected, value, places=4)
+
+    def test_packed_mpc_iteration(self):
+        mpc = ProjectedGradientMPC([[1.0, 0.1], [0.0, 1.0]], [[0.005], [0.1]], np.eye(2), [[0.1]],
+                                   horizon=3, u_min=-1.0, u_max=1.0, iterations=1)
+        controller = PackedMPC(self.scheme, mpc, self.public_key, self.private_key, projection="client")
+        for x in ([1.0, 0.0], [-0.2, 0.3]):
+            u, _ = controller.step(x)
+            np.testing.assert_allclose(u, mpc.control(x), atol=1e-4)
+
+    def test_chebyshev_mpc_iteration(self):
+        scheme = CKKSScheme()
+        degree = 13
+        # One level for G x, then the Chebyshev projection.
+        public_key, private_key = scheme.generate_keys(
+            mult_depth=1 + chebyshev_depth(degree), scale_mod_size=50, batch_size=8)
+        mpc = ProjectedGradientMPC([[1.0, 0.1], [0.0, 1.0]], [[0.005], [0.1]], np.eye(2), [[0.1]],
+                                   horizon=3, u_min=-1.0, u_max=1.0, iterations=1)
+        controller = PackedMPC(scheme, mpc, public_key, private_key, projection="chebyshev", degree=degree)
+        for x in ([1.0, 0.0], [-0.2, 0.3]):
+            u, _ = controller.step(x)
+            # Approximation error of the degree-13 clip on [-4, 4].
+            np.testing.assert_allclose(u, mpc.control(x), atol=2e-2)
+
+    def test_plan_constants_in_every_slot(self):
+        from he_toolkit.expression import compile_plan, constant, variable
+        values = [1.0, 2.0, -3.0, 0.5, 0.0, 1.5, -1.0, 4.0]
+        x = variable("x")
+        plan = compile_plan([x + constant(2.5), x * constant(0.5) + constant(1.0)])
+        shifted, affine = plan.run(self.scheme, {"x": self.scheme.encrypt(values, self.public_key)},
+                                   self.public_key)
+        for i, value in enumerate(values):
+            self.assertAlmostEqual(value + 2.5, self.scheme.decrypt(shifted, self.private_key)[i], places=3)
+            self.assertAlmostEqual(value * 0.5 + 1.0, self.scheme.decrypt(affine, self.private_key)[i], places=3)
+
+class TestCKKSBootstrapping(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.scheme = CKKSScheme()
+        cls.public_key, cls.private_key = cls.scheme.generate_keys(
+            mult_depth=2, scale_mod_size=59, batch_size=8, bootstrap=True, level_budget=(2, 2))
+
+    def test_refresh_restores_levels(self):
+        c = self.scheme.encrypt([0.5, -0.25], self.public_key)
+        # Use up the levels, bypassing the automatic refresh of multiply_scalar.
+        while self.scheme.levels_remaining(c) > 1:
+            c = self.scheme.crypto_context.EvalMult(c, 1.0)
+        refreshed = self.scheme.refresh(c)
+        self.assertGreater(self.scheme.levels_remaining(refreshed), self.scheme.levels_remaining(c))
+        decrypted = self.scheme.decrypt(refreshed, self.private_key)
+        self.assertAlmostEqual(0.5, decrypted[0], places=2)
+        self.assertAlmostEqual(-0.25, decrypted[1], places=2)
+
+    def test_levels_remaining_after_multiply(self):
+        c = self.scheme.encrypt([0.5], self.public_key)
+        self.assertEqual(self.scheme.depth, self.scheme.levels_remaining(c))
+        c = self.scheme.crypto_context.EvalMult(c, c)
+        self.assertEqual(self.scheme.depth - 1, self.scheme.levels_remaining(c))
+
+    def test_unbounded_scalar_chain(self):
+        # Far more multiplications than mult_depth: the scheme bootstraps on its own.
+        c = self.scheme.encrypt([1.0], self.public_key)
+        for _ in range(8):
+            c = self.scheme.multiply_scalar(c, 0.9)
+        self.assertGreater(self.scheme.bootstrap_count, 0)
+        self.assertAlmostEqual(0.9 ** 8, self.scheme.decrypt(c, self.private_key)[0], places=2)
+
+    def test_packed_matvec_bootstraps_once(self):
+        from he_toolkit.simulators.mpc import diagonals, packed_matvec
+        M = np.array([[1.0, 2.0], [-0.5, 0.25]])
+        self.scheme.generate_rotation_keys(range(1, 8))
+        c = self.scheme.encrypt([0.5, -0.25], self.public_key)
+        while self.scheme.levels_remaining(c) > self.scheme.min_levels - 1:
+            c = self.scheme.crypto_context.EvalMult(c, 1.0)
+        before = self.scheme.bootstrap_count
+        result = packed_matvec(self.scheme, diagonals(M, 8), c)
+        # One refresh before the rotations, none for the individual products.
+        self.assertEqual(before + 1, self.scheme.bootstrap_count)
+        decrypted = self.scheme.decrypt(result, self.private_key)
+        for expected, value in zip(M @ np.array([0.5, -0.25]), decrypted):
+            self.assertAlmostEqual(expected, value, places=2)
+
+    def test_refresh_requires_bootstrapping(self):
+        scheme = CKKSScheme()
+        public_key, _ = scheme.generate_keys(mult_depth=2, scale_mod_size=40, batch_size=8)
+        with self.assertRaises(RuntimeError):
+            scheme.refresh(scheme.encrypt([1.0], public_key))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from he_toolkit.schemes.partial.damgard_jurik import DamgardJurikScheme
+
+class TestDamgardJurikScheme(unittest.TestCase):
+    def setUp(self):
+        self.schemes = {}
+        for s in (1, 2, 3):
+            scheme = DamgardJurikScheme(s=s)
+            # Use small key size for faster testing
+            self.schemes[s] = (scheme,) + scheme.generate_keys(key_size=256)
+
+    def test_encrypt_decrypt(self):
+        for s, (scheme, public_key, private_key) in self.schemes.items():
+            for plaintext in (0.0, 1.0, 42.0, -17.0, 2.0 ** 52):
+                ciphertext = scheme.encrypt(plaintext, public_key)
+                self.assertEqual(plaintext, scheme.decrypt(ciphertext, private_key), f"s={s}")
+
+    def test_non_integral_values_rejected(self):
+        scheme, public_key, private_key = self.schemes[1]
+        with self.assertRaises(ValueError):
+            scheme.encrypt(3.9, public_key)
+        ciphertext = scheme.encrypt(4.0, public_key)
+        with self.assertRaises(ValueError):
+            scheme.multiply_scalar(ciphertext, 0.5)
+        self.assertEqual(12, scheme.decrypt(scheme.multiply_scalar(ciphertext, 3.0), private_key))
+
+    def test_plaintext_space_grows_with_s(self):
+        # A value larger than n wraps around for s=1 but fits in Z_{n^3}.
+        for s, fits in ((1, False), (3, True)):
+            scheme, public_key, private_key = self.schemes[s]
+            n, _ = public_key
+            plaintext = float(int(n) * 1000)
+            decrypted = scheme.decrypt(scheme.encrypt(plaintext, public_key), private_key)
+            self.assertEqual(fits, decrypted == plaintext, f"s={s}")
+
+    def test_decrypt_int_is_exact(self):
+        scheme, public_key, private_key = self.schemes[2]
+        n, _ = public_key
+        plaintext = -(int(n) ** 2 // 3)
+        self.assertEqual(plaintext, scheme.decrypt_int(scheme.encrypt(plaintext, public_key), private_key))
+
+    def test_homomorphic_addition(self):
+        for s, (scheme, public_key, private_key) in self.schemes.items():
+            c1 = scheme.encrypt(10, public_key)
+            c2 = scheme.encrypt(-25, public_key)
+            c_sum = scheme.add(c1, c2)
+            self.assertEqual(-15.0, scheme.decrypt(c_sum, private_key), f"s={s}")
+
+    def test_scalar_multiplication(self):
+        for s, (scheme, public_key, private_key) in self.schemes.items():
+            c = scheme.encrypt(7, public_key)
+            self.assertEqual(21.0, scheme.decrypt(scheme.multiply_scalar(c, 3), private_key))
+            self.assertEqual(-14.0, scheme.decrypt(scheme.multiply_scalar(c, -2), private_key))
+
+    def test_expansion_ratio(self):
+        self.assertEqual(DamgardJurikScheme(s=1).expansion_ratio, 2.0)
+        self.assertEqual(DamgardJurikScheme(s=2).expansion_ratio, 1.5)
+
+    def test_mismatched_keys(self):
+        scheme, public_key, _ = self.schemes[1]
+        other_scheme, other_public_key, _ = self.schemes[2]
+        with self.assertRaises(ValueError):
+            scheme.add(scheme.encrypt(1, public_key), other_scheme.encrypt(1, other_public_key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from he_toolkit.schemes.partial.ec_elgamal import (
+    ECElGamalScheme, G, N, MAX_EMBEDDED, generator_table, scalar_mult, to_affine, point_negate,
+    point_to_bytes, point_from_bytes,
+)
+
+class TestCurveArithmetic(unittest.TestCase):
+    def test_fixed_base_matches_variable_base(self):
+        for k in (1, 2, 15, 16, 12345, 2 ** 200 + 7, N - 1):
+            self.assertEqual(to_affine(scalar_mult(k, G)), to_affine(generator_table().mult(k)))
+
+    def test_group_order(self):
+        self.assertIsNone(to_affine(generator_table().mult(N)))
+        self.assertEqual(point_negate(G), to_affine(scalar_mult(N - 1, G)))
+
+    def test_point_compression(self):
+        point = to_affine(generator_table().mult(987654321))
+        self.assertEqual(33, len(point_to_bytes(point)))
+        self.assertEqual(point, point_from_bytes(point_to_bytes(point)))
+
+class TestECElGamalScheme(unittest.TestCase):
+    def setUp(self):
+        self.scheme = ECElGamalScheme(max_message=5000)
+        self.public_key, self.private_key = self.scheme.generate_keys()
+
+    def test_encrypt_decrypt(self):
+        for plaintext in (0.0, 1.0, -1.0, 4999.0, -5000.0, 1234.0):
+            ciphertext = self.scheme.encrypt(plaintext, self.public_key)
+            decrypted = self.scheme.decrypt(ciphertext, self.private_key)
+            self.assertIsInstance(decrypted, float)
+            self.assertEqual(plaintext, decrypted)
+            self.assertEqual(int(plaintext), self.scheme.decrypt_int(ciphertext, self.private_key))
+
+    def test_non_integral_values_rejected(self):
+        with self.assertRaises(ValueError):
+            self.scheme.encrypt(3.9, self.public_key)
+        ciphertext = self.scheme.encrypt(4.0, self.public_key)
+        with self.assertRaises(ValueError):
+            self.scheme.multiply_scalar(ciphertext, 0.5)
+
+    def test_out_of_range(self):
+        ciphertext = self.scheme.encrypt(5001, self.public_key)
+        with self.assertRaises(ValueError):
+            self.scheme.decrypt(ciphertext, self.private_key)
+
+    def test_homomorphic_addition(self):
+        c1 = self.scheme.encrypt(120, self.public_key)
+        c2 = self.scheme.encrypt(-450, self.public_key)
+        c_sum = self.scheme.add(c1, c2)
+        self.assertEqual(-330.0, self.scheme.decrypt(c_sum, self.private_key))
+
+    def test_scalar_multiplication(self):
+        c = self.scheme.encrypt(25, self.public_key)
+        self.assertEqual(100.0, self.scheme.decrypt(self.scheme.multiply_scalar(c, 4), self.private_key))
+        self.assertEqual(-75.0, self.scheme.decrypt(self.scheme.multiply_scalar(c, -3), self.private_key))
+
+    def test_multiplication_fails(self):
+        c1 = self.scheme.encrypt(2, self.public_key)
+        c2 = self.scheme.encrypt(3, self.public_key)
+        with self.assertRaises(NotImplementedError):
+            self.scheme.multiply(c1, c2)
+
+    def test_ciphertext_size(self):
+        ciphertext = self.scheme.encrypt(42, self.public_key)
+        self.assertEqual(66, len(ECElGamalScheme.ciphertext_bytes(ciphertext)))
+
+    def test_embedded_encoding(self):
+        scheme = ECElGamalScheme(encoding="embedded")
+        for plaintext in (0, 42, 2 ** 100 + 1, MAX_EMBEDDED):
+            ciphertext = scheme.encrypt(plaintext, self.public_key)
+            self.assertEqual(float(plaintext), scheme.decrypt(ciphertext, self.private_key))
+            # Exact: 2^100 + 1 and MAX_EMBEDDED are not representable as floats.
+            decrypted = scheme.decrypt_int(ciphertext, self.private_key)
+            self.assertIsInstance(decrypted, int)
+            self.assertEqual(plaintext, decrypted)
+        with self.assertRaises(ValueError):
+            scheme.encrypt(-1, self.public_key)
+        with self.assertRaises(NotImplementedError):
+            scheme.add(ciphertext, ciphertext)
+
+    def test_table_is_persisted(self):
+        with tempfile.TemporaryDirectory() as table_dir:
+            writer = ECElGamalScheme(max_message=5000, table_dir=table_dir)
+            ciphertext = writer.encrypt(-777, self.public_key)
+            self.assertEqual(-777.0, writer.decrypt(ciphertext, self.private_key))
+            self.assertTrue(os.path.exists(writer.table_path()))
+
+            # The table does not depend on the key, so another key pair reuses it.
+            reader = ECElGamalScheme(max_message=5000, table_dir=table_dir)
+            public_key, private_key = reader.generate_keys()
+            self.assertEqual(777.0, reader.decrypt(reader.encrypt(777, public_key), private_key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,24 @@ class TestElGamalScheme(unittest.TestCase):
         decrypted = self.scheme.decrypt(ciphertext, self.private_key)
         self.assertEqual(plaintext, decrypted)
 
+    def test_encrypt_batch(self):
+        plaintexts = [2, 3, 5, 7]
+        ciphertexts = self.scheme.encrypt_batch(plaintexts, self.public_key)
+        self.assertEqual(plaintexts, [self.scheme.decrypt(c, self.private_key) for c in ciphertexts])
+        # Fresh nonce for every ciphertext
+        self.assertEqual(len(plaintexts), len({c['c1'] for c in ciphertexts}))
+
+    def test_non_integral_plaintext_rejected(self):
+        # Previously truncated: Enc(3.9) decrypted to 3.
+        with self.assertRaises(ValueError):
+            self.scheme.encrypt(3.9, self.public_key)
+        with self.assertRaises(ValueError):
+            self.scheme.encrypt_batch([2, 2.5], self.public_key)
+        self.assertEqual(3.0, self.scheme.decrypt(self.scheme.encrypt(3.0, self.public_key), self.private_key))
+
+    def test_keys_differ_between_calls(self):
+        self.assertNotEqual(self.public_key, self.scheme.generate_keys(key_size=128)[0])
+
     def test_homomorphic_multiplication(self):
         m1 = 10.0
         m2 = 20.0
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from he_toolkit.schemes.partial.exp_elgamal import ExponentialElGamalScheme
+
+class TestExponentialElGamalScheme(unittest.TestCase):
+    def setUp(self):
+        self.scheme = ExponentialElGamalScheme(max_message=5000)
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=128)
+
+    def test_encrypt_decrypt(self):
+        for plaintext in (0.0, 1.0, -1.0, 4999.0, -5000.0, 1234.0):
+            ciphertext = self.scheme.encrypt(plaintext, self.public_key)
+            self.assertEqual(plaintext, self.scheme.decrypt(ciphertext, self.private_key))
+
+    def test_encrypt_batch(self):
+        ciphertexts = self.scheme.encrypt_batch([-4, 0, 9], self.public_key)
+        self.assertEqual([-4, 0, 9], [self.scheme.decrypt(c, self.private_key) for c in ciphertexts])
+
+    def test_non_integral_values_rejected(self):
+        with self.assertRaises(ValueError):
+            self.scheme.encrypt(3.9, self.public_key)
+        ciphertext = self.scheme.encrypt(4.0, self.public_key)
+        with self.assertRaises(ValueError):
+            self.scheme.multiply_scalar(ciphertext, 0.5)
+
+    def test_out_of_range(self):
+        ciphertext = self.scheme.encrypt(5001, self.public_key)
+        with self.assertRaises(ValueError):
+            self.scheme.decrypt(ciphertext, self.private_key)
+
+    def test_homomorphic_addition(self):
+        c1 = self.scheme.encrypt(120, self.public_key)
+        c2 = self.scheme.encrypt(-450, self.public_key)
+        c_sum = self.scheme.add(c1, c2)
+        self.assertEqual(-330.0, self.scheme.decrypt(c_sum, self.private_key))
+
+    def test_scalar_multiplication(self):
+        c = self.scheme.encrypt(25, self.public_key)
+        self.assertEqual(100.0, self.scheme.decrypt(self.scheme.multiply_scalar(c, 4), self.private_key))
+        self.assertEqual(-75.0, self.scheme.decrypt(self.scheme.multiply_scalar(c, -3), self.private_key))
+
+    def test_multiplication_fails(self):
+        c1 = self.scheme.encrypt(2, self.public_key)
+        c2 = self.scheme.encrypt(3, self.public_key)
+        with self.assertRaises(NotImplementedError):
+            self.scheme.multiply(c1, c2)
+
+    def test_small_table_uses_more_giant_steps(self):
+        scheme = ExponentialElGamalScheme(max_message=5000, table_size=16)
+        ciphertext = scheme.encrypt(-4321, self.public_key)
+        self.assertEqual(-4321.0, scheme.decrypt(ciphertext, self.private_key))
+
+    def test_table_is_persisted_and_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as table_dir:
+            writer = ExponentialElGamalScheme(max_message=5000, table_dir=table_dir)
+            ciphertext = writer.encrypt(777, self.public_key)
+            self.assertEqual(777.0, writer.decrypt(ciphertext, self.private_key))
+
+            p, _, g = self.private_key
+            path = writer.table_path(p, g)
+            self.assertTrue(os.path.exists(path))
+
+            # A fresh instance (e.g. another process) maps the saved table instead of rebuilding it.
+            reader = ExponentialElGamalScheme(max_message=5000, table_dir=table_dir)
+            reader.build_table = None
+            self.assertEqual(777.0, reader.decrypt(ciphertext, self.private_key))
+            self.assertIsInstance(reader.load_table(p, g).entries, np.memmap)
+
+if __name__ == '__main__':
+    unittest.main()
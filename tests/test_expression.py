@@ -0,0 +1,141 @@
+import unittest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from he_toolkit.expression import variable, constant, compile_plan, matvec
+from he_toolkit.schemes.partial.elgamal import ElGamalScheme
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+from he_toolkit.schemes.partial.rsa_homomorphic import RSAScheme
+
+class TestExpressionPlan(unittest.TestCase):
+    def setUp(self):
+        self.scheme = PaillierScheme()
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=512)
+        self.x = [variable("x0"), variable("x1")]
+        self.inputs = {"x0": self.scheme.encrypt(0.7, self.public_key),
+                       "x1": self.scheme.encrypt(-0.2, self.public_key)}
+
+    def _run(self, outputs, **kwargs):
+        plan = compile_plan(outputs)
+        results = plan.run(self.scheme, self.inputs, self.public_key, **kwargs)
+        return plan, [self.scheme.decrypt(c, self.private_key) for c in results]
+
+    def test_state_feedback(self):
+        [u] = matvec([[-1.0, -1.5]], self.x)
+        plan, [value] = self._run([u])
+        self.assertAlmostEqual(-1.0 * 0.7 - 1.5 * -0.2, value, places=6)
+        self.assertEqual(2, plan.stats["scalar_multiplications"])
+        self.assertEqual(1, plan.stats["additions"])
+
+    def test_constant_folding_and_scalar_fusion(self):
+        x0, x1 = self.x
+        expr = 2 * (3 * x0) + x0 + (constant(4) * 0.5 - 2) + 0 * x1 - x1 * 1
+        plan, [value] = self._run([expr])
+        self.assertAlmostEqual(7 * 0.7 + 0.2, value, places=6)
+        # 7 * x0 and -1 * x1, one addition; the constants cancel out.
+        stats = plan.stats
+        self.assertEqual((2, 1, 0), (stats["scalar_multiplications"], stats["additions"], stats["constants"]))
+
+    def test_constants_are_encrypted(self):
+        plan, [value] = self._run([self.x[0] + 1.5])
+        self.assertAlmostEqual(2.2, value, places=6)
+        with self.assertRaises(ValueError):
+            plan.run(self.scheme, self.inputs)
+
+    def test_distinct_constant_outputs(self):
+        plan, values = self._run([1.0, 2.0, 3.0, constant(4.0), 2.0])
+        self.assertEqual([1.0, 2.0, 3.0, 4.0, 2.0], values)
+        self.assertEqual([0, 1, 2, 3, 1], plan.outputs)
+        self.assertEqual(4, plan.stats["constants"])
+
+    def test_common_subexpressions(self):
+        x0, x1 = self.x
+        plan, values = self._run([2 * x0 + 3 * x1, 3 * x1 + 2 * x0, (3 * x1 + 2 * x0) * 2])
+        self.assertAlmostEqual(0.8, values[0], places=6)
+        self.assertAlmostEqual(0.8, values[1], places=6)
+        self.assertAlmostEqual(1.6, values[2], places=6)
+        self.assertEqual(plan.outputs[0], plan.outputs[1])
+
+    def test_parallel_execution(self):
+        rows = [[0.1 * (i + j) for j in range(2)] for i in range(6)]
+        expected = [0.7 * row[0] - 0.2 * row[1] for row in rows]
+        _, sequential = self._run(matvec(rows, self.x))
+        _, threaded = self._run(matvec(rows, self.x), workers=4)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            _, pooled = self._run(matvec(rows, self.x), executor=executor)
+        for values in (sequential, threaded, pooled):
+            for e, v in zip(expected, values):
+                self.assertAlmostEqual(e, v, places=6)
+
+    def test_missing_input(self):
+        plan = compile_plan([variable("y") + self.x[0]])
+        with self.assertRaises(ValueError):
+            plan.run(self.scheme, self.inputs, self.public_key)
+
+class _SlotScheme:
+    """
+    Plaintext stand-in for a packed scheme: "ciphertexts" are arrays of batch_size slots.
+    """
+    batch_size = 4
+
+    def encrypt(self, values, public_key):
+        padded = np.zeros(self.batch_size)
+        padded[:len(values)] = values
+        return padded
+
+    def decrypt(self, ciphertext, private_key):
+        return list(ciphertext)
+
+    def add(self, ciphertext1, ciphertext2):
+        return ciphertext1 + ciphertext2
+
+    def multiply(self, ciphertext1, ciphertext2):
+        return ciphertext1 * ciphertext2
+
+    def multiply_scalar(self, ciphertext, scalar):
+        return ciphertext * scalar
+
+
+class TestPackedPlan(unittest.TestCase):
+    def test_constants_fill_every_slot(self):
+        scheme = _SlotScheme()
+        x = variable("x")
+        values = [1.0, 2.0, -3.0, 0.5]
+        plan = compile_plan([x + constant(2.5), x * variable("y") + constant(1.0)])
+        inputs = {"x": scheme.encrypt(values, None), "y": scheme.encrypt([2.0] * 4, None)}
+        shifted, affine = plan.run(scheme, inputs, public_key=object())
+        np.testing.assert_allclose(np.array(values) + 2.5, shifted)
+        np.testing.assert_allclose(np.array(values) * 2.0 + 1.0, affine)
+
+
+class TestMultiplicativePlan(unittest.TestCase):
+    def test_product_tree_minimizes_depth(self):
+        scheme = ElGamalScheme()
+        # Use small key size for faster testing
+        public_key, private_key = scheme.generate_keys(key_size=128)
+        names = "abcdefgh"
+        factors = [variable(name) for name in names]
+        chain = factors[0]
+        for factor in factors[1:]:
+            chain = chain * factor
+        plan = compile_plan([chain])
+        self.assertEqual(3, plan.depth)
+        self.assertEqual(7, plan.stats["multiplications"])
+
+        inputs = {name: scheme.encrypt(i + 2, public_key) for i, name in enumerate(names)}
+        [result] = plan.run(scheme, inputs)
+        self.assertEqual(float(2 * 3 * 4 * 5 * 6 * 7 * 8 * 9), scheme.decrypt(result, private_key))
+
+    def test_batched_products(self):
+        scheme = RSAScheme()
+        # Use small key size for faster testing
+        public_key, private_key = scheme.generate_keys(key_size=256)
+        a, b, c, d = (variable(name) for name in "abcd")
+        plan = compile_plan([a * b, c * d, b * a])
+        self.assertEqual(2, plan.stats["multiplications"])
+        inputs = {name: scheme.encrypt(v, public_key) for name, v in zip("abcd", (2, 3, -5, 7))}
+        results = plan.run(scheme, inputs)
+        self.assertEqual([6.0, -35.0, 6.0], scheme.decrypt_batch(results, private_key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from benchmarks.utils.memory import CIPHERTEXT, KEY_MATERIAL, MemoryProfiler
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = MemoryProfiler(top_n=0)
+
+    def test_track_records_block(self):
+        with self.profiler.track("encrypt", CIPHERTEXT) as record:
+            # Keep ~8 MB alive until the block exits.
+            working_set = [bytearray(1024) for _ in range(8192)]
+        del working_set
+        self.assertEqual([record], self.profiler.records)
+        self.assertEqual("encrypt", record.label)
+        self.assertEqual(CIPHERTEXT, record.category)
+        self.assertGreater(record.traced_retained_kb, 7000)
+        self.assertGreaterEqual(record.traced_peak_kb, record.traced_retained_kb)
+        self.assertGreaterEqual(record.peak_rss_kb, record.rss_after_kb)
+        self.assertGreaterEqual(record.transient_rss_kb, 0)
+        self.assertEqual(record.rss_after_kb - record.rss_before_kb, record.retained_rss_kb)
+
+    def test_freed_temporaries_are_not_retained(self):
+        with self.profiler.track("decrypt", CIPHERTEXT) as record:
+            temporary = [bytearray(1024) for _ in range(4096)]
+            del temporary
+        self.assertLess(record.traced_retained_kb, 100)
+        self.assertGreater(record.traced_peak_kb, 3000)
+
+    def test_by_category(self):
+        with self.profiler.track("generate_keys", KEY_MATERIAL):
+            keys = bytearray(2 * 1024 * 1024)
+        with self.profiler.track("encrypt", CIPHERTEXT):
+            first = bytearray(1024 * 1024)
+        with self.profiler.track("add", CIPHERTEXT):
+            second = bytearray(1024 * 1024)
+        summary = self.profiler.by_category()
+        self.assertEqual({KEY_MATERIAL, CIPHERTEXT}, set(summary))
+        key_record, encrypt_record, add_record = self.profiler.records
+        self.assertAlmostEqual(key_record.traced_retained_kb, summary[KEY_MATERIAL]["traced_retained_kb"])
+        self.assertAlmostEqual(encrypt_record.traced_retained_kb + add_record.traced_retained_kb,
+                               summary[CIPHERTEXT]["traced_retained_kb"])
+        self.assertGreater(summary[CIPHERTEXT]["traced_retained_kb"], 2000)
+        self.assertEqual(max(encrypt_record.peak_rss_kb, add_record.peak_rss_kb),
+                         summary[CIPHERTEXT]["peak_rss_kb"])
+        del keys, first, second
+
+    def test_top_allocations(self):
+        profiler = MemoryProfiler(top_n=2)
+        with profiler.track("encrypt") as record:
+            working_set = [bytearray(1024) for _ in range(1024)]
+        del working_set
+        self.assertLessEqual(len(record.top_allocations), 2)
+        self.assertTrue(any("test_memory.py" in line for line in record.top_allocations))
+
+if __name__ == '__main__':
+    unittest.main()
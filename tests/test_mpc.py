@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+from he_toolkit.simulators.dynamic_system import DynamicSystem
+from he_toolkit.simulators.mpc import (ClientAssistedMPC, PackedMPC, ProjectedGradientMPC,
+                                       condensed_qp, diagonals)
+
+A = [[1.0, 0.1], [0.0, 1.0]]
+B = [[0.005], [0.1]]
+Q = np.eye(2)
+R = [[0.1]]
+
+
+class TestProjectedGradientMPC(unittest.TestCase):
+    def setUp(self):
+        self.mpc = ProjectedGradientMPC(A, B, Q, R, horizon=5, u_min=-1.0, u_max=1.0, iterations=50)
+
+    def test_condensed_qp_matches_rollout(self):
+        H, F = condensed_qp(A, B, Q, R, horizon=3)
+        x0 = np.array([1.0, -0.5])
+        U = np.array([0.3, -0.2, 0.1])
+        plant = DynamicSystem(A, B, x0=x0)
+        cost = 0.0
+        for u in U:
+            plant.step([u])
+            cost += plant.x @ Q @ plant.x + 0.1 * u ** 2
+        # Cost = 1/2 U'HU + x0'F'U + (terms independent of U)
+        constant = sum(x @ Q @ x for x in (np.linalg.matrix_power(np.array(A), k) @ x0 for k in (1, 2, 3)))
+        self.assertAlmostEqual(cost, 0.5 * U @ H @ U + x0 @ F.T @ U + constant, places=9)
+
+    def test_respects_input_bounds(self):
+        U = self.mpc.solve([5.0, 0.0])
+        self.assertTrue(np.all(U <= 1.0) and np.all(U >= -1.0))
+        self.assertAlmostEqual(-1.0, U[0])
+
+    def test_unconstrained_solution(self):
+        x = np.array([0.05, 0.0])
+        mpc = ProjectedGradientMPC(A, B, Q, R, horizon=5, u_min=-10.0, u_max=10.0, iterations=5000)
+        np.testing.assert_allclose(mpc.solve(x), -np.linalg.solve(mpc.H, mpc.F @ x), atol=1e-6)
+
+    def test_closed_loop_converges(self):
+        plant = DynamicSystem(A, B, x0=[1.0, 0.0])
+        for _ in range(200):
+            plant.step(self.mpc.control(plant.x))
+        self.assertLess(np.linalg.norm(plant.x), 1e-2)
+
+    def test_diagonals(self):
+        M = np.arange(9.0).reshape(3, 3)
+        v = np.array([1.0, -2.0, 0.5, 0.0])
+        result = sum(d * np.roll(v, -k) for k, d in enumerate(diagonals(M, 4)))
+        np.testing.assert_allclose(result[:3], M @ v[:3])
+
+    def test_required_slots(self):
+        self.assertEqual(8, PackedMPC.required_slots(self.mpc, 2))
+
+
+class TestClientAssistedMPC(unittest.TestCase):
+    def setUp(self):
+        self.scheme = PaillierScheme()
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=512)
+        self.mpc = ProjectedGradientMPC(A, B, Q, R, horizon=3, u_min=-1.0, u_max=1.0, iterations=4)
+
+    def test_matches_plaintext(self):
+        controller = ClientAssistedMPC(self.scheme, self.mpc, self.public_key, self.private_key)
+        for x in ([1.0, 0.0], [-0.2, 0.3]):
+            u, timings = controller.step(x)
+            np.testing.assert_allclose(u, self.mpc.control(x), atol=1e-6)
+            self.assertEqual(set(ClientAssistedMPC.PHASES), set(timings))
+            self.assertGreater(timings["server"], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import threading
+import unittest
+import warnings
+from unittest import mock
+from he_toolkit.schemes.openfhe_wrappers import parallelism
+from he_toolkit.schemes.openfhe_wrappers.parallelism import ParallelismConfig, uses_parallelism
+
+
+class _Scheme:
+    def __init__(self, **kwargs):
+        self.parallelism = ParallelismConfig(**kwargs)
+        self.calls = 0
+
+    @uses_parallelism
+    def encrypt(self, value):
+        self.calls += 1
+        return value
+
+
+class TestParallelismConfig(unittest.TestCase):
+    def test_rejects_invalid_thread_count(self):
+        with self.assertRaises(ValueError):
+            ParallelismConfig(num_threads=0)
+
+    def test_decorator_applies_config_to_calling_thread(self):
+        scheme = _Scheme()
+        self.assertEqual(scheme.encrypt(3), 3)
+        self.assertIs(parallelism._applied.config, scheme.parallelism)
+
+        # The configuration is tracked per thread.
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(getattr(parallelism._applied, "config", None)))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [None])
+
+    @unittest.skipUnless(hasattr(os, "sched_getaffinity"), "affinity control not supported")
+    def test_cpu_affinity(self):
+        cpu = min(os.sched_getaffinity(0))
+
+        def call_pinned(result):
+            _Scheme(cpu_affinity=[cpu]).encrypt(1)
+            result.append(os.sched_getaffinity(0))
+
+        # Pin a separate thread so the test runner keeps its own mask.
+        result = []
+        thread = threading.Thread(target=call_pinned, args=(result,))
+        thread.start()
+        thread.join()
+        self.assertEqual(result, [{cpu}])
+
+    @unittest.skipUnless(hasattr(os, "sched_getaffinity"), "affinity control not supported")
+    def test_cpu_affinity_reapplied_after_external_change(self):
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) < 2:
+            self.skipTest("needs at least two CPUs")
+        result = []
+
+        def run():
+            scheme = _Scheme(cpu_affinity=[cpus[0]])
+            scheme.encrypt(1)
+            os.sched_setaffinity(0, {cpus[1]})
+            scheme.encrypt(1)
+            result.append(os.sched_getaffinity(0))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(result, [{cpus[0]}])
+
+    def test_mapped_openmp_paths(self):
+        maps = ("7f00-7f01 r-xp 00000000 08:01 1 /usr/lib/x86_64-linux-gnu/libgomp.so.1.0.0\n"
+                "7f01-7f02 r--p 00001000 08:01 1 /usr/lib/x86_64-linux-gnu/libgomp.so.1.0.0\n"
+                "7f02-7f03 r-xp 00000000 08:01 2 /usr/lib/libOPENFHEcore.so.1\n"
+                "7f03-7f04 rw-p 00000000 00:00 0\n"
+                "7f04-7f05 r-xp 00000000 08:01 3 /opt/llvm/lib/libomp.so\n")
+        self.assertEqual(parallelism._mapped_openmp_paths(maps),
+                         ["/usr/lib/x86_64-linux-gnu/libgomp.so.1.0.0", "/opt/llvm/lib/libomp.so"])
+
+    def test_warns_without_openmp_runtime(self):
+        result = []
+
+        def run():
+            with mock.patch.object(parallelism, "_openmp_library", return_value=None), \
+                    warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                _Scheme(num_threads=2).encrypt(1)
+            result.extend(caught)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(1, len(result))
+        self.assertIn("OpenMP", str(result[0].message))
+
+    def test_num_threads(self):
+        if parallelism.get_max_threads() is None:
+            self.skipTest("no OpenMP runtime available")
+
+        result = []
+
+        def call_with_threads():
+            _Scheme(num_threads=1).encrypt(1)
+            result.append(parallelism.get_max_threads())
+
+        thread = threading.Thread(target=call_with_threads)
+        thread.start()
+        thread.join()
+        self.assertEqual(result, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
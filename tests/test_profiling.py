@@ -0,0 +1,150 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from he_toolkit.profiling import MetricsRegistry, SerializedSizer, instrument, object_size, SAMPLING
+from he_toolkit.schemes.partial.elgamal import ElGamalScheme
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+
+class _SlowScheme:
+    """Pure Python work, so the sampler thread gets the GIL while it runs."""
+
+    def encrypt(self, seconds):
+        deadline = time.perf_counter() + seconds
+        spins = 0
+        while time.perf_counter() < deadline:
+            spins += 1
+        return 0
+
+    def decrypt(self, ciphertext):
+        return ciphertext
+
+class _FakeCiphertext:
+    """Stands in for an OpenFHE ciphertext (only its module name matters)."""
+
+    def __init__(self, level):
+        self.level = level
+
+    def GetLevel(self):
+        return self.level
+
+_FakeCiphertext.__module__ = "openfhe"
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.scheme = instrument(PaillierScheme(), self.registry, name="paillier")
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=512)
+
+    def test_counts_latency_and_bytes(self):
+        ciphertexts = [self.scheme.encrypt(float(i), self.public_key) for i in range(5)]
+        total = ciphertexts[0]
+        for c in ciphertexts[1:]:
+            total = self.scheme.add(total, c)
+        self.assertEqual(10.0, self.scheme.decrypt(total, self.private_key))
+
+        encrypt = self.registry.stats("paillier", "encrypt")
+        self.assertEqual(5, encrypt.calls)
+        self.assertEqual(5, encrypt.latency.count)
+        # A 512-bit Paillier ciphertext lives modulo n^2: up to 128 bytes.
+        self.assertLessEqual(encrypt.bytes_out, 5 * 128)
+        self.assertGreater(encrypt.bytes_out, 5 * 120)
+        self.assertEqual(4, self.registry.stats("paillier", "add").calls)
+
+    def test_errors_are_counted(self):
+        registry = MetricsRegistry()
+        scheme = instrument(ElGamalScheme(), registry)
+        public_key, _ = scheme.generate_keys(key_size=128)
+        c = scheme.encrypt(3, public_key)
+        with self.assertRaises(NotImplementedError):
+            scheme.add(c, c)
+        stats = registry.stats("ElGamalScheme", "add")
+        self.assertEqual((1, 1), (stats.calls, stats.errors))
+
+    def test_disabled_registry_records_nothing(self):
+        self.registry.reset()
+        self.registry.enabled = False
+        self.scheme.encrypt(1.0, self.public_key)
+        self.assertEqual({}, self.registry.operations)
+
+    def test_prometheus_export(self):
+        self.scheme.encrypt(1.0, self.public_key)
+        text = self.registry.to_prometheus()
+        self.assertIn('he_operation_calls_total{scheme="paillier",operation="encrypt"} 1', text)
+        self.assertIn('he_operation_latency_seconds_bucket{scheme="paillier",operation="encrypt",le="+Inf"} 1', text)
+        self.assertIn("# TYPE he_operation_latency_seconds histogram", text)
+
+    def test_json_export(self):
+        self.scheme.encrypt(1.0, self.public_key)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.json")
+            self.registry.write_json(path)
+            with open(path) as f:
+                snapshot = json.load(f)
+        operations = {op["operation"]: op for op in snapshot["operations"]}
+        self.assertEqual(1, operations["encrypt"]["calls"])
+
+    def test_capture(self):
+        self.registry.capture(["decrypt"])
+        self.registry.capture(["encrypt"], mode=SAMPLING, interval=0.0001)
+        for _ in range(3):
+            c = self.scheme.encrypt(2.0, self.public_key)
+            self.scheme.decrypt(c, self.private_key)
+        self.assertIn("decrypt", self.registry.profile_report("paillier", "decrypt"))
+        self.assertEqual("", self.registry.profile_report("paillier", "add"))
+
+    def test_sampling_capture(self):
+        registry = MetricsRegistry()
+        scheme = instrument(_SlowScheme(), registry, name="slow")
+        registry.capture(["encrypt"], mode=SAMPLING, interval=0.0005)
+        self.assertEqual(0, scheme.encrypt(0.05))
+        self.assertGreater(sum(registry.sampler.stacks["slow.encrypt"].values()), 1)
+        collapsed = registry.sampler.collapsed("slow.encrypt")
+        # Collapsed stacks run from the outermost frame to the one being sampled.
+        stack, count = collapsed.splitlines()[0].rsplit(" ", 1)
+        self.assertGreater(int(count), 0)
+        self.assertRegex(stack, r"wrapper \(profiling\.py:\d+\);.*encrypt \(test_profiling\.py:\d+\)")
+        # Operations that are not captured are not sampled.
+        scheme.decrypt(0)
+        self.assertNotIn("slow.decrypt", registry.sampler.stacks)
+
+    def test_object_size(self):
+        self.assertEqual(2, object_size(65535))
+        self.assertEqual(3, object_size({'c1': 255, 'c2': 65535}))
+        self.assertIsNone(object_size(object()))
+
+    def test_object_size_skips_public_modulus(self):
+        scheme = ElGamalScheme()
+        public_key, _ = scheme.generate_keys(key_size=256)
+        ciphertext = scheme.encrypt(3, public_key)
+        self.assertLessEqual(object_size(ciphertext), 2 * 32)
+        self.assertEqual(object_size(ciphertext['c1']) + object_size(ciphertext['c2']), object_size(ciphertext))
+        self.assertEqual(4, object_size({'c': 2 ** 31, 'modulus': 2 ** 2048}))
+        self.assertEqual(4, object_size({'c': 2 ** 31, 'n': 2 ** 2048}))
+
+    def test_serialized_sizer_caches_per_shape(self):
+        serialized = []
+
+        def serialize(value):
+            serialized.append(value)
+            return 1000 * (value.level + 1)
+
+        sizer = SerializedSizer(serialize)
+        self.assertIsNone(object_size(_FakeCiphertext(0)))
+        self.assertEqual(1000, sizer(_FakeCiphertext(0)))
+        self.assertEqual(1000, sizer(_FakeCiphertext(0)))
+        self.assertEqual(2000, sizer(_FakeCiphertext(1)))
+        self.assertEqual(3000, sizer((_FakeCiphertext(0), _FakeCiphertext(1))))
+        self.assertEqual(2, len(serialized))
+        self.assertEqual(2, sizer(65535))
+
+        registry = MetricsRegistry(sizer=sizer)
+        scheme = instrument(_SlowScheme(), registry, name="slow")
+        scheme.decrypt(_FakeCiphertext(0))
+        self.assertEqual(1000, registry.stats("slow", "decrypt").bytes_in)
+        self.assertEqual(2, len(serialized))
+
+if __name__ == '__main__':
+    unittest.main()
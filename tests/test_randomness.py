@@ -0,0 +1,62 @@
+import os
+import threading
+import unittest
+import gmpy2
+from he_toolkit.schemes.partial import randomness
+
+
+class TestRandomness(unittest.TestCase):
+    def test_ranges(self):
+        for _ in range(200):
+            self.assertTrue(0 <= randomness.random_below(10) < 10)
+            self.assertTrue(5 <= randomness.random_range(5, 7) < 7)
+            self.assertTrue(0 <= randomness.random_bits(13) < 2 ** 13)
+        values = randomness.random_range_many(1, 2 ** 255, 100)
+        self.assertEqual(100, len(set(values)))
+        self.assertTrue(all(1 <= v < 2 ** 255 for v in values))
+
+    def test_all_values_reachable(self):
+        self.assertEqual(set(range(6)), {int(randomness.random_below(6)) for _ in range(500)})
+
+    def test_random_unit_and_prime(self):
+        n = 3 * 5 * 7 * 11
+        self.assertEqual(1, gmpy2.gcd(randomness.random_unit(n), n))
+        p = randomness.random_prime(64)
+        self.assertTrue(gmpy2.is_prime(p))
+        self.assertEqual(64, p.bit_length())
+
+    def test_large_requests_bypass_buffer(self):
+        self.assertEqual(3 * randomness.BUFFER_SIZE, len(randomness.random_bytes(3 * randomness.BUFFER_SIZE)))
+
+    def test_threads_do_not_share_bytes(self):
+        results = []
+
+        def draw():
+            results.append(randomness.random_bytes(32))
+        threads = [threading.Thread(target=draw) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(4, len(set(results)))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_fork_discards_buffer(self):
+        # Fill the buffer in the parent, then compare the next bytes in parent and child.
+        randomness.random_bytes(1)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, randomness.random_bytes(32))
+            os._exit(0)
+        os.close(write_fd)
+        child = os.read(read_fd, 32)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        self.assertEqual(32, len(child))
+        self.assertNotEqual(randomness.random_bytes(32), child)
+
+
+if __name__ == '__main__':
+    unittest.main()
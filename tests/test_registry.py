@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+import unittest
+from importlib import metadata
+from unittest import mock
+from he_toolkit.schemes import registry
+from he_toolkit.schemes import Capabilities, available_schemes, capabilities, get_scheme, schemes_with
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+
+
+class TestSchemeRegistry(unittest.TestCase):
+    def test_get_scheme(self):
+        self.assertIsInstance(get_scheme("paillier"), PaillierScheme)
+
+    def test_get_scheme_with_params(self):
+        scheme = get_scheme("ec_elgamal", max_message=100)
+        self.assertEqual(100, scheme.max_message)
+
+    def test_unknown_scheme(self):
+        with self.assertRaises(ValueError):
+            get_scheme("does_not_exist")
+
+    def test_capabilities(self):
+        self.assertTrue(capabilities("paillier").additive)
+        self.assertFalse(capabilities("paillier").multiplicative)
+        self.assertTrue(capabilities("ckks").bootstrapping)
+        self.assertIn("ckks", schemes_with(simd=True))
+        self.assertNotIn("paillier", schemes_with(simd=True))
+        with self.assertRaises(ValueError):
+            schemes_with(unknown=True)
+
+    def test_lazy_imports(self):
+        # Listing, querying capabilities and creating a Paillier scheme must not import OpenFHE.
+        code = ("import sys\n"
+                "from he_toolkit.schemes import available_schemes, capabilities, get_scheme\n"
+                "[capabilities(name) for name in available_schemes()]\n"
+                "get_scheme('paillier')\n"
+                "print(any(m == 'openfhe' or m.startswith('he_toolkit.schemes.openfhe_wrappers') "
+                "for m in sys.modules))\n")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)), check=True).stdout
+        self.assertEqual("False", output.strip())
+
+    def test_register(self):
+        registry.register("paillier_alias", "he_toolkit.schemes.partial.paillier:PaillierScheme",
+                          Capabilities(additive=True))
+        try:
+            self.assertIsInstance(get_scheme("paillier_alias"), PaillierScheme)
+            self.assertIn("paillier_alias", available_schemes())
+        finally:
+            del registry._registry["paillier_alias"]
+
+    def test_entry_points(self):
+        entry_point = metadata.EntryPoint("plugin_rsa", "he_toolkit.schemes.partial.rsa_homomorphic:RSAScheme",
+                                          registry.ENTRY_POINT_GROUP)
+        with mock.patch.object(registry.metadata, "entry_points", return_value=[entry_point]), \
+                mock.patch.object(registry, "_entry_points_loaded", False):
+            try:
+                self.assertIn("plugin_rsa", available_schemes())
+                self.assertEqual("RSAScheme", type(get_scheme("plugin_rsa")).__name__)
+                # No CAPABILITIES attribute: nothing is assumed.
+                self.assertEqual(Capabilities(), capabilities("plugin_rsa"))
+            finally:
+                registry._registry.pop("plugin_rsa", None)
+                registry._classes.pop("plugin_rsa", None)
+
+    def test_entry_points_are_loaded(self):
+        entry_point = mock.Mock(value="plugin_package.schemes:Schemes.Nested")
+        entry_point.name = "plugin_nested"
+        entry_point.load.return_value = PaillierScheme
+        with mock.patch.object(registry.metadata, "entry_points", return_value=[entry_point]), \
+                mock.patch.object(registry, "_entry_points_loaded", False):
+            try:
+                self.assertIsInstance(get_scheme("plugin_nested"), PaillierScheme)
+                entry_point.load.assert_called_once_with()
+            finally:
+                registry._registry.pop("plugin_nested", None)
+                registry._classes.pop("plugin_nested", None)
+
+if __name__ == '__main__':
+    unittest.main()
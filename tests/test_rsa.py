@@ -0,0 +1,53 @@
+import unittest
+from he_toolkit.schemes.partial.rsa_homomorphic import RSAScheme
+
+class TestRSAScheme(unittest.TestCase):
+    def setUp(self):
+        self.scheme = RSAScheme()
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=256)
+
+    def test_encrypt_decrypt(self):
+        for plaintext in (0.0, 1.0, 42.0, -17.0, 2.0 ** 52):
+            ciphertext = self.scheme.encrypt(plaintext, self.public_key)
+            self.assertEqual(plaintext, self.scheme.decrypt(ciphertext, self.private_key))
+
+    def test_crt_matches_plain_decryption(self):
+        n, p, q, _, _, _ = self.private_key
+        d = pow(65537, -1, int((p - 1) * (q - 1)))
+        ciphertext = self.scheme.encrypt(123456789, self.public_key)
+        self.assertEqual(123456789, pow(int(ciphertext['c']), d, int(n)))
+
+    def test_homomorphic_multiplication(self):
+        c1 = self.scheme.encrypt(12, self.public_key)
+        c2 = self.scheme.encrypt(-5, self.public_key)
+        c_prod = self.scheme.multiply(c1, c2)
+        self.assertEqual(-60.0, self.scheme.decrypt(c_prod, self.private_key))
+
+    def test_scalar_multiplication(self):
+        c = self.scheme.encrypt(25, self.public_key)
+        self.assertEqual(100.0, self.scheme.decrypt(self.scheme.multiply_scalar(c, 4), self.private_key))
+
+    def test_batches(self):
+        left = [self.scheme.encrypt(v, self.public_key) for v in (1, 2, 3, -4)]
+        right = [self.scheme.encrypt(v, self.public_key) for v in (5, 6, -7, 8)]
+        products = self.scheme.multiply_batch(left, right)
+        self.assertEqual([5.0, 12.0, -21.0, -32.0], self.scheme.decrypt_batch(products, self.private_key))
+        with self.assertRaises(ValueError):
+            self.scheme.multiply_batch(left, right[:2])
+
+    def test_non_integral_values_rejected(self):
+        with self.assertRaises(ValueError):
+            self.scheme.encrypt(3.9, self.public_key)
+        ciphertext = self.scheme.encrypt(4.0, self.public_key)
+        with self.assertRaises(ValueError):
+            self.scheme.multiply_scalar(ciphertext, 0.5)
+
+    def test_addition_fails(self):
+        c1 = self.scheme.encrypt(2, self.public_key)
+        c2 = self.scheme.encrypt(3, self.public_key)
+        with self.assertRaises(NotImplementedError):
+            self.scheme.add(c1, c2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import pickle
+import tempfile
+import unittest
+from he_toolkit.serialization import CiphertextStore, ECElGamalCodec, FixedWidthCodec, codec_for
+from he_toolkit.schemes.partial.damgard_jurik import DamgardJurikScheme
+from he_toolkit.schemes.partial.ec_elgamal import ECElGamalScheme
+from he_toolkit.schemes.partial.elgamal import ElGamalScheme
+from he_toolkit.schemes.partial.exp_elgamal import ExponentialElGamalScheme
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+from he_toolkit.schemes.partial.rsa_homomorphic import RSAScheme
+
+class TestCodecs(unittest.TestCase):
+    def setUp(self):
+        # Use small key sizes for faster testing
+        self.schemes = [
+            (PaillierScheme(), 512),
+            (ExponentialElGamalScheme(max_message=1000), 128),
+            (DamgardJurikScheme(s=2), 256),
+            (RSAScheme(), 256),
+            (ECElGamalScheme(max_message=1000), 256),
+        ]
+
+    def test_round_trip(self):
+        for scheme, key_size in self.schemes:
+            public_key, private_key = scheme.generate_keys(key_size)
+            codec = codec_for(scheme, public_key)
+            ciphertexts = [scheme.encrypt(v, public_key) for v in (0, 7, -3)]
+            encoded = codec.encode_many(ciphertexts)
+            self.assertEqual(3 * codec.record_size, len(encoded))
+            decoded = codec.decode_many(encoded)
+            self.assertEqual([0, 7, -3], [scheme.decrypt(c, private_key) for c in decoded], type(scheme).__name__)
+
+    def test_multiplicative_elgamal(self):
+        scheme = ElGamalScheme()
+        public_key, private_key = scheme.generate_keys(key_size=128)
+        codec = codec_for(scheme, public_key)
+        c = codec.decode(codec.encode(scheme.encrypt(6, public_key)))
+        self.assertEqual(42.0, scheme.decrypt(scheme.multiply(c, scheme.encrypt(7, public_key)), private_key))
+
+    def test_smaller_than_pickle(self):
+        scheme = PaillierScheme()
+        public_key, _ = scheme.generate_keys(key_size=512)
+        codec = codec_for(scheme, public_key)
+        ciphertexts = [scheme.encrypt(1.5, public_key) for _ in range(10)]
+        self.assertLess(len(codec.encode_many(ciphertexts)), len(pickle.dumps(ciphertexts)))
+
+    def test_point_at_infinity(self):
+        codec = ECElGamalCodec()
+        ciphertext = {'c1': None, 'c2': None}
+        self.assertEqual(ciphertext, codec.decode(codec.encode(ciphertext)))
+
+    def test_unsupported_scheme(self):
+        with self.assertRaises(TypeError):
+            codec_for(object(), None)
+
+    def test_codecs_must_implement_encode_and_decode(self):
+        class EncodeOnly(FixedWidthCodec):
+            record_size = 1
+
+            def encode(self, ciphertext):
+                return bytes([ciphertext])
+
+        with self.assertRaises(TypeError):
+            EncodeOnly()
+
+class TestCiphertextStore(unittest.TestCase):
+    def setUp(self):
+        self.scheme = RSAScheme()
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=256)
+        self.codec = codec_for(self.scheme, self.public_key)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "data.hec")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_and_random_access(self):
+        values = list(range(-50, 50))
+        store = CiphertextStore.write(self.path, self.codec, (self.scheme.encrypt(v, self.public_key) for v in values),
+                                      chunk_size=16)
+        self.assertEqual(100, len(store))
+        self.assertEqual(16 + 100 * self.codec.record_size, store.nbytes)
+        self.assertEqual(27.0, self.scheme.decrypt(store[77], self.private_key))
+        self.assertEqual([-40.0, -39.0], self.scheme.decrypt_batch(store[10:12], self.private_key))
+        self.assertEqual(values, [int(self.scheme.decrypt(c, self.private_key)) for c in store])
+
+    def test_in_place_updates(self):
+        store = CiphertextStore.create(self.path, self.codec, 4)
+        store[2] = self.scheme.encrypt(99, self.public_key)
+        store.flush()
+        reopened = CiphertextStore(self.path, self.codec)
+        self.assertEqual(99.0, self.scheme.decrypt(reopened[2], self.private_key))
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a store at all")
+        with self.assertRaises(ValueError):
+            CiphertextStore(self.path, self.codec)
+        other = codec_for(self.scheme, self.scheme.generate_keys(key_size=512)[0])
+        CiphertextStore.create(self.path, self.codec, 1)
+        with self.assertRaises(ValueError):
+            CiphertextStore(self.path, other)
+
+    def test_empty_store(self):
+        store = CiphertextStore.write(self.path, self.codec, [])
+        self.assertEqual(0, len(store))
+        self.assertEqual([], list(store))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+from he_toolkit.simulators.dynamic_system import DynamicSystem
+from he_toolkit.simulators.encrypted_controller import EncryptedStateFeedback, EncryptedDynamicController
+
+A = [[1.0, 0.1], [0.0, 1.0]]
+B = [[0.005], [0.1]]
+K = [[-1.0, -1.5]]
+
+
+class TestEncryptedClosedLoop(unittest.TestCase):
+    def setUp(self):
+        self.scheme = PaillierScheme()
+        # Use small key size for faster testing
+        self.public_key, self.private_key = self.scheme.generate_keys(key_size=512)
+
+    def test_matches_plaintext_controller(self):
+        controller = EncryptedStateFeedback(self.scheme, K, self.public_key, self.private_key)
+        x = np.array([0.7, -0.2])
+        u = controller.step(x)
+        np.testing.assert_allclose(u, np.array(K) @ x, atol=1e-6)
+
+    def test_fixed_point_encoding(self):
+        controller = EncryptedStateFeedback(self.scheme, K, self.public_key, self.private_key, scale=100)
+        x = np.array([0.7, -0.2])
+        u = controller.step(x)
+        np.testing.assert_allclose(u, np.array(K) @ x, atol=1e-2)
+
+    def test_closed_loop_converges(self):
+        controller = EncryptedStateFeedback(self.scheme, K, self.public_key, self.private_key)
+        encrypted_plant = DynamicSystem(A, B, x0=[1.0, 0.0])
+        plain_plant = DynamicSystem(A, B, x0=[1.0, 0.0])
+        for _ in range(60):
+            encrypted_plant.step(controller.step(encrypted_plant.x))
+            plain_plant.step(np.array(K) @ plain_plant.x)
+
+        np.testing.assert_allclose(encrypted_plant.x, plain_plant.x, atol=1e-6)
+        self.assertLess(np.linalg.norm(encrypted_plant.x), 0.1)
+
+    def test_dynamic_controller_matches_plaintext(self):
+        # Observer-based controller: xc estimates the plant state from y = x1 only.
+        C = np.array([[1.0, 0.0]])
+        L = np.array([[0.5], [1.0]])
+        F = np.array(A) + np.array(B) @ np.array(K) - L @ C
+        controller = EncryptedDynamicController(self.scheme, F, L, K, [[0.0]],
+                                                self.public_key, self.private_key)
+        plant = DynamicSystem(A, B, C, x0=[1.0, 0.0])
+        xc = np.zeros(2)
+        for k in range(20):
+            y = plant.output()
+            u = controller.step(y)
+            np.testing.assert_allclose(u, np.array(K) @ xc, atol=1e-6)
+            xc = F @ xc + L @ y
+            # Refresh the encrypted state every few steps, as a client round trip would.
+            if k % 5 == 4:
+                controller.reencrypt_state()
+            plant.step(u)
+
+
+if __name__ == '__main__':
+    unittest.main()
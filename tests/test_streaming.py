@@ -0,0 +1,108 @@
+import unittest
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from he_toolkit.schemes.partial.paillier import PaillierScheme
+from he_toolkit.streaming import EncryptedBatch, decrypt_stream, encrypt_stream, ordered_map, rebatch
+
+
+class _PackedScheme:
+    """Identity 'encryption' with 4 slots, to exercise the SIMD packing path."""
+    batch_size = 4
+
+    def encrypt(self, values, public_key):
+        assert len(values) <= self.batch_size
+        return list(values) + [0] * (self.batch_size - len(values))
+
+    def decrypt(self, ciphertext, private_key):
+        return list(ciphertext)
+
+
+def _chunks(data, sizes):
+    start = 0
+    for size in sizes:
+        yield data[start:start + size]
+        start += size
+
+
+class TestStreaming(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.scheme = PaillierScheme()
+        # Use small key size for faster testing
+        cls.public_key, cls.private_key = cls.scheme.generate_keys(key_size=512)
+
+    def test_rebatch(self):
+        batches = list(rebatch(_chunks(np.arange(10), [3, 0, 5, 2]), 4))
+        self.assertEqual([len(b) for b in batches], [4, 4, 2])
+        np.testing.assert_array_equal(np.concatenate(batches), np.arange(10))
+
+    def test_scalar_round_trip_in_order(self):
+        data = np.linspace(-2.0, 2.0, 23)
+        encrypted = encrypt_stream(self.scheme, self.public_key, _chunks(data, [5, 10, 8]),
+                                   batch_values=4, workers=3)
+        decrypted = np.concatenate(list(decrypt_stream(self.scheme, self.private_key, encrypted, workers=3)))
+        np.testing.assert_allclose(decrypted, data, atol=1e-9)
+
+    def test_packed_batches(self):
+        scheme = _PackedScheme()
+        data = np.arange(11)
+        batches = list(encrypt_stream(scheme, None, _chunks(data, [6, 5]), batch_values=6))
+        # Rounded up to whole ciphertexts: 8 values per batch, last batch padded.
+        self.assertEqual([b.length for b in batches], [8, 3])
+        self.assertEqual([len(b.ciphertexts) for b in batches], [2, 1])
+
+        decrypted = np.concatenate(list(decrypt_stream(scheme, None, batches)))
+        np.testing.assert_array_equal(decrypted, data)
+
+    def test_back_pressure(self):
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield np.array([float(i)])
+
+        stream = encrypt_stream(_PackedScheme(), None, source(), batch_values=4, workers=2, max_pending=2)
+        first = next(stream)
+        self.assertIsInstance(first, EncryptedBatch)
+        # Only the batches in flight have been read from the source.
+        self.assertLessEqual(len(consumed), 3 * 4)
+        stream.close()
+
+    def test_window_follows_executor_size(self):
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = ordered_map(lambda x: x * 2, source(), executor=executor)
+            self.assertEqual(0, next(results))
+            # 2 * 8 items in flight, not 2 * the default workers=1.
+            self.assertEqual(16, len(consumed))
+            self.assertEqual(list(range(2, 200, 2)), list(results))
+
+    def test_unknown_executor_size_needs_max_pending(self):
+        class _InlineExecutor(Executor):
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        with self.assertRaises(ValueError):
+            next(ordered_map(abs, [-1], executor=_InlineExecutor()))
+        self.assertEqual([1, 2], list(ordered_map(abs, [-1, -2], max_pending=2, executor=_InlineExecutor())))
+
+    def test_process_executor(self):
+        data = np.arange(6, dtype=float)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            encrypted = list(encrypt_stream(self.scheme, self.public_key, [data], batch_values=2,
+                                            executor=executor))
+        decrypted = np.concatenate(list(decrypt_stream(self.scheme, self.private_key, encrypted)))
+        np.testing.assert_allclose(decrypted, data, atol=1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()